@@ -0,0 +1,425 @@
+"""End-to-end benchmark of the handlers, run in process against local stand-ins.
+
+DynamoDB and S3 come from moto, Bedrock is a stub with a configurable
+per-call latency, and the RSS feed is served by a local HTTP server that
+generates synthetic feeds of any size. Each scenario invokes a real
+`lambda_handler` repeatedly and reports p50/p95/p99 latency, the number of
+DynamoDB requests per invocation and the peak Python heap (tracemalloc, from
+one extra invocation so it doesn't skew the timings). Some scenarios also
+check each response (the digest ones: an unchanged ingest rebuilds nothing,
+/digest answers with ETag/Cache-Control and revalidates to a 304); a failed
+check fails the run.
+
+Results are compared with bench/baselines.json: request counts must not grow
+at all, median latency may grow by --tolerance and peak memory by
+--memory-tolerance (timings depend on the
+machine and moto itself is slow and noisy, so the default tolerance is wide and
+baselines should be refreshed on the machine you compare on). Any regression
+fails the run.
+
+Usage (needs moto and boto3, see bench/requirements.txt):
+    python bench/e2e.py [--iterations 20] [--scenario fetch_rss.cold.100 ...]
+    python bench/e2e.py --update-baselines
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import itertools
+import json
+import math
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FUNCTIONS_DIR = os.path.join(BACKEND_DIR, "functions")
+LAYER_DIR = os.path.join(BACKEND_DIR, "layers", "common", "python")
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+# Only the digest scenarios switch it on, so the other fetch_rss request
+# counts stay comparable with their baselines
+DIGEST_TABLE = "bench-digest"
+
+HANDLER_ENV = {
+    "UPDATES_TABLE": "bench-updates",
+    "VISITOR_TABLE": "bench-visitor",
+    "USERS_TABLE": "bench-users",
+    "SUMMARY_CACHE_TABLE": "bench-summary-cache",
+    "SITE_BUCKET": "bench-site",
+    "ARCHIVE_BUCKET": "bench-archive",
+    "SITE_BASE_URL": "https://acloudresume.com",
+    "RSS_FEED_URL": "http://127.0.0.1/feed",
+    "GENERATE_IMAGES": "false",
+    "TRACE_LOG": "false",
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "AWS_ACCESS_KEY_ID": "bench",
+    "AWS_SECRET_ACCESS_KEY": "bench",
+}
+FEED_SIZES = (25, 100, 500)
+# Added to latency limits so millisecond-scale scenarios don't fail on jitter
+LATENCY_SLACK_MS = 5
+CATEGORY_WORDS = ["Lambda", "Bedrock", "EKS", "CloudWatch", "S3", "Aurora", "VPC", "IAM", "Glue", "Agents"]
+
+# ---- stand-ins ---------------------------------------------------------------
+
+def synthetic_feed(n: int) -> bytes:
+    items = []
+    for i in range(n):
+        word = CATEGORY_WORDS[i % len(CATEGORY_WORDS)]
+        day = 12 - i % 7
+        items.append(
+            f"<item><title>Amazon {word} adds feature {i}</title>"
+            f"<link>https://aws.amazon.com/about-aws/whats-new/2026/10/feature-{i}/</link>"
+            f"<pubDate>Mon, {day:02d} Oct 2026 10:{i % 60:02d}:00 GMT</pubDate>"
+            f"<category>general:products/{word.lower()}</category>"
+            f"<guid>bench-{i}</guid>"
+            f"<description>Synthetic update {i} for {word}.</description></item>")
+    return ("<?xml version='1.0'?><rss version='2.0'><channel><title>bench</title>"
+            + "".join(items) + "</channel></rss>").encode("utf-8")
+
+class FeedServer:
+    """Serves /feed?n=N from a background thread; feeds are generated once per size."""
+
+    def __init__(self):
+        feeds = {}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                n = int(parse_qs(urlparse(self.path).query).get("n", ["25"])[0])
+                body = feeds.get(n)
+                if body is None:
+                    body = feeds[n] = synthetic_feed(n)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/rss+xml")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def url(self, n: int) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_port}/feed?n={n}"
+
+class StubBedrock:
+    """bedrock-runtime stand-in returning Titan-shaped bodies after a fixed delay."""
+
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.calls = 0
+
+    def invoke_model(self, modelId, body, **_):
+        self.calls += 1
+        time.sleep(self.latency)
+        prompt = json.loads(body).get("inputText", "")
+        text = "The update is now available.\n- Why it matters: benchmark.\n- Who should care: nobody."
+        return {"body": io.BytesIO(json.dumps({
+            "inputTextTokenCount": len(prompt.split()),
+            "results": [{"tokenCount": len(text.split()), "outputText": text, "completionReason": "FINISH"}],
+        }).encode("utf-8"))}
+
+class RequestCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, **_):
+        self.count += 1
+
+# ---- environment -------------------------------------------------------------
+
+def create_resources(boto3):
+    db = boto3.client("dynamodb")
+    def table(name, hash_key, range_key=None, **extra):
+        keys = [{"AttributeName": hash_key, "KeyType": "HASH"}]
+        attrs = [{"AttributeName": hash_key, "AttributeType": "S"}]
+        if range_key:
+            keys.append({"AttributeName": range_key, "KeyType": "RANGE"})
+            attrs.append({"AttributeName": range_key, "AttributeType": "S"})
+        db.create_table(TableName=name, KeySchema=keys, AttributeDefinitions=attrs,
+                        BillingMode="PAY_PER_REQUEST", **extra)
+    table(HANDLER_ENV["UPDATES_TABLE"], "weekKey", "updateId")
+    table(HANDLER_ENV["VISITOR_TABLE"], "path")
+    table(HANDLER_ENV["SUMMARY_CACHE_TABLE"], "cacheKey")
+    table(DIGEST_TABLE, "weekKey")
+    boto3.client("s3").create_bucket(Bucket=HANDLER_ENV["SITE_BUCKET"])
+    boto3.client("s3").create_bucket(Bucket=HANDLER_ENV["ARCHIVE_BUCKET"])
+    # The visitor counter's page allowlist
+    with open(os.path.join(os.path.dirname(BACKEND_DIR), "site", "sitemap.xml"), "rb") as f:
+        boto3.client("s3").put_object(Bucket=HANDLER_ENV["SITE_BUCKET"], Key="sitemap.xml", Body=f.read())
+
+def truncate(db, table: str, key_names: list[str]):
+    kwargs = {"TableName": table, "ProjectionExpression": ", ".join(f"#k{i}" for i in range(len(key_names))),
+              "ExpressionAttributeNames": {f"#k{i}": k for i, k in enumerate(key_names)}}
+    while True:
+        resp = db.scan(**kwargs)
+        for item in resp.get("Items", []):
+            db.delete_item(TableName=table, Key=item)
+        if not resp.get("LastEvaluatedKey"):
+            break
+        kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+def load_handler(function_name: str):
+    """Import functions/<name>/app.py under a unique module name."""
+    fn_dir = os.path.join(FUNCTIONS_DIR, function_name)
+    # Sibling modules (summary_cache, images, ...) are imported by plain name
+    sys.path.insert(0, fn_dir)
+    try:
+        spec = importlib.util.spec_from_file_location(f"bench_{function_name}_app", os.path.join(fn_dir, "app.py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(fn_dir)
+    return module
+
+# ---- scenarios ---------------------------------------------------------------
+
+def use_feed(fetch, url: str):
+    # A single feed, polled on every invocation
+    fetch.FEED_REGISTRY = [{"source": "bench", "url": url, "intervalMinutes": 0, "format": "rss", "idFrom": "guid"}]
+
+class Scenario:
+    def __init__(self, name, invoke, setup=None, iterations=None, check=None):
+        self.name = name
+        self.invoke = invoke
+        self.setup = setup
+        self.iterations = iterations
+        # check(resp) -> a problem description, or "" when the response is right
+        self.check = check
+
+def build_scenarios(handlers: dict, db, feeds: FeedServer) -> list[Scenario]:
+    fetch, get_updates, visitor = handlers["fetch_rss"], handlers["get_updates"], handlers["visitor"]
+    updates_table = HANDLER_ENV["UPDATES_TABLE"]
+    # A new client per view, so the visitor rate limit never kicks in
+    client_ips = (f"10.0.{n // 250}.{n % 250}" for n in itertools.count())
+    cache_table = HANDLER_ENV["SUMMARY_CACHE_TABLE"]
+
+    def run_fetch(n):
+        def invoke():
+            use_feed(fetch, feeds.url(n))
+            return fetch.lambda_handler({}, None)
+        return invoke
+
+    def archive_a_week():
+        # A year-old copy of the seeded week, as fetch_rss/archive.py would have left it
+        from common import archive
+        from common.clients import from_item
+        if "2025-W41" in archive.load_manifest(HANDLER_ENV["ARCHIVE_BUCKET"])["weeks"]:
+            return
+        rows = [{**from_item(i), "weekKey": "2025-W41"} for i in db.query(
+            TableName=updates_table, KeyConditionExpression="weekKey = :w",
+            ExpressionAttributeValues={":w": {"S": "2026-W41"}})["Items"]]
+        entry = archive.write_partition(HANDLER_ENV["ARCHIVE_BUCKET"], "2025-W41", rows)
+        archive.save_manifest(HANDLER_ENV["ARCHIVE_BUCKET"], {"weeks": {"2025-W41": entry}})
+        get_updates.archive._manifest = None
+
+    def cold():
+        # Empty tables and caches: every item is summarized and written
+        truncate(db, updates_table, ["weekKey", "updateId"])
+        truncate(db, cache_table, ["cacheKey"])
+        fetch.summary_cache._lru.clear()
+
+    digest = sys.modules[fetch.refresh_digests.__module__]
+
+    def with_digests(invoke):
+        def run():
+            digest.DIGEST_TABLE = get_updates.DIGEST_TABLE = DIGEST_TABLE
+            try:
+                return invoke()
+            finally:
+                digest.DIGEST_TABLE = get_updates.DIGEST_TABLE = ""
+        return run
+
+    def digest_built():
+        if "Item" not in db.get_item(TableName=DIGEST_TABLE, Key={"weekKey": {"S": digest.LATEST_KEY}}):
+            with contextlib.redirect_stdout(io.StringIO()):
+                with_digests(run_fetch(max(FEED_SIZES)))()
+
+    def nothing_rebuilt(resp):
+        rebuilt = json.loads(resp["body"])["digestsRebuilt"]
+        return f"unchanged ingest rebuilt digests {rebuilt}" if rebuilt else ""
+
+    get_latest_digest = with_digests(lambda: get_updates.lambda_handler({"rawPath": "/digest"}, None))
+
+    def digest_headers(resp):
+        headers = resp["headers"]
+        etag, cache_control = headers.get("ETag", ""), headers.get("Cache-Control", "")
+        if len(etag) < 3 or "max-age=" not in cache_control:
+            return f"missing ETag/Cache-Control: {etag!r}, {cache_control!r}"
+        again = with_digests(lambda: get_updates.lambda_handler(
+            {"rawPath": "/digest", "headers": {"If-None-Match": etag}}, None))()
+        if again["statusCode"] != 304 or again["body"]:
+            return f"If-None-Match {etag} answered {again['statusCode']}, not an empty 304"
+        return ""
+
+    scenarios = []
+    for n in FEED_SIZES:
+        scenarios.append(Scenario(f"fetch_rss.cold.{n}", run_fetch(n), setup=cold, iterations=5))
+        # Everything already stored with a current summaryKey
+        scenarios.append(Scenario(f"fetch_rss.warm.{n}", run_fetch(n), iterations=5))
+    # Same content as the untimed first call, so every run must skip the rebuild
+    scenarios.append(Scenario("fetch_rss.digest", with_digests(run_fetch(max(FEED_SIZES))),
+                              iterations=5, check=nothing_rebuilt))
+
+    scenarios += [
+        Scenario("get_updates.weeks", lambda: get_updates.lambda_handler({"rawPath": "/weeks"}, None)),
+        # The default roundup call: the `latest` row, then the digest; no scan
+        Scenario("get_updates.digest", get_latest_digest, setup=digest_built, check=digest_headers),
+        Scenario("get_updates.latest", lambda: get_updates.lambda_handler({"rawPath": "/updates"}, None)),
+        Scenario("get_updates.week", lambda: get_updates.lambda_handler(
+            {"rawPath": "/updates", "queryStringParameters": {"week": "2026-W41"}}, None)),
+        # Served from the S3 partition, cached per container after the first call
+        Scenario("get_updates.archived_week", lambda: get_updates.lambda_handler(
+            {"rawPath": "/updates", "queryStringParameters": {"week": "2025-W41"}}, None), setup=archive_a_week),
+        Scenario("visitor.increment", lambda: visitor.lambda_handler(
+            {"queryStringParameters": {"path": "/aws-updates.html"},
+             "requestContext": {"identity": {"sourceIp": next(client_ips)}}}, None)),
+        # Listing page asking for 50 counters; the per-container cache is cleared so
+        # every iteration pays for the BatchGetItem
+        Scenario("visitor.counts", lambda: (visitor._count_cache.clear(), visitor.lambda_handler(
+            {"queryStringParameters": {"paths": ",".join(f"/updates/{i:016x}.html" for i in range(50)),
+                                       "increment": "false"}}, None))[1]),
+    ]
+    return scenarios
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    # Nearest-rank
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def run_scenario(s: Scenario, counter: RequestCounter, iterations: int) -> tuple[dict, list[str]]:
+    timings, requests, problems = [], [], []
+    quiet = io.StringIO()
+    # One untimed call first, so warm scenarios don't depend on what ran before
+    with contextlib.redirect_stdout(quiet):
+        s.invoke()
+    for _ in range(iterations):
+        if s.setup:
+            s.setup()
+        counter.count = 0
+        with contextlib.redirect_stdout(quiet):
+            start = time.perf_counter()
+            resp = s.invoke()
+            timings.append((time.perf_counter() - start) * 1000)
+        requests.append(counter.count)
+        if resp.get("statusCode") != 200:
+            raise RuntimeError(f"{s.name}: status {resp.get('statusCode')}: {resp.get('body')}")
+        problem = s.check(resp) if s.check else ""
+        if problem and f"{s.name}: {problem}" not in problems:
+            problems.append(f"{s.name}: {problem}")
+        quiet.seek(0)
+        quiet.truncate()
+
+    if s.setup:
+        s.setup()
+    tracemalloc.start()
+    with contextlib.redirect_stdout(quiet):
+        s.invoke()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "p50_ms": round(percentile(timings, 50), 2),
+        "p95_ms": round(percentile(timings, 95), 2),
+        "p99_ms": round(percentile(timings, 99), 2),
+        "ddb_requests": max(requests),
+        "peak_kb": round(peak / 1024),
+    }, problems
+
+def compare(name: str, result: dict, baseline: dict | None, tolerance: float, memory_tolerance: float) -> list[str]:
+    if not baseline:
+        return []
+    problems = []
+    if result["ddb_requests"] > baseline["ddb_requests"]:
+        problems.append(f"ddb_requests {result['ddb_requests']} > {baseline['ddb_requests']}")
+    # p50 rather than p95: tail timings against moto are too noisy to gate on
+    for metric, allowed, slack in (("p50_ms", tolerance, LATENCY_SLACK_MS), ("peak_kb", memory_tolerance, 0)):
+        limit = baseline[metric] * (1 + allowed) + slack
+        if result[metric] > limit:
+            problems.append(f"{metric} {result[metric]} > {limit:.1f} (baseline {baseline[metric]})")
+    return [f"{name}: {p}" for p in problems]
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--iterations", type=int, default=0,
+                    help="invocations per scenario (default: 5 for fetch_rss, 30 otherwise)")
+    ap.add_argument("--scenario", action="append", default=[], help="run only these scenarios (prefix match)")
+    ap.add_argument("--bedrock-latency-ms", type=float, default=5.0)
+    ap.add_argument("--tolerance", type=float, default=1.0, help="allowed median latency/memory growth (1.0 = 2x)")
+    ap.add_argument("--memory-tolerance", type=float, default=0.25)
+    ap.add_argument("--baselines", default=BASELINES_PATH)
+    ap.add_argument("--update-baselines", action="store_true")
+    args = ap.parse_args(argv)
+
+    os.environ.update(HANDLER_ENV)
+    sys.path.insert(0, LAYER_DIR)
+    import boto3
+    from moto import mock_aws
+    from common import clients
+    from common.metrics import model_metrics
+
+    model_metrics.emit = lambda line: None
+    with mock_aws(), FeedServer() as feeds:
+        create_resources(boto3)
+        db = clients.ddb()
+        counter = RequestCounter()
+        db.meta.events.register("before-call.dynamodb.*", counter)
+        clients._clients["bedrock-runtime"] = StubBedrock(args.bedrock_latency_ms)
+
+        handlers = {name: load_handler(name) for name in ("fetch_rss", "get_updates", "visitor")}
+        scenarios = build_scenarios(handlers, db, feeds)
+        if args.scenario:
+            scenarios = [s for s in scenarios if any(s.name.startswith(p) for p in args.scenario)]
+        # Seed the tables so read scenarios have data even when run on their own
+        with contextlib.redirect_stdout(io.StringIO()):
+            use_feed(handlers["fetch_rss"], feeds.url(max(FEED_SIZES)))
+            handlers["fetch_rss"].lambda_handler({}, None)
+
+        try:
+            with open(args.baselines, "r", encoding="utf-8") as f:
+                baselines = json.load(f)
+        except FileNotFoundError:
+            baselines = {}
+
+        results, problems = {}, []
+        print(f"{'scenario':<24} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ddb req':>8} {'peak KB':>8}")
+        for s in scenarios:
+            iterations = args.iterations or s.iterations or 30
+            r, found = run_scenario(s, counter, iterations)
+            results[s.name] = r
+            found += compare(s.name, r, baselines.get(s.name), args.tolerance, args.memory_tolerance)
+            problems += found
+            print(f"{s.name:<24} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} "
+                  f"{r['ddb_requests']:>8} {r['peak_kb']:>8}{'  REGRESSION' if found else ''}")
+
+    if args.update_baselines:
+        baselines.update(results)
+        with open(args.baselines, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baselines written to {args.baselines}")
+        return 0
+
+    for p in problems:
+        print(f"FAIL {p}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+"""Throughput and memory benchmark for functions/get_updates/export.py.
+
+Streams --rows synthetic updates (realistic titles, links, tags and ~600
+character summaries, spread over weeks of --per-week rows) through the export
+pipeline: get_updates' list_weeks (a paginated Scan) -> paginated DynamoDB
+queries -> NDJSON lines -> gzip -> multipart parts. DynamoDB is a stand-in that builds each page on request and S3 one that
+only decompresses the parts it receives to count the lines, so the numbers
+are the handler's own work and memory, not moto's.
+
+Each row count runs twice, in a fresh interpreter each time: once for
+rows/s and MB/s (building the synthetic pages is not counted), then under
+tracemalloc for the peak. Scan pages stop at SCAN_PAGE_ROWS rows, about 1 MB
+of these items, as DynamoDB's do before projecting, so the week list spans
+many pages. The run fails if a week or a row is lost, or if the largest
+export peaks more than two parts above the smallest: memory has to stay
+bounded by one page and the part being uploaded, not grow with the table.
+
+Usage (needs boto3 for the attribute-value conversion):
+    python bench/export.py [--rows 10000 100000] [--per-week 2000] [--part-mb 5]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import zlib
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "layers", "common", "python"))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "functions", "get_updates"))
+os.environ.setdefault("TRACE_LOG", "false")
+os.environ.setdefault("EXPORT_BUCKET", "bench-export")
+os.environ.setdefault("UPDATES_TABLE", "bench")
+import app  # noqa: E402
+import export  # noqa: E402
+
+WORDS = ("amazon aws lambda s3 dynamodb bedrock region available now supports new feature launch console api "
+         "cost performance security instance general availability preview managed service customers").split()
+CATEGORIES = ["compute", "storage", "database", "ml", "networking", "security", "analytics"]
+# Synthetic items are ~1 KB and a Scan page stops at 1 MB read
+SCAN_PAGE_ROWS = 1000
+
+class SyntheticTable:
+    """Answers `query` like DynamoDB, building each page of a week on demand."""
+
+    def __init__(self, rows: int, per_week: int, seed: int):
+        self.rows, self.per_week, self.seed = rows, per_week, seed
+        # Time spent making up pages, left out of the throughput
+        self.seconds = 0.0
+        self.scan_pages = 0
+        self.weeks = [f"{2000 + n // 52}-W{n % 52 + 1:02d}" for n in range((rows + per_week - 1) // per_week)]
+
+    def week_size(self, week: str) -> int:
+        n = self.weeks.index(week)
+        return min(self.per_week, self.rows - n * self.per_week)
+
+    def scan(self, TableName, ProjectionExpression, ExclusiveStartKey=None):
+        started = time.perf_counter()
+        self.scan_pages += 1
+        start = 0
+        if ExclusiveStartKey:
+            week, i = ExclusiveStartKey["updateId"]["S"].rsplit("-", 1)
+            start = self.weeks.index(week) * self.per_week + int(i) + 1
+        end = min(start + SCAN_PAGE_ROWS, self.rows)
+        items = [{"weekKey": {"S": self.weeks[n // self.per_week]}} for n in range(start, end)]
+        resp = {"Items": items}
+        if end < self.rows:
+            week = self.weeks[(end - 1) // self.per_week]
+            resp["LastEvaluatedKey"] = {"weekKey": {"S": week},
+                                        "updateId": {"S": f"{week}-{(end - 1) % self.per_week}"}}
+        self.seconds += time.perf_counter() - started
+        return resp
+
+    def query(self, TableName, KeyConditionExpression, ExpressionAttributeValues, Limit, ExclusiveStartKey=None):
+        started = time.perf_counter()
+        week = ExpressionAttributeValues[":w"]["S"]
+        start = int(ExclusiveStartKey["updateId"]["S"].rsplit("-", 1)[1]) + 1 if ExclusiveStartKey else 0
+        end = min(start + Limit, self.week_size(week))
+        rng = random.Random(f"{self.seed}{week}{start}")
+        items = [self.item(rng, week, i) for i in range(start, end)]
+        resp = {"Items": items}
+        if end < self.week_size(week):
+            resp["LastEvaluatedKey"] = {"weekKey": {"S": week}, "updateId": items[-1]["updateId"]}
+        self.seconds += time.perf_counter() - started
+        return resp
+
+    @staticmethod
+    def item(rng: random.Random, week: str, i: int) -> dict:
+        title = " ".join(rng.choices(WORDS, k=rng.randrange(6, 14))).capitalize()
+        return {
+            "weekKey": {"S": week},
+            "updateId": {"S": f"{week}-{i}"},
+            "title": {"S": title},
+            "link": {"S": f"https://aws.amazon.com/about-aws/whats-new/{week}/{i}/"},
+            "publishedAt": {"S": f"2026-01-01T{i % 24:02d}:{i % 60:02d}:00+00:00"},
+            "category": {"S": rng.choice(CATEGORIES)},
+            "tags": {"L": [{"S": t} for t in rng.sample(WORDS, 3)]},
+            "summary": {"S": " ".join(rng.choices(WORDS, k=90))},
+            "imageUrl": {"S": f"assets/generated/{rng.getrandbits(64):016x}.png"},
+            "source": {"S": "rss"},
+        }
+
+class CountingS3:
+    """Takes the writer's uploads, keeping only a running decompression of them."""
+
+    def __init__(self):
+        self.parts = 0
+        self.lines = 0
+        self._gunzip = zlib.decompressobj(31)
+
+    def _take(self, body: bytes):
+        # 64 KB at a time: a whole part inflates to several times its size
+        view = memoryview(body)
+        for start in range(0, len(view), 1 << 16):
+            self.lines += self._gunzip.decompress(view[start:start + (1 << 16)]).count(b"\n")
+
+    def create_multipart_upload(self, **_):
+        return {"UploadId": "bench"}
+
+    def upload_part(self, Body, PartNumber, **_):
+        self.parts += 1
+        self._take(Body)
+        return {"ETag": f'"{PartNumber}"'}
+
+    def complete_multipart_upload(self, **_):
+        pass
+
+    def put_object(self, Body, **_):
+        self.parts += 1
+        self._take(Body)
+
+    def abort_multipart_upload(self, **_):
+        pass
+
+def run_once(rows: int, per_week: int, part_bytes: int, seed: int, traced: bool) -> dict:
+    table = SyntheticTable(rows, per_week, seed)
+    s3 = CountingS3()
+    writer = export.MultipartGzipWriter(s3, export.EXPORT_BUCKET, "bench.ndjson.gz", part_bytes)
+    if traced:
+        tracemalloc.start()
+    started = time.perf_counter()
+    written = 0
+    weeks = app.list_weeks(table)
+    for line in export.ndjson_lines(export.iter_updates(table, "bench", weeks, {}), export.EXPORT_FIELDS):
+        writer.write(line)
+        written += 1
+    writer.close()
+    elapsed = time.perf_counter() - started - table.seconds
+    peak = tracemalloc.get_traced_memory()[1] if traced else 0
+    return {"rows": written, "received": s3.lines, "weeks": len(weeks), "tableWeeks": len(table.weeks),
+            "scanPages": table.scan_pages, "parts": s3.parts, "elapsed": elapsed,
+            "rawBytes": writer.raw_bytes, "bytes": writer.bytes, "peakBytes": peak}
+
+def measure(rows: int, args, traced: bool) -> dict:
+    cmd = [sys.executable, os.path.abspath(__file__), "--measure", str(rows), "--per-week", str(args.per_week),
+           "--part-mb", str(args.part_mb), "--seed", str(args.seed)] + (["--traced"] if traced else [])
+    return json.loads(subprocess.run(cmd, check=True, capture_output=True, text=True).stdout)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, nargs="*", default=[10_000, 100_000])
+    ap.add_argument("--per-week", type=int, default=2000)
+    ap.add_argument("--part-mb", type=float, default=5.0, help="S3 allows 5 MB at the least")
+    ap.add_argument("--seed", type=int, default=5)
+    ap.add_argument("--measure", type=int, help=argparse.SUPPRESS)
+    ap.add_argument("--traced", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.measure:
+        print(json.dumps(run_once(args.measure, args.per_week, int(args.part_mb * 1024 * 1024), args.seed, args.traced)))
+        return 0
+
+    print(f"page {export.PAGE_SIZE} rows, part {args.part_mb:g} MB, {args.per_week} rows per week")
+    print(f"{'rows':>9} {'weeks':>6} {'scans':>6} {'seconds':>8} {'rows/s':>9} {'raw MB/s':>9} {'gzip MB':>8} "
+          f"{'parts':>6} {'peak MB':>8}")
+    failed, peaks = False, []
+    for rows in args.rows:
+        r = measure(rows, args, traced=False)
+        peak = measure(rows, args, traced=True)["peakBytes"]
+        peaks.append(peak)
+        weeks_ok = r["weeks"] == r["tableWeeks"]
+        ok = weeks_ok and r["rows"] == r["received"] == rows
+        failed |= not ok
+        print(f"{rows:>9,} {r['weeks']:>6} {r['scanPages']:>6} {r['elapsed']:>8.2f} {rows / r['elapsed']:>9,.0f} "
+              f"{r['rawBytes'] / 1e6 / r['elapsed']:>9.1f} {r['bytes'] / 1e6:>8.1f} {r['parts']:>6} "
+              f"{peak / 1e6:>8.1f}  {'ok' if ok else 'ROW MISMATCH' if weeks_ok else 'WEEKS MISSING'}")
+    growth = peaks[-1] - peaks[0]
+    if growth > 2 * args.part_mb * 1024 * 1024:
+        failed = True
+        print(f"FAIL: peak memory grew {growth / 1e6:.1f} MB from {args.rows[0]:,} to {args.rows[-1]:,} rows")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Correctness and throughput check for fetch_rss/feed_parser.py.
+
+Every fixture in bench/fixtures/feeds must parse to exactly the items in
+expected.json. Each fixture is then scaled up to --items items (entries are
+cloned with distinct ids) and parsed --runs times; the best run is reported
+in items/sec, with the date cache cleared before every run.
+
+Usage:
+    python bench/feed_parser.py [--items 5000] [--runs 5] [--min-items-per-sec 20000]
+    python bench/feed_parser.py --update-expected
+"""
+import argparse
+import copy
+import glob
+import json
+import os
+import sys
+import time
+from xml.etree import ElementTree as ET
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "functions", "fetch_rss"))
+import feed_parser  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "feeds")
+EXPECTED_PATH = os.path.join(FIXTURES_DIR, "expected.json")
+
+def load_fixtures() -> dict:
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.xml"))):
+        with open(path, "rb") as f:
+            fixtures[os.path.basename(path)] = f.read()
+    return fixtures
+
+def scale(xml_bytes: bytes, n: int) -> bytes:
+    """Clone the document's items until it has n, giving each clone a new id."""
+    root = ET.fromstring(xml_bytes)
+    kind = feed_parser.detect_format(root)
+    parent = root
+    if kind == "rss":
+        parent = next(c for c in root if feed_parser.split_tag(c.tag)[1] == "channel")
+    local = "entry" if kind == "atom" else "item"
+    originals = [c for c in parent if feed_parser.split_tag(c.tag)[1] == local]
+    for i in range(max(0, n - len(originals))):
+        clone = copy.deepcopy(originals[i % len(originals)])
+        for child in clone:
+            if feed_parser.split_tag(child.tag)[1] in ("guid", "id", "title"):
+                child.text = f"{child.text or ''} #{i}"
+        parent.append(clone)
+    return ET.tostring(root)
+
+def check(fixtures: dict, expected: dict) -> list[str]:
+    problems = []
+    for name, xml_bytes in fixtures.items():
+        got = feed_parser.parse_feed(xml_bytes)
+        want = expected.get(name)
+        if want is None:
+            problems.append(f"{name}: no expected output (run with --update-expected)")
+        elif got != want:
+            problems.append(f"{name}: parsed items differ from expected.json")
+    return problems
+
+def throughput(xml_bytes: bytes, runs: int) -> tuple[int, float]:
+    best = float("inf")
+    count = 0
+    for _ in range(runs):
+        feed_parser.parse_date.cache_clear()
+        start = time.perf_counter()
+        count = len(feed_parser.parse_feed(xml_bytes))
+        best = min(best, time.perf_counter() - start)
+    return count, count / best
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--items", type=int, default=5000)
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--min-items-per-sec", type=float, default=0)
+    ap.add_argument("--update-expected", action="store_true")
+    args = ap.parse_args(argv)
+
+    fixtures = load_fixtures()
+    if args.update_expected:
+        expected = {name: feed_parser.parse_feed(x) for name, x in fixtures.items()}
+        with open(EXPECTED_PATH, "w", encoding="utf-8") as f:
+            json.dump(expected, f, indent=2)
+            f.write("\n")
+        print(f"Expected output written to {EXPECTED_PATH}")
+        return 0
+
+    with open(EXPECTED_PATH, "r", encoding="utf-8") as f:
+        problems = check(fixtures, json.load(f))
+
+    for name, xml_bytes in fixtures.items():
+        count, rate = throughput(scale(xml_bytes, args.items), args.runs)
+        ok = rate >= args.min_items_per_sec
+        if not ok:
+            problems.append(f"{name}: {rate:,.0f} items/s below {args.min_items_per_sec:,.0f}")
+        print(f"{'ok  ' if ok else 'FAIL'} {name:<22} {count:>7} items  {rate:>12,.0f} items/s")
+
+    for p in problems:
+        print(f"FAIL {p}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
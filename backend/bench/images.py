@@ -0,0 +1,180 @@
+"""Checks for the card image stage (functions/fetch_rss/images.py).
+
+Runs ImageStage and fetch_rss's attach_images against an in-memory S3 and a
+stubbed Titan call (it returns a 704x320 PNG after --titan-ms, and records
+how many calls overlap), then checks that:
+
+- each (category, title bucket) key gets exactly one image, shared by every
+  title in the bucket, stored as a 400x176 JPEG;
+- a key already in the bucket is reused without calling Titan, including
+  from a fresh container;
+- no run generates more than IMAGE_BUDGET images or runs more than
+  IMAGE_CONCURRENCY calls at once, and the keys left over are generated by
+  the next runs;
+- imageUrl is only written on rows that have none and aren't duplicates;
+- without Pillow nothing is generated or stored and imageUrl stays empty.
+
+Usage (needs Pillow):
+    python bench/images.py [--titan-ms 50]
+"""
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "layers", "common", "python"))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "functions", "fetch_rss"))
+os.environ.update({
+    "UPDATES_TABLE": "bench-updates",
+    "SITE_BUCKET": "bench-site",
+    "SITE_BASE_URL": "https://bench.example",
+    "TRACE_LOG": "false",
+})
+import images  # noqa: E402
+import app  # noqa: E402
+from PIL import Image  # noqa: E402
+
+BUCKET = os.environ["SITE_BUCKET"]
+PREFIX = "assets/generated/"
+CATEGORIES = ["Serverless", "AI & GenAI", "Storage"]
+
+class NotFound(Exception):
+    response = {"Error": {"Code": "404"}}
+
+class MemoryS3:
+    """head_object/put_object over a dict, counting calls."""
+
+    def __init__(self):
+        self.objects = {}
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def head_object(self, Bucket, Key):
+        with self._lock:
+            self.calls["head"] += 1
+            if (Bucket, Key) not in self.objects:
+                raise NotFound(Key)
+            return {"ContentLength": len(self.objects[(Bucket, Key)]["Body"])}
+
+    def put_object(self, Bucket, Key, **kwargs):
+        with self._lock:
+            self.calls["put"] += 1
+            self.calls[("put", Key)] += 1
+            self.objects[(Bucket, Key)] = kwargs
+
+class StubTitan:
+    """Stands in for invoke_titan_image, tracking concurrency."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        out = io.BytesIO()
+        Image.new("RGB", images.GENERATE_SIZE, (255, 153, 0)).save(out, format="PNG")
+        self.png = out.getvalue()
+
+    def __call__(self, model_id: str, prompt: str, seed: int) -> bytes:
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.in_flight -= 1
+        return self.png
+
+def items(n: int) -> list[dict]:
+    return [{"category": CATEGORIES[i % len(CATEGORIES)], "title": f"Update number {i} ships"} for i in range(n)]
+
+def stage(budget: int, concurrency: int) -> images.ImageStage:
+    # A new stage is a cold container: nothing known yet
+    return images.ImageStage(BUCKET, PREFIX, os.environ["SITE_BASE_URL"], app.IMAGE_MODEL_ID,
+                             budget=budget, concurrency=concurrency)
+
+def install(titan_ms: float) -> tuple[MemoryS3, StubTitan]:
+    s3, titan = MemoryS3(), StubTitan(titan_ms / 1000)
+    images.client = lambda service: s3
+    images.invoke_titan_image = titan
+    return s3, titan
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--titan-ms", type=float, default=50.0)
+    args = ap.parse_args(argv)
+    failures = []
+
+    def check(ok: bool, what: str):
+        print(f"{'ok  ' if ok else 'FAIL'} {what}")
+        if not ok:
+            failures.append(what)
+
+    batch = items(300)
+    keys = {images.image_key(it["category"], it["title"], app.IMAGE_MODEL_ID) for it in batch}
+
+    # One image per key, shared by every title in its bucket
+    s3, titan = install(args.titan_ms)
+    st = stage(budget=len(keys), concurrency=3)
+    urls = st.resolve(batch)
+    puts = [k for k in s3.calls if isinstance(k, tuple)]
+    check(len(keys) == len(CATEGORIES) * images.IMAGE_BUCKETS, f"{len(batch)} titles fall into {len(keys)} keys")
+    check(titan.calls == len(keys) and st.generated == len(keys) and len(puts) == len(keys)
+          and all(s3.calls[k] == 1 for k in puts), f"one Titan call and one put per key ({titan.calls} calls)")
+    check(set(urls) == keys and len(set(urls.values())) == len(keys), "every key resolves to its own URL")
+    bodies = [Image.open(io.BytesIO(o["Body"])) for o in s3.objects.values()]
+    check(all(b.format == "JPEG" and b.size == images.CARD_SIZE for b in bodies)
+          and all(o["ContentType"] == "image/jpeg" for o in s3.objects.values()),
+          f"stored as {images.CARD_SIZE[0]}x{images.CARD_SIZE[1]} JPEG")
+
+    # Existing keys: no generation, warm or cold
+    titan.calls, s3.calls = 0, Counter()
+    check(st.resolve(batch) == urls and titan.calls == 0 and s3.calls["head"] == 0,
+          "warm container reuses known images without S3 or Titan")
+    cold = stage(budget=len(keys), concurrency=3)
+    check(cold.resolve(batch) == urls and titan.calls == 0 and s3.calls["put"] == 0 and cold.generated == 0,
+          f"cold container finds existing images with {s3.calls['head']} HEADs, no Titan call")
+
+    # Budget and concurrency caps, leftovers picked up by later runs
+    s3, titan = install(args.titan_ms)
+    budget, concurrency = 5, 2
+    runs, done = [], {}
+    while len(done) < len(keys) and len(runs) < 10:
+        before = titan.calls
+        done = stage(budget=budget, concurrency=concurrency).resolve(batch)
+        runs.append(titan.calls - before)
+    check(all(n <= budget for n in runs) and sum(runs) == len(keys),
+          f"budget {budget}: {len(keys)} images over {len(runs)} runs ({runs})")
+    check(titan.max_in_flight == concurrency, f"at most {concurrency} Titan calls at once "
+          f"(saw {titan.max_in_flight})")
+
+    # Write-back: only rows without imageUrl, never duplicates
+    s3, titan = install(args.titan_ms)
+    app.image_stage = stage(budget=len(keys), concurrency=3)
+    rows = [dict(it, updateId=f"u{i}", imageUrl="") for i, it in enumerate(items(12))]
+    rows[0]["imageUrl"] = "https://bench.example/keep-me.jpg"
+    dups = {"u1": {"updateId": "u0", "weekKey": "2026-W42"}}
+    generated = app.attach_images(rows, dups)
+    check(rows[0]["imageUrl"] == "https://bench.example/keep-me.jpg", "an existing imageUrl is kept")
+    check(rows[1]["imageUrl"] == "", "duplicates are left for their canonical's image")
+    check(all(r["imageUrl"].startswith(f"https://bench.example/{PREFIX}") for r in rows[2:]),
+          f"the other {len(rows) - 2} rows get a generated image ({generated} generated)")
+
+    # Without Pillow: no Titan call, nothing stored, no imageUrl
+    s3, titan = install(args.titan_ms)
+    can_resize, images.can_resize = images.can_resize, lambda: False
+    app.image_stage = stage(budget=len(keys), concurrency=3)
+    rows = [dict(it, updateId=f"u{i}", imageUrl="") for i, it in enumerate(items(6))]
+    app.attach_images(rows, {})
+    images.can_resize = can_resize
+    check(titan.calls == 0 and not s3.objects and all(r["imageUrl"] == "" for r in rows),
+          "without Pillow nothing is generated and imageUrl stays empty")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Cold-import budget check for the Lambda handlers.
+
+Runs `python -X importtime -c "import app"` in a fresh interpreter for every
+function directory (with the CommonLayer on PYTHONPATH, as Lambda puts it on
+/opt/python) and fails if the handler module's cumulative import time exceeds
+its budget. Handlers should keep boto3 and other heavy imports out of module
+scope; see layers/common/python/common/clients.py.
+
+Usage:
+    python bench/import_budget.py [--runs 5] [--budget-ms get_updates=80 ...]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FUNCTIONS_DIR = os.path.join(BACKEND_DIR, "functions")
+LAYER_DIR = os.path.join(BACKEND_DIR, "layers", "common", "python")
+
+# Per-handler budget in milliseconds (best of N runs)
+BUDGETS_MS = {
+    "auth": 60,
+    "fetch_rss": 120,
+    "get_updates": 40,
+    "visitor": 40,
+}
+
+# Env the handlers read at import time
+HANDLER_ENV = {
+    "UPDATES_TABLE": "bench-updates",
+    "VISITOR_TABLE": "bench-visitor",
+    "USERS_TABLE": "bench-users",
+    "RSS_FEED_URL": "http://127.0.0.1/feed",
+    "SITE_BASE_URL": "https://acloudresume.com",
+    "AWS_DEFAULT_REGION": "us-east-1",
+}
+
+def import_time_us(function_name):
+    env = dict(os.environ, **HANDLER_ENV)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in [LAYER_DIR, env.get("PYTHONPATH", "")] if p)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=os.path.join(FUNCTIONS_DIR, function_name),
+        env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{function_name}: import failed\n{proc.stderr[-2000:]}")
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) == 3 and parts[2].rstrip() == " app":
+            return int(parts[1])
+    raise RuntimeError(f"{function_name}: no importtime entry for app")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--budget-ms", nargs="*", default=[], metavar="NAME=MS")
+    args = ap.parse_args(argv)
+
+    budgets = dict(BUDGETS_MS)
+    for b in args.budget_ms:
+        name, ms = b.split("=", 1)
+        budgets[name] = float(ms)
+
+    failed = False
+    for name in sorted(budgets):
+        if not os.path.isdir(os.path.join(FUNCTIONS_DIR, name)):
+            continue
+        best_ms = min(import_time_us(name) for _ in range(args.runs)) / 1000
+        ok = best_ms <= budgets[name]
+        failed |= not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {name:<12} {best_ms:8.1f} ms  (budget {budgets[name]:.0f} ms)")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
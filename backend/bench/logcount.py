@@ -0,0 +1,174 @@
+"""Throughput and memory benchmark for functions/visitor/logcount.py.
+
+Generates a synthetic set of gzip CloudFront standard logs (default ~2 GB of
+log text across --objects files: page views, assets, bots, errors over a few
+days), then counts it with logcount.count_objects at each --workers setting
+and reports lines/sec, MB/sec (uncompressed) and peak RSS of the parent and
+of the worker processes (each setting runs in a fresh interpreter). The
+per-path totals are checked against what the
+generator wrote (folded by the same canonical key, with site/sitemap.xml as
+the allowlist), so a fast but wrong parser fails the run.
+
+The data set is cached in --dir and reused while its parameters match.
+
+Usage:
+    python bench/logcount.py [--gb 2] [--objects 48] [--workers 1 2 4] [--dir /tmp/logcount-bench]
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from collections import Counter
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "layers", "common", "python"))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "functions", "visitor"))
+os.environ.setdefault("TRACE_LOG", "false")
+os.environ.setdefault("SITEMAP_URI", os.path.join(os.path.dirname(BACKEND_DIR), "site", "sitemap.xml"))
+import logcount  # noqa: E402
+
+PAGES = ["/", "/index.html", "/aws-updates.html", "/blog.html", "/tutorials.html", "/tutorial-viewer.html",
+         "/updates/{}.html"]
+ASSETS = ["/assets/aws-updates.js", "/js/visitor.js", "/js/home.js", "/favicon.svg", "/assets/og-aws-updates.png",
+          "/data/site-config.json", "/images/og-image.jpg", "/sitemap.xml"]
+BROWSERS = ["Mozilla/5.0%20(Windows%20NT%2010.0;%20Win64;%20x64)%20AppleWebKit/537.36%20Chrome/130.0",
+            "Mozilla/5.0%20(Macintosh;%20Intel%20Mac%20OS%20X%2014_6)%20AppleWebKit/605.1.15%20Safari/605.1.15",
+            "Mozilla/5.0%20(iPhone;%20CPU%20iPhone%20OS%2018_0%20like%20Mac%20OS%20X)%20Mobile/15E148",
+            "Mozilla/5.0%20(X11;%20Linux%20x86_64;%20rv:131.0)%20Gecko/20100101%20Firefox/131.0"]
+BOTS = ["Mozilla/5.0%20(compatible;%20Googlebot/2.1;%20+http://www.google.com/bot.html)",
+        "LinkedInBot/1.0%20(compatible;%20Mozilla/5.0)", "curl/8.5.0", "python-requests/2.32.3",
+        "Mozilla/5.0%20(compatible;%20AhrefsBot/7.0)", "-"]
+FIELDS = ("#Fields: date time x-edge-location sc-bytes c-ip cs-method cs(Host) cs-uri-stem sc-status "
+          "cs(Referer) cs(User-Agent) cs-uri-query cs(Cookie) x-edge-result-type x-edge-request-id "
+          "x-host-header cs-protocol cs-bytes time-taken\n")
+POOL_SIZE = 20_000
+AVG_LINE = 260
+
+def line_pool(rng: random.Random, days: list[str]) -> tuple[list[str], list[tuple[str, str] | None]]:
+    """Distinct log lines and, per line, the (path, hour) it should count as (None = not counted)."""
+    lines, expect = [], []
+    update_ids = [f"{rng.getrandbits(64):016x}" for _ in range(300)]
+    for _ in range(POOL_SIZE):
+        day, hour = rng.choice(days), rng.randrange(24)
+        r = rng.random()
+        if r < 0.55:
+            uri = rng.choice(ASSETS)
+        else:
+            uri = rng.choice(PAGES).format(rng.choice(update_ids))
+        bot = rng.random() < 0.15
+        ua = rng.choice(BOTS if bot else BROWSERS)
+        method = "GET" if rng.random() < 0.97 else "HEAD"
+        status = rng.choices(["200", "304", "404", "403"], [85, 8, 5, 2])[0]
+        counted = (method == "GET" and status in ("200", "304") and r >= 0.55 and not bot)
+        lines.append(f"{day}\t{hour:02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}\tFRA56-P1\t{rng.randrange(300, 90000)}\t"
+                     f"203.0.113.{rng.randrange(255)}\t{method}\td111111abcdef8.cloudfront.net\t{uri}\t{status}\t"
+                     f"https://acloudresume.com/\t{ua}\t-\t-\tHit\t{rng.getrandbits(120):030x}\tacloudresume.com\t"
+                     f"https\t{rng.randrange(200, 900)}\t0.00{rng.randrange(1, 9)}\n")
+        expect.append((uri, f"{day}T{hour:02d}") if counted else None)
+    return lines, expect
+
+def generate(root: str, gb: float, objects: int, seed: int) -> dict:
+    manifest_path = os.path.join(root, "manifest.json")
+    params = {"gb": gb, "objects": objects, "seed": seed, "version": 1}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("params") == params:
+            return manifest
+    os.makedirs(root, exist_ok=True)
+    rng = random.Random(seed)
+    days = [f"2026-10-{d:02d}" for d in range(13, 20)]
+    pool, expect = line_pool(rng, days)
+    lines_per_object = int(gb * 1e9 / AVG_LINE / objects)
+    expected, total_lines, total_bytes = Counter(), 0, 0
+    started = time.perf_counter()
+    for i in range(objects):
+        picks = rng.choices(range(POOL_SIZE), k=lines_per_object)
+        for idx, n in Counter(picks).items():
+            if expect[idx]:
+                expected[expect[idx][0]] += n
+        body = "#Version: 1.0\n" + FIELDS + "".join(pool[j] for j in picks)
+        data = body.encode("utf-8")
+        total_bytes += len(data)
+        total_lines += lines_per_object
+        name = f"E2EXAMPLE.2026-10-{13 + i % 7:02d}-{i % 24:02d}.{i:06x}.gz"
+        with gzip.open(os.path.join(root, name), "wb", compresslevel=1) as f:
+            f.write(data)
+        print(f"  generated {i + 1}/{objects} ({total_bytes / 1e9:.2f} GB)", end="\r", flush=True)
+    print(f"  generated {objects} objects, {total_bytes / 1e9:.2f} GB in {time.perf_counter() - started:.0f}s")
+    manifest = {"params": params, "lines": total_lines, "bytes": total_bytes, "expected": dict(expected)}
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return manifest
+
+def peak_rss_mb(who) -> float:
+    if who == resource.RUSAGE_SELF and os.path.exists("/proc/self/status"):
+        # Linux keeps ru_maxrss across exec, so it would include the generator's
+        # peak; VmHWM belongs to this process image only
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(who).ru_maxrss / 1024
+
+def run_once(root: str, workers: int) -> dict:
+    store = logcount.LocalLogs(root)
+    objects = store.list("", 1_000_000)
+    totals, stats = Counter(), Counter()
+    started = time.perf_counter()
+    for status, key, counts, obj_stats in logcount.count_objects(store, objects, workers):
+        if status != "ok":
+            raise RuntimeError(f"{key}: {counts}")
+        totals.update(counts)
+        stats.update(obj_stats)
+    elapsed = time.perf_counter() - started
+    per_path = Counter()
+    for (path, _hour), n in totals.items():
+        per_path[path] += n
+    return {"elapsed": elapsed, "lines": stats["lines"], "bots": stats["bots"], "perPath": per_path,
+            "parentRssMb": peak_rss_mb(resource.RUSAGE_SELF), "workerRssMb": peak_rss_mb(resource.RUSAGE_CHILDREN)}
+
+def measure(root: str, workers: int) -> dict:
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--dir", root, "--measure", str(workers)],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--gb", type=float, default=2.0, help="uncompressed log text to generate")
+    ap.add_argument("--objects", type=int, default=48)
+    ap.add_argument("--workers", type=int, nargs="*", default=[1, 2, 4])
+    ap.add_argument("--seed", type=int, default=11)
+    ap.add_argument("--dir", default=os.path.join("/tmp", "logcount-bench"))
+    ap.add_argument("--measure", type=int, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.measure:
+        print(json.dumps(run_once(args.dir, args.measure)))
+        return 0
+
+    manifest = generate(args.dir, args.gb, args.objects, args.seed)
+    expected = Counter()
+    for path, n in manifest["expected"].items():
+        expected[logcount.count_key(path)] += n
+    print(f"{manifest['lines']:,} lines, {manifest['bytes'] / 1e9:.2f} GB uncompressed, "
+          f"{sum(expected.values()):,} countable page views; {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'seconds':>8} {'lines/s':>11} {'MB/s':>7} {'parent RSS MB':>14} {'worker RSS MB':>14}")
+    failed = False
+    for workers in args.workers:
+        r = measure(args.dir, workers)
+        ok = Counter(r["perPath"]) == expected and r["lines"] == manifest["lines"]
+        failed |= not ok
+        print(f"{workers:>7} {r['elapsed']:>8.1f} {r['lines'] / r['elapsed']:>11,.0f} "
+              f"{manifest['bytes'] / 1e6 / r['elapsed']:>7.1f} {r['parentRssMb']:>14.1f} "
+              f"{r['workerRssMb']:>14.1f}  {'ok' if ok else 'COUNT MISMATCH'}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
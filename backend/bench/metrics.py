@@ -0,0 +1,134 @@
+"""Checks for the Bedrock EMF log lines (layers/common/python/common/metrics.py).
+
+Captures model_metrics.emit, then drives fetch_rss the way a run does: one
+summarize_with_titan call against a stubbed Bedrock that reports token
+counts, one that is throttled, a summary cache hit and a miss, and the
+end-of-run emit_summary. Each captured line is parsed as JSON and checked
+the way CloudWatch reads it:
+
+- one line per call and one for the run, each a single-line JSON document;
+- the _aws.CloudWatchMetrics namespace and dimension set, with every
+  declared metric present at the top level;
+- token counts, Throttles/Errors and EstimatedCost on the call records;
+- the run totals (calls, tokens, throttles, cost, cache hits and misses).
+
+Usage (needs botocore for the throttle error):
+    python bench/metrics.py
+"""
+import argparse
+import io
+import json
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "layers", "common", "python"))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "functions", "fetch_rss"))
+os.environ.update({
+    "UPDATES_TABLE": "bench-updates",
+    "SITE_BUCKET": "",
+    "STREAM_SUMMARIES": "false",
+    "TRACE_LOG": "false",
+})
+os.environ.pop("MODEL_PRICES", None)
+os.environ.pop("METRICS_NAMESPACE", None)
+from botocore.exceptions import ClientError  # noqa: E402
+from common import clients  # noqa: E402
+from common.metrics import model_metrics, DEFAULT_PRICES  # noqa: E402
+import app  # noqa: E402
+
+NAMESPACE = "aCloudResume/Bedrock"
+INPUT_TOKENS, OUTPUT_TOKENS = 120, 45
+
+class StubBedrock:
+    """invoke_model answering like Titan text, or throttling when asked to."""
+
+    def __init__(self):
+        self.throttle = False
+
+    def invoke_model(self, modelId, body, accept, contentType):
+        if self.throttle:
+            raise ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+                              "InvokeModel")
+        data = {"inputTextTokenCount": INPUT_TOKENS,
+                "results": [{"tokenCount": OUTPUT_TOKENS, "outputText": "A sentence.\n- one\n- two"}]}
+        return {"body": io.BytesIO(json.dumps(data).encode("utf-8"))}
+
+def emf(line: str) -> tuple[dict, dict]:
+    """(document, its CloudWatchMetrics directive), checking the directive holds together."""
+    doc = json.loads(line)
+    directive = doc["_aws"]["CloudWatchMetrics"][0]
+    missing = [m["Name"] for m in directive["Metrics"] if m["Name"] not in doc]
+    missing += [d for dims in directive["Dimensions"] for d in dims if d not in doc]
+    if missing:
+        raise ValueError(f"declared but not in the record: {missing}")
+    return doc, directive
+
+def main(argv=None):
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args(argv)
+    failures = []
+
+    def check(ok: bool, what: str):
+        print(f"{'ok  ' if ok else 'FAIL'} {what}")
+        if not ok:
+            failures.append(what)
+
+    lines = []
+    model_metrics.emit = lines.append
+    model_metrics.reset()
+    app.summary_cache.reset_stats()
+    bedrock = clients._clients["bedrock-runtime"] = StubBedrock()
+
+    # A run: one summary, one throttled call, a cache hit and a miss
+    summary = app.summarize_with_titan("Amazon S3 adds a bench check", "https://example.com/1", "Storage")
+    bedrock.throttle = True
+    try:
+        app.summarize_with_titan("Amazon S3 adds another", "https://example.com/2", "Storage")
+        throttled = False
+    except ClientError:
+        throttled = True
+    app.summary_cache.put("hit", summary, app.TEXT_MODEL_ID, "v")
+    app.summary_cache.get("hit")
+    app.summary_cache.get("miss")
+    run = model_metrics.emit_summary("FetchRss")
+
+    check(len(lines) == 3 and all("\n" not in line for line in lines),
+          f"one single-line record per call and one for the run ({len(lines)} lines)")
+    check(throttled, "the throttle still reaches the caller")
+    try:
+        (ok_doc, ok_dir), (thr_doc, thr_dir), (run_doc, run_dir) = [emf(line) for line in lines]
+    except ValueError as e:
+        check(False, f"records parse as EMF: {e}")
+        return 1
+
+    price = DEFAULT_PRICES[app.TEXT_MODEL_ID]
+    cost = round(INPUT_TOKENS / 1000 * price["input"] + OUTPUT_TOKENS / 1000 * price["output"], 6)
+    check(all(d["Namespace"] == NAMESPACE for d in (ok_dir, thr_dir, run_dir)), f"namespace {NAMESPACE}")
+    check(ok_dir["Dimensions"] == thr_dir["Dimensions"] == [["ModelId", "Operation"]]
+          and ok_doc["ModelId"] == app.TEXT_MODEL_ID and ok_doc["Operation"] == "InvokeModel",
+          f"call records dimensioned by ModelId/Operation ({ok_doc['ModelId']}, {ok_doc['Operation']})")
+    check(ok_doc["InputTokens"] == INPUT_TOKENS and ok_doc["OutputTokens"] == OUTPUT_TOKENS,
+          f"token counts {ok_doc['InputTokens']} in / {ok_doc['OutputTokens']} out")
+    check(ok_doc["EstimatedCost"] == cost and ok_doc["Throttles"] == ok_doc["Errors"] == 0
+          and ok_doc["Latency"] >= 0, f"estimated cost {ok_doc['EstimatedCost']} USD, no throttle or error")
+    check(thr_doc["Throttles"] == thr_doc["Errors"] == 1 and thr_doc["EstimatedCost"] == 0
+          and thr_doc["InputTokens"] == thr_doc["OutputTokens"] == 0,
+          "the throttled call records Throttles=1, Errors=1 and no cost")
+    units = {m["Name"]: m["Unit"] for m in ok_dir["Metrics"]}
+    check(units.get("Latency") == "Milliseconds" and units.get("InputTokens") == "Count",
+          "latency in Milliseconds, tokens as Count")
+
+    check(run_dir["Dimensions"] == [["Function"]] and run_doc["Function"] == "FetchRss",
+          "run record dimensioned by Function")
+    check(run_doc["RunModelCalls"] == 2 and run_doc["RunInputTokens"] == INPUT_TOKENS
+          and run_doc["RunOutputTokens"] == OUTPUT_TOKENS and run_doc["RunThrottles"] == 1,
+          f"run totals: {run_doc['RunModelCalls']} calls, {run_doc['RunInputTokens']}/"
+          f"{run_doc['RunOutputTokens']} tokens, {run_doc['RunThrottles']} throttle")
+    check(run_doc["RunEstimatedCost"] == cost == run["costUsd"] == run_doc["runSummary"]["costUsd"],
+          f"run cost {run_doc['RunEstimatedCost']} USD matches the calls and the returned summary")
+    check(run_doc.get("SummaryCacheHits") == 1 and run_doc.get("SummaryCacheMisses") == 1,
+          "summary cache: 1 hit, 1 miss")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
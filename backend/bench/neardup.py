@@ -0,0 +1,134 @@
+"""Accuracy and scale check for fetch_rss/neardup.py.
+
+1. Pairwise precision/recall at MAX_DISTANCE on the hand-labelled titles in
+   bench/fixtures/neardup.json (fails below --min-precision/--min-recall).
+2. A synthetic run at --items titles (default 100k): launches built from
+   service/feature vocabularies, a share of them re-announced for other
+   regions. Every title goes through simhash + LshIndex.nearest/add exactly
+   as find_duplicates does, and the run reports items/sec, candidates
+   compared per lookup and how many re-announcements were grouped.
+
+Usage:
+    python bench/neardup.py [--items 100000] [--dup-rate 0.15] [--seed 7]
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "functions", "fetch_rss"))
+import neardup  # noqa: E402
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "neardup.json")
+
+SERVICES = ["Amazon EC2", "AWS Lambda", "Amazon S3", "Amazon Bedrock", "Amazon EKS", "Amazon ECS",
+            "Amazon RDS", "Amazon Aurora", "Amazon DynamoDB", "Amazon CloudWatch", "AWS Glue",
+            "Amazon SageMaker", "AWS Step Functions", "Amazon EventBridge", "Amazon VPC", "AWS IAM",
+            "Amazon GuardDuty", "AWS Backup", "Amazon FSx", "Amazon Kinesis", "Amazon Redshift",
+            "Amazon OpenSearch Service", "AWS CodeBuild", "Amazon Q Developer", "Amazon Connect"]
+VERBS = ["now supports", "adds", "introduces", "announces", "launches", "enhances", "expands"]
+NOUNS = ["cross-account", "encryption", "streaming", "batch", "vector", "graph", "serverless",
+         "private", "real-time", "zero-ETL", "multi-Region", "fine-grained", "scheduled", "managed",
+         "native", "incremental", "automatic", "custom", "observability", "cost", "query", "storage",
+         "replication", "snapshot", "export", "import", "identity", "network", "compute", "inference",
+         "retention", "tagging", "logging", "metrics", "alarms", "dashboards", "policies", "agents",
+         "pipelines", "templates", "connectors", "workflows", "endpoints", "indexes", "filters"]
+OBJECTS = ["integration", "support", "capabilities", "APIs", "mode", "controls", "insights", "limits",
+           "console experience", "SDK", "CLI commands", "instance types", "pricing", "quotas"]
+REGIONS = ["US East (Ohio)", "US West (Oregon)", "Europe (Milan)", "Europe (Spain)", "Asia Pacific (Tokyo)",
+           "Asia Pacific (Jakarta)", "Canada West (Calgary)", "Middle East (UAE)", "South America (Sao Paulo)",
+           "AWS GovCloud (US-West)", "Israel (Tel Aviv)", "Africa (Cape Town)"]
+REGION_TEMPLATES = ["{title} is now available in {region}", "{title} now available in {region} and {region2}",
+                    "{title} expands to additional regions", "{title} now available in {region} Region"]
+
+def labelled_accuracy(max_distance: int) -> tuple[float, float, int]:
+    with open(SAMPLE_PATH, "r", encoding="utf-8") as f:
+        items = json.load(f)["items"]
+    sigs = [neardup.simhash(i["title"]) for i in items]
+    tp = fp = fn = 0
+    for a, b in itertools.combinations(range(len(items)), 2):
+        same = items[a]["group"] == items[b]["group"]
+        hit = neardup.distance(sigs[a], sigs[b]) <= max_distance
+        tp += same and hit
+        fp += hit and not same
+        fn += same and not hit
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    return precision, recall, len(items)
+
+def synthetic_titles(n: int, dup_rate: float, seed: int) -> list[tuple[str, int]]:
+    """(title, launch id) pairs; re-announcements share their launch's id."""
+    rng = random.Random(seed)
+    out, launches = [], []
+    while len(out) < n:
+        if launches and rng.random() < dup_rate:
+            launch_id, base = rng.choice(launches)
+            r1, r2 = rng.sample(REGIONS, 2)
+            out.append((rng.choice(REGION_TEMPLATES).format(title=base, region=r1, region2=r2), launch_id))
+            continue
+        nouns = " ".join(rng.sample(NOUNS, rng.randint(1, 3)))
+        # Real launches name something specific (a feature, version, instance family)
+        name = "".join(rng.choice("bcdfghklmnprstvz") + rng.choice("aeiou") for _ in range(3))
+        base = f"{rng.choice(SERVICES)} {rng.choice(VERBS)} {name.title()} {nouns} {rng.choice(OBJECTS)}"
+        launches.append((len(launches), base))
+        out.append((base, len(launches) - 1))
+    return out
+
+def run_synthetic(titles: list[tuple[str, int]]) -> dict:
+    index = neardup.LshIndex()
+    compared = grouped = wrong = 0
+    canonical_of = {}
+    start = time.perf_counter()
+    for i, (title, launch) in enumerate(titles):
+        sig = neardup.simhash(title)
+        # Count the candidates nearest() will look at, without changing its logic
+        compared += sum(len(index.buckets.get(b, ())) for b in neardup.bands(sig))
+        match = index.nearest(sig)
+        if match is not None:
+            grouped += 1
+            wrong += titles[match][1] != launch
+            index.add(sig, match)
+        else:
+            index.add(sig, i)
+        canonical_of.setdefault(launch, i)
+    elapsed = time.perf_counter() - start
+    duplicates = len(titles) - len(canonical_of)
+    return {
+        "items": len(titles),
+        "itemsPerSec": len(titles) / elapsed,
+        "candidatesPerLookup": compared / len(titles),
+        "duplicates": duplicates,
+        "grouped": grouped,
+        "precision": (grouped - wrong) / grouped if grouped else 1.0,
+        "recall": (grouped - wrong) / duplicates if duplicates else 1.0,
+    }
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--items", type=int, default=100_000)
+    ap.add_argument("--dup-rate", type=float, default=0.15)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--min-precision", type=float, default=0.95)
+    ap.add_argument("--min-recall", type=float, default=0.9)
+    args = ap.parse_args(argv)
+
+    failed = False
+    precision, recall, count = labelled_accuracy(neardup.MAX_DISTANCE)
+    ok = precision >= args.min_precision and recall >= args.min_recall
+    failed |= not ok
+    print(f"{'ok  ' if ok else 'FAIL'} labelled sample ({count} titles, max distance {neardup.MAX_DISTANCE}): "
+          f"precision {precision:.3f}  recall {recall:.3f}")
+
+    r = run_synthetic(synthetic_titles(args.items, args.dup_rate, args.seed))
+    print(f"     synthetic {r['items']:,} titles: {r['itemsPerSec']:,.0f} items/s, "
+          f"{r['candidatesPerLookup']:.1f} candidates/lookup")
+    print(f"     {r['duplicates']:,} re-announcements, {r['grouped']:,} grouped: "
+          f"precision {r['precision']:.3f}  recall {r['recall']:.3f}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Concurrent load test of the visitor endpoint's rate limiting.
+
+Loads the visitor handler --containers times (each copy has its own
+per-container token buckets, like separate Lambda containers) against moto
+DynamoDB, then runs one thread per client for --seconds, each request going
+to a random container:
+
+- --readers clients view a page every 0.5-3 s, like people browsing;
+- --abusers clients call in a tight loop.
+
+Reports requests, 200s and 429s per kind of client, DynamoDB writes, and the
+handler latency of accepted vs rejected requests. It fails if a reader was
+ever rejected, or if an abuser got through more than its limit allows: the
+per-container buckets let through at most burst + rate * seconds per
+container, and with --shared (RATE_LIMIT_TABLE set) the sliding window caps
+the total across containers at about `limit` per window.
+
+Usage (needs moto and boto3, see bench/requirements.txt):
+    python bench/ratelimit.py [--containers 4] [--readers 40] [--abusers 3] [--seconds 10] [--shared]
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import math
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAYER_DIR = os.path.join(BACKEND_DIR, "layers", "common", "python")
+VISITOR_DIR = os.path.join(BACKEND_DIR, "functions", "visitor")
+
+HANDLER_ENV = {
+    "VISITOR_TABLE": "bench-visitor",
+    "TRACE_LOG": "false",
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "AWS_ACCESS_KEY_ID": "bench",
+    "AWS_SECRET_ACCESS_KEY": "bench",
+}
+RATE_LIMIT_TABLE = "bench-ratelimit"
+
+def load_container(n: int):
+    spec = importlib.util.spec_from_file_location(f"bench_visitor_{n}", os.path.join(VISITOR_DIR, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[max(1, math.ceil(p / 100 * len(values))) - 1]
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--containers", type=int, default=4)
+    ap.add_argument("--readers", type=int, default=40)
+    ap.add_argument("--abusers", type=int, default=3)
+    ap.add_argument("--seconds", type=float, default=10.0)
+    ap.add_argument("--shared", action="store_true", help="also enforce the DynamoDB sliding window")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    os.environ.update(HANDLER_ENV)
+    if args.shared:
+        os.environ["RATE_LIMIT_TABLE"] = RATE_LIMIT_TABLE
+    sys.path[:0] = [LAYER_DIR, VISITOR_DIR]
+    import boto3
+    from moto import mock_aws
+    from common import clients
+
+    with mock_aws():
+        db = boto3.client("dynamodb")
+        for name, key in ((HANDLER_ENV["VISITOR_TABLE"], "path"), (RATE_LIMIT_TABLE, "limitKey")):
+            db.create_table(TableName=name, KeySchema=[{"AttributeName": key, "KeyType": "HASH"}],
+                            AttributeDefinitions=[{"AttributeName": key, "AttributeType": "S"}],
+                            BillingMode="PAY_PER_REQUEST")
+        writes = Counter()
+        lock = threading.Lock()
+        def count_write(params, **_):
+            with lock:
+                writes[params.get("TableName", "")] += 1
+        clients.ddb().meta.events.register("provide-client-params.dynamodb.UpdateItem", count_write)
+
+        containers = [load_container(n) for n in range(args.containers)]
+        spec = containers[0].limiter.limits["visitor"]
+        results = defaultdict(lambda: {"status": Counter(), "ok_ms": [], "rejected_ms": []})
+        deadline = time.monotonic() + args.seconds
+        rng = random.Random(args.seed)
+
+        def client_loop(kind: str, ip: str, seed: int):
+            r = random.Random(seed)
+            out = results[(kind, ip)]
+            event = {"queryStringParameters": {"path": "/aws-updates.html"},
+                     "requestContext": {"identity": {"sourceIp": ip}}}
+            while time.monotonic() < deadline:
+                handler = r.choice(containers)
+                start = time.perf_counter()
+                resp = handler.lambda_handler(event, None)
+                ms = (time.perf_counter() - start) * 1000
+                out["status"][resp["statusCode"]] += 1
+                out["ok_ms" if resp["statusCode"] == 200 else "rejected_ms"].append(ms)
+                if kind == "reader":
+                    time.sleep(r.uniform(0.5, 3.0))
+
+        threads = [threading.Thread(target=client_loop, args=("reader", f"198.51.100.{i}", rng.random()))
+                   for i in range(args.readers)]
+        threads += [threading.Thread(target=client_loop, args=("abuser", f"203.0.113.{i}", rng.random()))
+                    for i in range(args.abusers)]
+        started = time.monotonic()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        elapsed = time.monotonic() - started
+
+    per_container = spec["burst"] + spec["rate"] * elapsed
+    allowed_max = per_container * args.containers
+    if args.shared:
+        allowed_max = min(allowed_max, spec["limit"] * (1 + elapsed / spec["window"]))
+    print(f"{args.containers} containers, {args.readers} readers, {args.abusers} abusers, {elapsed:.1f}s; "
+          f"limit rate={spec['rate']}/s burst={spec['burst']}"
+          + (f", shared {spec['limit']}/{spec['window']}s" if args.shared else ""))
+    print(f"{'client':<8} {'requests':>9} {'200':>7} {'429':>7} {'ok p50 ms':>10} {'429 p50 ms':>11} {'429 p99 ms':>11}")
+    failed = False
+    for kind in ("reader", "abuser"):
+        rows = [v for (k, _), v in results.items() if k == kind]
+        status = sum((r["status"] for r in rows), Counter())
+        ok_ms = [m for r in rows for m in r["ok_ms"]]
+        rejected_ms = [m for r in rows for m in r["rejected_ms"]]
+        print(f"{kind:<8} {sum(status.values()):>9,} {status[200]:>7,} {status[429]:>7,} "
+              f"{percentile(ok_ms, 50):>10.2f} {percentile(rejected_ms, 50):>11.3f} {percentile(rejected_ms, 99):>11.3f}")
+        if kind == "reader" and status[429]:
+            failed = True
+            print(f"  FAIL: {status[429]} reader requests were rejected")
+        if kind == "abuser":
+            worst = max((r["status"][200] for r in rows), default=0)
+            print(f"  most accepted from one abuser: {worst} (allowed at most {allowed_max:.0f})")
+            if worst > allowed_max:
+                failed = True
+                print("  FAIL: an abuser got past its limit")
+    print(f"DynamoDB writes: {writes[HANDLER_ENV['VISITOR_TABLE']]:,} counter, {writes[RATE_LIMIT_TABLE]:,} rate limit")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
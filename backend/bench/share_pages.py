@@ -0,0 +1,91 @@
+"""Check that share pages only point at site files that exist.
+
+Renders a functions/fetch_rss/share_pages.py page for a row without
+`imageUrl`, collects every URL on SITE_BASE_URL (og:image, twitter:image, the
+inline image, the weekly view link) and looks each one up under site/. Crawlers
+ignore SVG cards, so the image URLs must also be PNG or JPEG files, at least
+600 px wide for LinkedIn's large card. Fails listing the broken URLs; run it
+after changing DEFAULT_IMAGE_PATH or moving site assets.
+
+Usage:
+    python bench/share_pages.py
+"""
+import argparse
+import os
+import re
+import sys
+import struct
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SITE_DIR = os.path.join(os.path.dirname(BACKEND_DIR), "site")
+sys.path.insert(0, os.path.join(BACKEND_DIR, "layers", "common", "python"))
+sys.path.insert(0, os.path.join(BACKEND_DIR, "functions", "fetch_rss"))
+import share_pages  # noqa: E402
+
+BASE_URL = "https://acloudresume.com"
+IMAGE_TAGS = re.compile(r'<meta (?:property|name)="(?:og|twitter):image" content="([^"]*)"|<img src="([^"]*)"')
+LINKS = re.compile(r'href="([^"]*)"')
+MIN_IMAGE_WIDTH = 600
+
+ROW = {
+    "updateId": "0123456789abcdef",
+    "weekKey": "2026-W42",
+    "title": "Amazon S3 adds a bench check",
+    "link": "https://aws.amazon.com/about-aws/whats-new/2026/10/",
+    "publishedAt": "2026-10-14T09:00:00+00:00",
+    "category": "Storage",
+    "summary": "A short summary.",
+}
+
+def site_file(url: str) -> str | None:
+    """Path under site/ for a URL on BASE_URL (query and fragment dropped); None if off-site."""
+    if not url.startswith(BASE_URL + "/"):
+        return None
+    path = url[len(BASE_URL) + 1:].split("#", 1)[0].split("?", 1)[0]
+    return os.path.join(SITE_DIR, *path.split("/"))
+
+def raster_width(path: str) -> int:
+    """Width of a PNG or JPEG file, 0 for anything else."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return struct.unpack(">I", data[16:20])[0]
+    if data.startswith(b"\xff\xd8"):
+        i = 2
+        while i + 9 < len(data):
+            marker, length = data[i + 1], struct.unpack(">H", data[i + 2:i + 4])[0]
+            # SOF0..SOF15, except DHT (c4), JPG (c8) and DAC (cc)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                return struct.unpack(">H", data[i + 7:i + 9])[0]
+            i += 2 + length
+    return 0
+
+def check(row: dict) -> list[str]:
+    page = share_pages.render_page(row, BASE_URL, "updates/")
+    problems = []
+    images = {a or b for a, b in IMAGE_TAGS.findall(page)}
+    # The canonical link is the page itself, which lives in the bucket
+    own = share_pages.page_url(BASE_URL, "updates/", row["updateId"])
+    for url in sorted(images | set(LINKS.findall(page)) - {own}):
+        path = site_file(url)
+        if path is None:
+            continue
+        if not os.path.isfile(path):
+            problems.append(f"{url}: no such file {os.path.relpath(path, SITE_DIR)}")
+        elif url in images and raster_width(path) < MIN_IMAGE_WIDTH:
+            problems.append(f"{url}: not a PNG/JPEG at least {MIN_IMAGE_WIDTH} px wide")
+    return problems
+
+def main(argv=None):
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args(argv)
+    # Rows with their own imageUrl point at generated images in the bucket,
+    # not the site, so the fallback is the case to check
+    problems = check(ROW)
+    print(f"{'FAIL' if problems else 'ok  '} share page without imageUrl "
+          f"(DEFAULT_IMAGE_PATH {share_pages.DEFAULT_IMAGE_PATH})")
+    for p in problems:
+        print(f"     {p}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
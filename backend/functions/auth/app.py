@@ -1,53 +1,60 @@
 import os
 import json
 import time
-import boto3
-import urllib.request
 import urllib.parse
 
-dynamodb = boto3.resource('dynamodb')
-users_table = dynamodb.Table(os.environ['USERS_TABLE'])
+import providers
+from common.clients import ddb, to_item
+from common.ratelimit import RateLimiter
 
-# OAuth credentials from environment
-GOOGLE_CLIENT_ID = os.environ.get('GOOGLE_CLIENT_ID', '')
-GOOGLE_CLIENT_SECRET = os.environ.get('GOOGLE_CLIENT_SECRET', '')
-GITHUB_CLIENT_ID = os.environ.get('GITHUB_CLIENT_ID', '')
-GITHUB_CLIENT_SECRET = os.environ.get('GITHUB_CLIENT_SECRET', '')
-LINKEDIN_CLIENT_ID = os.environ.get('LINKEDIN_CLIENT_ID', '')
-LINKEDIN_CLIENT_SECRET = os.environ.get('LINKEDIN_CLIENT_SECRET', '')
-REDIRECT_URI = os.environ['REDIRECT_URI']
-SITE_URL = os.environ['SITE_URL']
+USERS_TABLE = os.environ['USERS_TABLE']
+
+# auth-simple.yaml sets SITE_URL, auth-template.yaml sets SITE_BASE_URL
+SITE_URL = (os.environ.get('SITE_URL') or os.environ['SITE_BASE_URL']).rstrip('/')
+# Function URL deployments pass an explicit REDIRECT_URI; otherwise the
+# callback is routed through the site itself.
+REDIRECT_URI = os.environ.get('REDIRECT_URI') or f'{SITE_URL}/auth/callback'
+
+# Both routes are public: the callback writes a user, stats runs a Scan
+limiter = RateLimiter()
 
 def lambda_handler(event, context):
     path = event.get('rawPath') or event.get('path', '')
     
     if path.endswith('/auth/callback'):
+        if limiter.check('auth.callback', event):
+            return redirect_error('Too many sign-in attempts, please try again later')
         return handle_oauth_callback(event)
     
-    if path.endswith('/auth/stats'):
+    if path.endswith('/auth/stats') or path.endswith('/auth/count'):
+        retry_after = limiter.check('auth.stats', event)
+        if retry_after:
+            return {
+                'statusCode': 429,
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*',
+                    'Retry-After': str(retry_after)
+                },
+                'body': json.dumps({'error': 'Too many requests'})
+            }
         return get_user_stats()
     
     return {'statusCode': 404, 'body': json.dumps({'error': 'Not found'})}
 
 def handle_oauth_callback(event):
     try:
-        qs = event.get('queryStringParameters', {})
+        qs = event.get('queryStringParameters') or {}
         code = qs.get('code')
         provider = qs.get('state', 'google')
         
         if not code:
             return redirect_error('Missing authorization code')
         
-        # Handle different providers
-        if provider == 'google':
-            user_info = handle_google_oauth(code)
-        elif provider == 'github':
-            user_info = handle_github_oauth(code)
-        elif provider == 'linkedin':
-            user_info = handle_linkedin_oauth(code)
-        else:
+        if provider not in providers.PROVIDERS:
             return redirect_error('Invalid provider')
         
+        user_info = providers.fetch_user(provider, code, REDIRECT_URI)
         if not user_info:
             return redirect_error('Failed to get user info')
         
@@ -63,133 +70,6 @@ def handle_oauth_callback(event):
         print(f"OAuth error: {str(e)}")
         return redirect_error(str(e))
 
-def handle_google_oauth(code):
-    """Handle Google OAuth flow"""
-    # Exchange code for token
-    token_url = 'https://oauth2.googleapis.com/token'
-    data = {
-        'code': code,
-        'client_id': GOOGLE_CLIENT_ID,
-        'client_secret': GOOGLE_CLIENT_SECRET,
-        'redirect_uri': REDIRECT_URI,
-        'grant_type': 'authorization_code'
-    }
-    
-    req = urllib.request.Request(
-        token_url,
-        data=urllib.parse.urlencode(data).encode(),
-        headers={'Content-Type': 'application/x-www-form-urlencoded'}
-    )
-    
-    with urllib.request.urlopen(req) as response:
-        token_data = json.loads(response.read())
-    
-    access_token = token_data.get('access_token')
-    if not access_token:
-        return None
-    
-    # Get user info
-    userinfo_url = 'https://www.googleapis.com/oauth2/v2/userinfo'
-    req = urllib.request.Request(
-        userinfo_url,
-        headers={'Authorization': f'Bearer {access_token}'}
-    )
-    
-    with urllib.request.urlopen(req) as response:
-        return json.loads(response.read())
-
-def handle_github_oauth(code):
-    """Handle GitHub OAuth flow"""
-    # Exchange code for token
-    token_url = 'https://github.com/login/oauth/access_token'
-    data = {
-        'code': code,
-        'client_id': GITHUB_CLIENT_ID,
-        'client_secret': GITHUB_CLIENT_SECRET,
-        'redirect_uri': REDIRECT_URI
-    }
-    
-    req = urllib.request.Request(
-        token_url,
-        data=urllib.parse.urlencode(data).encode(),
-        headers={'Accept': 'application/json'}
-    )
-    
-    with urllib.request.urlopen(req) as response:
-        token_data = json.loads(response.read())
-    
-    access_token = token_data.get('access_token')
-    if not access_token:
-        return None
-    
-    # Get user info
-    user_req = urllib.request.Request(
-        'https://api.github.com/user',
-        headers={'Authorization': f'Bearer {access_token}'}
-    )
-    
-    with urllib.request.urlopen(user_req) as response:
-        user_data = json.loads(response.read())
-    
-    # Get email if not public
-    if not user_data.get('email'):
-        email_req = urllib.request.Request(
-            'https://api.github.com/user/emails',
-            headers={'Authorization': f'Bearer {access_token}'}
-        )
-        with urllib.request.urlopen(email_req) as response:
-            emails = json.loads(response.read())
-            primary_email = next((e['email'] for e in emails if e['primary']), None)
-            user_data['email'] = primary_email
-    
-    return {
-        'id': str(user_data['id']),
-        'email': user_data.get('email', ''),
-        'name': user_data.get('name') or user_data.get('login'),
-        'picture': user_data.get('avatar_url', '')
-    }
-
-def handle_linkedin_oauth(code):
-    """Handle LinkedIn OAuth flow"""
-    # Exchange code for token
-    token_url = 'https://www.linkedin.com/oauth/v2/accessToken'
-    data = {
-        'code': code,
-        'client_id': LINKEDIN_CLIENT_ID,
-        'client_secret': LINKEDIN_CLIENT_SECRET,
-        'redirect_uri': REDIRECT_URI,
-        'grant_type': 'authorization_code'
-    }
-    
-    req = urllib.request.Request(
-        token_url,
-        data=urllib.parse.urlencode(data).encode(),
-        headers={'Content-Type': 'application/x-www-form-urlencoded'}
-    )
-    
-    with urllib.request.urlopen(req) as response:
-        token_data = json.loads(response.read())
-    
-    access_token = token_data.get('access_token')
-    if not access_token:
-        return None
-    
-    # Get user info
-    user_req = urllib.request.Request(
-        'https://api.linkedin.com/v2/userinfo',
-        headers={'Authorization': f'Bearer {access_token}'}
-    )
-    
-    with urllib.request.urlopen(user_req) as response:
-        user_data = json.loads(response.read())
-    
-    return {
-        'id': user_data.get('sub'),
-        'email': user_data.get('email', ''),
-        'name': user_data.get('name', ''),
-        'picture': user_data.get('picture', '')
-    }
-
 def save_user(user_info, provider):
     """Save user to DynamoDB"""
     user_id = user_info.get('id')
@@ -199,7 +79,7 @@ def save_user(user_info, provider):
     
     timestamp = int(time.time())
     
-    users_table.put_item(Item={
+    ddb().put_item(TableName=USERS_TABLE, Item=to_item({
         'userId': f'{provider}_{user_id}',
         'email': email,
         'name': name,
@@ -208,14 +88,14 @@ def save_user(user_info, provider):
         'registeredAt': timestamp,
         'lastVisit': timestamp,
         'visitCount': 1
-    })
+    }))
     
     return f'{provider}_{user_id}'
 
 def get_user_stats():
     """Get total registered users count"""
     try:
-        response = users_table.scan(Select='COUNT')
+        response = ddb().scan(TableName=USERS_TABLE, Select='COUNT')
         count = response.get('Count', 0)
         
         return {
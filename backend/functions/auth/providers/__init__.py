@@ -0,0 +1,53 @@
+"""OAuth provider registry.
+
+Providers are described by config only; the module implementing a provider is
+imported the first time that provider is used, so a cold start for a Google
+callback never loads the GitHub or LinkedIn code.
+"""
+import os
+import importlib
+
+# name -> module + env vars holding the OAuth app credentials
+PROVIDERS = {
+    'google': {
+        'module': 'providers.google',
+        'client_id_env': 'GOOGLE_CLIENT_ID',
+        'client_secret_env': 'GOOGLE_CLIENT_SECRET',
+    },
+    'github': {
+        'module': 'providers.github',
+        'client_id_env': 'GITHUB_CLIENT_ID',
+        'client_secret_env': 'GITHUB_CLIENT_SECRET',
+    },
+    'linkedin': {
+        'module': 'providers.linkedin',
+        'client_id_env': 'LINKEDIN_CLIENT_ID',
+        'client_secret_env': 'LINKEDIN_CLIENT_SECRET',
+    },
+}
+
+_loaded = {}
+
+def get_provider(name):
+    """Return the provider module for `name`, or None if it is not registered."""
+    cfg = PROVIDERS.get(name)
+    if not cfg:
+        return None
+    if name not in _loaded:
+        _loaded[name] = importlib.import_module(cfg['module'])
+    return _loaded[name]
+
+def fetch_user(name, code, redirect_uri):
+    """Exchange `code` with provider `name` and return the normalized user info.
+
+    The result has `id`, `email`, `name` and `picture` keys, or is None when the
+    provider did not hand back an access token.
+    """
+    cfg = PROVIDERS[name]
+    provider = get_provider(name)
+    return provider.fetch_user(
+        code,
+        redirect_uri,
+        os.environ.get(cfg['client_id_env'], ''),
+        os.environ.get(cfg['client_secret_env'], ''),
+    )
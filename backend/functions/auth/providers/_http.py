@@ -0,0 +1,21 @@
+"""Small urllib helpers shared by the provider modules."""
+import json
+import urllib.request
+import urllib.parse
+
+def post_form(url, data, headers=None):
+    req = urllib.request.Request(
+        url,
+        data=urllib.parse.urlencode(data).encode(),
+        headers=headers or {'Content-Type': 'application/x-www-form-urlencoded'}
+    )
+    with urllib.request.urlopen(req) as response:
+        return json.loads(response.read())
+
+def get_json(url, access_token):
+    req = urllib.request.Request(
+        url,
+        headers={'Authorization': f'Bearer {access_token}'}
+    )
+    with urllib.request.urlopen(req) as response:
+        return json.loads(response.read())
@@ -0,0 +1,32 @@
+"""GitHub OAuth flow"""
+from providers._http import post_form, get_json
+
+TOKEN_URL = 'https://github.com/login/oauth/access_token'
+USER_URL = 'https://api.github.com/user'
+EMAILS_URL = 'https://api.github.com/user/emails'
+
+def fetch_user(code, redirect_uri, client_id, client_secret):
+    token_data = post_form(TOKEN_URL, {
+        'code': code,
+        'client_id': client_id,
+        'client_secret': client_secret,
+        'redirect_uri': redirect_uri
+    }, headers={'Accept': 'application/json'})
+
+    access_token = token_data.get('access_token')
+    if not access_token:
+        return None
+
+    user_data = get_json(USER_URL, access_token)
+
+    # Get email if not public
+    if not user_data.get('email'):
+        emails = get_json(EMAILS_URL, access_token)
+        user_data['email'] = next((e['email'] for e in emails if e['primary']), '')
+
+    return {
+        'id': str(user_data['id']),
+        'email': user_data.get('email', ''),
+        'name': user_data.get('name') or user_data.get('login'),
+        'picture': user_data.get('avatar_url', '')
+    }
@@ -0,0 +1,26 @@
+"""Google OAuth flow"""
+from providers._http import post_form, get_json
+
+TOKEN_URL = 'https://oauth2.googleapis.com/token'
+USERINFO_URL = 'https://www.googleapis.com/oauth2/v2/userinfo'
+
+def fetch_user(code, redirect_uri, client_id, client_secret):
+    token_data = post_form(TOKEN_URL, {
+        'code': code,
+        'client_id': client_id,
+        'client_secret': client_secret,
+        'redirect_uri': redirect_uri,
+        'grant_type': 'authorization_code'
+    })
+
+    access_token = token_data.get('access_token')
+    if not access_token:
+        return None
+
+    user_data = get_json(USERINFO_URL, access_token)
+    return {
+        'id': str(user_data.get('id', '')),
+        'email': user_data.get('email', ''),
+        'name': user_data.get('name', ''),
+        'picture': user_data.get('picture', '')
+    }
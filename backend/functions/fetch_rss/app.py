@@ -1,19 +1,52 @@
-import os, json, hashlib, urllib.request, email.utils, datetime
-import boto3
-from xml.etree import ElementTree as ET
+import os, json, time
 
-ddb = boto3.resource("dynamodb")
-bedrock = boto3.client("bedrock-runtime")
+from common.clients import client, ddb, to_item, from_item
+from common.metrics import model_metrics
+from common.tracing import subsegment, traced
+from summary_cache import SummaryCache, summary_key
+from images import ImageStage, image_key
+from prompt import PROMPT_VERSION, summary_prompt, titan_text_request, titan_output_text
+from streaming import stream_summary
+from feed_parser import parse_feed
+from neardup import DynamoLshIndex, find_duplicates
+from digest import refresh_digests
+from share_pages import SharePages
+from feeds import FeedStates, load_registry, is_due, fetch_all, canonical_link, link_id, FEED_STATE_TABLE
 
 UPDATES_TABLE = os.environ["UPDATES_TABLE"]
-RSS_FEED_URL = os.environ["RSS_FEED_URL"]
 SITE_BASE_URL = os.environ.get("SITE_BASE_URL", "https://acloudresume.com").rstrip("/")
 TEXT_MODEL_ID = os.environ.get("TEXT_MODEL_ID", "amazon.titan-text-express-v1")
+IMAGE_MODEL_ID = os.environ.get("IMAGE_MODEL_ID", "amazon.titan-image-generator-v1")
+SITE_BUCKET = os.environ.get("SITE_BUCKET", "")
+GENERATED_PREFIX = os.environ.get("GENERATED_PREFIX", "assets/generated/")
 GENERATE_SUMMARY = os.environ.get("GENERATE_SUMMARY", "true").lower() == "true"
+SUMMARY_CACHE_TABLE = os.environ.get("SUMMARY_CACHE_TABLE", "")
+SUMMARY_CACHE_TTL_DAYS = int(os.environ.get("SUMMARY_CACHE_TTL_DAYS", "0"))
+GENERATE_IMAGES = os.environ.get("GENERATE_IMAGES", "true").lower() == "true" and bool(SITE_BUCKET)
+IMAGE_BUDGET = int(os.environ.get("IMAGE_BUDGET", "4"))
+IMAGE_CONCURRENCY = int(os.environ.get("IMAGE_CONCURRENCY", "2"))
+# Stream summaries and stop once the sentence + two bullets are complete
+STREAM_SUMMARIES = os.environ.get("STREAM_SUMMARIES", "false").lower() == "true"
+SUMMARY_DEADLINE_SECONDS = float(os.environ.get("SUMMARY_DEADLINE_SECONDS", "30"))
+# Group region re-announcements under the original; see neardup.py
+DETECT_NEAR_DUPLICATES = os.environ.get("DETECT_NEAR_DUPLICATES", "true").lower() == "true"
+NEARDUP_TABLE = os.environ.get("NEARDUP_TABLE", "")
+NEARDUP_WINDOW_DAYS = int(os.environ.get("NEARDUP_WINDOW_DAYS", "30"))
+# Static per-update pages with OpenGraph tags, for link previews; see share_pages.py
+GENERATE_SHARE_PAGES = os.environ.get("GENERATE_SHARE_PAGES", "true").lower() == "true" and bool(SITE_BUCKET)
+SHARE_PREFIX = os.environ.get("SHARE_PREFIX", "updates/")
 
-def iso_week_key(dt: datetime.datetime) -> str:
-    year, week, _ = dt.isocalendar()
-    return f"{year}-W{week:02d}"
+# DynamoDB BatchGetItem / BatchWriteItem request limits
+GET_BATCH = 100
+WRITE_BATCH = 25
+BATCH_RETRIES = 5
+
+FEED_REGISTRY = load_registry()
+feed_states = FeedStates(FEED_STATE_TABLE)
+summary_cache = SummaryCache(SUMMARY_CACHE_TABLE, SUMMARY_CACHE_TTL_DAYS)
+image_stage = ImageStage(SITE_BUCKET, GENERATED_PREFIX, SITE_BASE_URL, IMAGE_MODEL_ID,
+                         budget=IMAGE_BUDGET, concurrency=IMAGE_CONCURRENCY)
+share_pages = SharePages(SITE_BUCKET, SHARE_PREFIX, SITE_BASE_URL)
 
 def classify(title: str, categories: list[str]) -> str:
     t = (title or "").lower()
@@ -41,90 +74,192 @@ def classify(title: str, categories: list[str]) -> str:
         return "Networking"
     return "Other"
 
+@traced()
 def summarize_with_titan(title: str, link: str, category: str) -> str:
-    prompt = f"""You are writing a short, accurate AWS What's New blurb for a weekly roundup.
-Title: {title}
-Category: {category}
-Link: {link}
-
-Write:
-- 1 sentence (<= 25 words): what changed.
-- 2 bullets: why it matters, who should care.
-
-No speculation. Plain text."""
-    body = json.dumps({
-        "inputText": prompt,
-        "textGenerationConfig": {
-            "maxTokenCount": 220,
-            "temperature": 0.2,
-            "topP": 0.9
-        }
-    })
-    resp = bedrock.invoke_model(
-        modelId=TEXT_MODEL_ID,
-        body=body,
-        accept="application/json",
-        contentType="application/json"
-    )
-    data = json.loads(resp["body"].read())
-    return ((data.get("results") or [{}])[0].get("outputText","") or "").strip()
-
-def parse_rss(xml_bytes: bytes) -> list[dict]:
-    root = ET.fromstring(xml_bytes)
-    channel = root.find("channel") or root.find("{*}channel")
-    if channel is None:
-        return []
-
-    items = []
-    for item in channel.findall("item"):
-        title = (item.findtext("title") or "").strip()
-        link = (item.findtext("link") or "").strip()
-        pub = (item.findtext("pubDate") or "").strip()
-        cats = [c.text.strip() for c in item.findall("category") if c.text]
-        guid = (item.findtext("guid") or link or title).strip()
+    if STREAM_SUMMARIES:
+        summary, complete = stream_summary(TEXT_MODEL_ID, title, link, category, SUMMARY_DEADLINE_SECONDS)
+        if not complete:
+            raise TimeoutError(f"summary stream passed its {SUMMARY_DEADLINE_SECONDS:.0f}s deadline")
+        return summary
+
+    body = json.dumps(titan_text_request(summary_prompt(title, link, category)))
+    with model_metrics.call(TEXT_MODEL_ID, "InvokeModel") as call:
+        resp = client("bedrock-runtime").invoke_model(
+            modelId=TEXT_MODEL_ID,
+            body=body,
+            accept="application/json",
+            contentType="application/json"
+        )
+        data = json.loads(resp["body"].read())
+        call.input_tokens = int(data.get("inputTextTokenCount", 0))
+        call.output_tokens = sum(int(r.get("tokenCount", 0)) for r in data.get("results") or [])
+    return titan_output_text(data)
+
+@traced()
+def parse_rss(xml_bytes: bytes, fmt: str = "auto") -> list[dict]:
+    return parse_feed(xml_bytes, fmt)
+
+def _retry_pause(attempt: int):
+    time.sleep(min(0.05 * 2 ** attempt, 1.0))
+
+def get_existing(db, items: list[dict]) -> dict:
+    """Stored rows for the feed items, keyed by (weekKey, updateId)."""
+    keys = [to_item({"weekKey": it["weekKey"], "updateId": it["updateId"]}) for it in items]
+    out = {}
+    for start in range(0, len(keys), GET_BATCH):
+        pending = keys[start:start + GET_BATCH]
+        with subsegment("dynamodb.batch_get", keys=len(pending)):
+            for attempt in range(BATCH_RETRIES + 1):
+                resp = db.batch_get_item(RequestItems={UPDATES_TABLE: {"Keys": pending}})
+                for raw in resp.get("Responses", {}).get(UPDATES_TABLE, []):
+                    row = from_item(raw)
+                    out[(row["weekKey"], row["updateId"])] = row
+                pending = resp.get("UnprocessedKeys", {}).get(UPDATES_TABLE, {}).get("Keys", [])
+                if not pending:
+                    break
+                _retry_pause(attempt)
+            else:
+                raise RuntimeError(f"{len(pending)} keys still unprocessed after {BATCH_RETRIES} retries")
+    return out
+
+def write_rows(db, rows: list[dict]) -> int:
+    written = 0
+    for start in range(0, len(rows), WRITE_BATCH):
+        pending = [{"PutRequest": {"Item": to_item(r)}} for r in rows[start:start + WRITE_BATCH]]
+        with subsegment("dynamodb.batch_write", items=len(pending)):
+            for attempt in range(BATCH_RETRIES + 1):
+                batch = len(pending)
+                resp = db.batch_write_item(RequestItems={UPDATES_TABLE: pending})
+                pending = resp.get("UnprocessedItems", {}).get(UPDATES_TABLE, [])
+                written += batch - len(pending)
+                if not pending:
+                    break
+                _retry_pause(attempt)
+            else:
+                raise RuntimeError(f"{len(pending)} items still unprocessed after {BATCH_RETRIES} retries")
+    return written
+
+def collect_items(event: dict) -> tuple[list[dict], dict, dict]:
+    """Download the due feeds and merge their items, deduped by canonical link.
+
+    `{"force": true}` polls every feed regardless of its interval and
+    `{"sources": [...]}` limits the run to those feeds. Also returns the new
+    feed state per source, for feeds that came back unchanged or parsed; the
+    handler saves them once the rows are written.
+    """
+    now = time.time()
+    wanted = set(event.get("sources") or [])
+    feeds = [f for f in FEED_REGISTRY
+             if (not wanted or f["source"] in wanted)
+             and (event.get("force") or wanted or is_due(f, feed_states.get(f["source"]), now))]
 
+    items, seen, status, states = [], set(), {}, {}
+    for res in fetch_all(feeds, feed_states):
+        feed = res["feed"]
+        status[feed["source"]] = res["error"] or res["status"]
+        # A failed download keeps the old validators and is retried next run
+        if res["error"]:
+            continue
+        if not res["body"]:
+            states[feed["source"]] = res["state"]
+            continue
         try:
-            dt = email.utils.parsedate_to_datetime(pub)
-        except Exception:
-            dt = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc)
+            parsed = parse_rss(res["body"], feed["format"])
+        except Exception as e:
+            print(f"Parse failed for {feed['source']}: {e}")
+            status[feed["source"]] = f"parse error: {e}"
+            continue
+        states[feed["source"]] = res["state"]
+        for it in parsed:
+            # Registry order decides which feed owns an article seen in several
+            link = canonical_link(it["link"]) if it["link"] else ""
+            if link and link in seen:
+                continue
+            seen.add(link)
+            if feed["idFrom"] == "link" and link:
+                it["updateId"] = link_id(link)
+            it["source"] = feed["source"]
+            items.append(it)
+    return items, status, states
 
-        update_id = hashlib.sha1(guid.encode("utf-8")).hexdigest()[:16]
-        items.append({
-            "updateId": update_id,
-            "title": title,
-            "link": link,
-            "publishedAt": dt.astimezone(datetime.timezone.utc).isoformat(),
-            "weekKey": iso_week_key(dt),
-            "rawCategories": cats
-        })
-    return items
+def fill_from_canonicals(db, rows: list[dict], dups: dict):
+    """Give each near-duplicate its canonical update's summary and image."""
+    by_id = {r["updateId"]: r for r in rows}
+    missing = {(c["weekKey"], c["updateId"]): c for c in dups.values() if c["updateId"] not in by_id}
+    stored = get_existing(db, list(missing.values())) if missing else {}
+    for r in rows:
+        c = dups.get(r["updateId"])
+        src = c and (by_id.get(c["updateId"]) or stored.get((c["weekKey"], c["updateId"])))
+        if not src:
+            continue
+        if src.get("summary"):
+            r["summary"], r["summaryKey"] = src["summary"], src.get("summaryKey", "")
+        if src.get("imageUrl"):
+            r["imageUrl"] = src["imageUrl"]
 
-def lambda_handler(event, context):
-    table = ddb.Table(UPDATES_TABLE)
+def attach_images(rows: list[dict], dups: dict) -> int:
+    """Set imageUrl on rows that have none (duplicates take their canonical's).
 
-    with urllib.request.urlopen(RSS_FEED_URL, timeout=15) as r:
-        xml_bytes = r.read()
+    One shared image per (category, title bucket); see images.py. Returns
+    the number of images generated.
+    """
+    needs_image = [r for r in rows if not r["imageUrl"] and r["updateId"] not in dups]
+    if not needs_image:
+        return 0
+    try:
+        with subsegment("images", rows=len(needs_image)):
+            urls = image_stage.resolve(needs_image)
+    except Exception as e:
+        print(f"Image stage failed: {e}")
+        return 0
+    for r in needs_image:
+        r["imageUrl"] = urls.get(image_key(r["category"], r["title"], IMAGE_MODEL_ID), "")
+    return image_stage.generated
 
-    items = parse_rss(xml_bytes)
-    upserts = 0
+def lambda_handler(event, context):
+    db = ddb()
+    summary_cache.reset_stats()
+    model_metrics.reset()
 
-    for it in items:
+    items, feed_status, new_states = collect_items(event or {})
+    # The feed occasionally repeats an entry; keep the last one per key
+    items = list({(it["weekKey"], it["updateId"]): it for it in items}.values())
+    with subsegment("classify", items=len(items)):
+        categories = [classify(it["title"], it.get("rawCategories", [])) for it in items]
+    existing_rows = get_existing(db, items)
+    sigs, dups = {}, {}
+    if DETECT_NEAR_DUPLICATES:
+        with subsegment("near_duplicates", items=len(items)):
+            index = DynamoLshIndex(db, NEARDUP_TABLE, NEARDUP_WINDOW_DAYS) if NEARDUP_TABLE else None
+            sigs, dups = find_duplicates(items, existing_rows, index)
+    rows = []
+
+    for it, category in zip(items, categories):
         week_key = it["weekKey"]
         update_id = it["updateId"]
-        category = classify(it["title"], it.get("rawCategories", []))
 
-        existing = table.get_item(Key={"weekKey": week_key, "updateId": update_id}).get("Item")
+        existing = existing_rows.get((week_key, update_id))
         summary = (existing or {}).get("summary", "")
         image_url = (existing or {}).get("imageUrl", "")
+        key = summary_key(it["title"], it["link"], category, TEXT_MODEL_ID, PROMPT_VERSION)
+        # Rows written before the cache existed have no summaryKey; keep theirs
+        stored_key = (existing or {}).get("summaryKey", key if summary else "")
 
-        if GENERATE_SUMMARY and not summary:
-            try:
-                summary = summarize_with_titan(it["title"], it["link"], category)
-            except Exception as e:
-                print(f"Summary generation failed: {e}")
-                summary = ""
+        canonical = dups.get(update_id)
+        # Duplicates take the canonical's summary below instead of their own
+        if GENERATE_SUMMARY and not canonical and (not summary or stored_key != key):
+            fresh = summary_cache.get(key)
+            if not fresh:
+                try:
+                    fresh = summarize_with_titan(it["title"], it["link"], category)
+                    summary_cache.put(key, fresh, TEXT_MODEL_ID, PROMPT_VERSION)
+                except Exception as e:
+                    print(f"Summary generation failed: {e}")
+            # On failure keep whatever summary the row already had
+            if fresh:
+                summary, stored_key = fresh, key
 
-        table.put_item(Item={
+        rows.append({
             "weekKey": week_key,
             "updateId": update_id,
             "title": it["title"],
@@ -133,9 +268,43 @@ def lambda_handler(event, context):
             "category": category,
             "tags": it.get("rawCategories", [])[:8],
             "summary": summary,
+            "summaryKey": stored_key,
             "imageUrl": image_url or "",
-            "source": "aws-whats-new-rss"
+            "source": it["source"]
         })
-        upserts += 1
+        if update_id in sigs:
+            rows[-1]["simhash"] = f"{sigs[update_id]:016x}"
+        if canonical:
+            rows[-1].update(duplicateOf=canonical["updateId"], canonicalWeek=canonical["weekKey"])
+
+    images_generated = attach_images(rows, dups) if GENERATE_IMAGES else 0
+    if dups:
+        fill_from_canonicals(db, rows, dups)
+    pages_written = 0
+    if GENERATE_SHARE_PAGES:
+        with subsegment("share_pages", rows=len(rows)):
+            pages_written = share_pages.publish(rows, existing_rows)
+    upserts = write_rows(db, rows)
+    # Only now: with the new validators saved, the next poll of these feeds
+    # is a 304 and their items would not be seen again
+    for source, state in new_states.items():
+        feed_states.put(source, state)
+
+    digests = []
+    try:
+        digests = refresh_digests(db, UPDATES_TABLE, {r["weekKey"] for r in rows}, SITE_BASE_URL, TEXT_MODEL_ID)
+    except Exception as e:
+        print(f"Digest refresh failed: {e}")
 
-    return {"statusCode": 200, "body": json.dumps({"count": upserts})}
+    run_summary = model_metrics.emit_summary("FetchRss")
+    return {"statusCode": 200, "body": json.dumps({
+        "count": upserts,
+        "feeds": feed_status,
+        "modelCostUsd": run_summary["costUsd"],
+        "imagesGenerated": images_generated,
+        "nearDuplicates": len(dups),
+        "sharePagesWritten": pages_written,
+        "digestsRebuilt": digests,
+        "summaryCacheHits": summary_cache.hits,
+        "summaryCacheMisses": summary_cache.misses
+    })}
@@ -0,0 +1,154 @@
+"""Move old weeks out of AwsUpdatesTable into the S3 archive (see common/archive.py).
+
+Runs weekly. For each week older than ARCHIVE_AFTER_WEEKS that still has rows
+without `expiresAt`:
+- every row of the week is read and merged with the week's existing partition
+  (a row stored again since the last run replaces its archived copy), the
+  partition is rewritten and the week recorded in the manifest;
+- the rows are then put back with `expiresAt` = now + ARCHIVE_GRACE_DAYS, so
+  DynamoDB TTL deletes them. The grace period leaves time to notice a bad
+  export before the hot copy is gone; get_updates already serves the week
+  from the archive once the manifest lists it.
+
+The table therefore only holds the last ARCHIVE_AFTER_WEEKS weeks, and the
+full history is a directory of small files (`download` copies it locally).
+
+Usage (from backend/functions/fetch_rss, with layers/common/python on PYTHONPATH):
+    python archive.py run [--after-weeks 26] [--dry-run]
+    python archive.py download ./archive     # every partition + weeks.json, for local analytics
+"""
+import os, sys, json, time, argparse, datetime
+
+from common.archive import (ARCHIVE_BUCKET, ARCHIVE_PREFIX, load_manifest, save_manifest,
+                            read_partition, write_partition, partition_key, manifest_key)
+from common.clients import client, ddb, to_item, from_item
+from common.tracing import subsegment
+
+UPDATES_TABLE = os.environ.get("UPDATES_TABLE", "")
+ARCHIVE_AFTER_WEEKS = int(os.environ.get("ARCHIVE_AFTER_WEEKS", "26"))
+ARCHIVE_GRACE_DAYS = int(os.environ.get("ARCHIVE_GRACE_DAYS", "7"))
+WRITE_BATCH = 25
+BATCH_RETRIES = 5
+
+def cutoff_week(now: datetime.datetime, after_weeks: int) -> str:
+    """Weeks that sort before this one are archived."""
+    year, week, _ = (now - datetime.timedelta(weeks=after_weeks)).isocalendar()
+    return f"{year}-W{week:02d}"
+
+def archivable_weeks(db, cutoff: str) -> list[str]:
+    """Weeks before `cutoff` with at least one row not yet marked for expiry."""
+    weeks = set()
+    kwargs = {"TableName": UPDATES_TABLE, "ProjectionExpression": "weekKey, expiresAt"}
+    while True:
+        with subsegment("dynamodb.scan"):
+            resp = db.scan(**kwargs)
+        for item in resp.get("Items", []):
+            week = item["weekKey"]["S"]
+            if week < cutoff and "expiresAt" not in item:
+                weeks.add(week)
+        if not resp.get("LastEvaluatedKey"):
+            return sorted(weeks)
+        kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+def week_rows(db, week_key: str) -> list[dict]:
+    out, last = [], None
+    while True:
+        kwargs = {
+            "TableName": UPDATES_TABLE,
+            "KeyConditionExpression": "weekKey = :w",
+            "ExpressionAttributeValues": {":w": {"S": week_key}},
+        }
+        if last:
+            kwargs["ExclusiveStartKey"] = last
+        resp = db.query(**kwargs)
+        out.extend(from_item(i) for i in resp.get("Items", []))
+        last = resp.get("LastEvaluatedKey")
+        if not last:
+            return out
+
+def mark_expiring(db, rows: list[dict], expires_at: int) -> int:
+    written = 0
+    for start in range(0, len(rows), WRITE_BATCH):
+        pending = [{"PutRequest": {"Item": to_item({**r, "expiresAt": expires_at})}}
+                   for r in rows[start:start + WRITE_BATCH]]
+        for attempt in range(BATCH_RETRIES + 1):
+            batch = len(pending)
+            resp = db.batch_write_item(RequestItems={UPDATES_TABLE: pending})
+            pending = resp.get("UnprocessedItems", {}).get(UPDATES_TABLE, [])
+            written += batch - len(pending)
+            if not pending:
+                break
+            time.sleep(min(0.05 * 2 ** attempt, 1.0))
+        else:
+            raise RuntimeError(f"{len(pending)} items still unprocessed after {BATCH_RETRIES} retries")
+    return written
+
+def archive_week(db, bucket: str, week_key: str, manifest: dict, expires_at: int, dry_run: bool = False) -> int:
+    hot = week_rows(db, week_key)
+    merged = {r["updateId"]: r for r in read_partition(bucket, week_key)}
+    merged.update({r["updateId"]: {k: v for k, v in r.items() if k != "expiresAt"} for r in hot})
+    if dry_run:
+        return len(hot)
+    with subsegment("archive.write", week=week_key, items=len(merged)):
+        entry = write_partition(bucket, week_key, list(merged.values()))
+    manifest["weeks"][week_key] = {**entry, "archivedAt": datetime.datetime.now(datetime.timezone.utc).isoformat()}
+    # Recorded before the rows start expiring, so readers switch to the file first
+    save_manifest(bucket, manifest)
+    with subsegment("dynamodb.mark_expiring", week=week_key, items=len(hot)):
+        mark_expiring(db, [r for r in hot if "expiresAt" not in r], expires_at)
+    return len(hot)
+
+def run(db, bucket: str, after_weeks: int = ARCHIVE_AFTER_WEEKS, dry_run: bool = False) -> dict:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cutoff = cutoff_week(now, after_weeks)
+    weeks = archivable_weeks(db, cutoff)
+    manifest = load_manifest(bucket)
+    manifest.setdefault("weeks", {})
+    expires_at = int(now.timestamp()) + ARCHIVE_GRACE_DAYS * 86400
+    archived, rows, failed = [], 0, []
+    for week_key in weeks:
+        try:
+            rows += archive_week(db, bucket, week_key, manifest, expires_at, dry_run)
+            archived.append(week_key)
+        except Exception as e:
+            print(f"Archiving {week_key} failed: {e}")
+            failed.append(week_key)
+    return {"cutoff": cutoff, "weeks": archived, "rows": rows, "failed": failed, "dryRun": dry_run}
+
+def download(bucket: str, dest: str) -> int:
+    """Copy weeks.json and every partition under `dest`, keeping the partition layout."""
+    manifest = load_manifest(bucket)
+    keys = [partition_key(w) for w in sorted(manifest.get("weeks", {}))] + [manifest_key()]
+    s3 = client("s3")
+    for key in keys:
+        path = os.path.join(dest, key[len(ARCHIVE_PREFIX):])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        s3.download_file(bucket, key, path)
+    return len(keys) - 1
+
+def lambda_handler(event, context):
+    if not ARCHIVE_BUCKET:
+        return {"statusCode": 200, "body": json.dumps({"skipped": "ARCHIVE_BUCKET is not set"})}
+    result = run(ddb(), ARCHIVE_BUCKET, int((event or {}).get("afterWeeks") or ARCHIVE_AFTER_WEEKS),
+                 bool((event or {}).get("dryRun")))
+    return {"statusCode": 200, "body": json.dumps(result)}
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Archive old weeks of AwsUpdatesTable to S3")
+    ap.add_argument("--bucket", default=ARCHIVE_BUCKET)
+    sub = ap.add_subparsers(dest="command", required=True)
+    r = sub.add_parser("run", help="archive weeks older than --after-weeks and mark their rows to expire")
+    r.add_argument("--after-weeks", type=int, default=ARCHIVE_AFTER_WEEKS)
+    r.add_argument("--dry-run", action="store_true", help="report the weeks, write nothing")
+    d = sub.add_parser("download", help="copy the archive to a local directory")
+    d.add_argument("dest")
+    args = ap.parse_args(argv)
+    if not args.bucket:
+        ap.error("--bucket (or ARCHIVE_BUCKET) is required")
+    if args.command == "run":
+        print(json.dumps(run(ddb(), args.bucket, args.after_weeks, args.dry_run), indent=2))
+    else:
+        print(f"Downloaded {download(args.bucket, args.dest)} weeks to {args.dest}")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+"""Re-summarize historical updates with one Bedrock batch-inference job.
+
+When TEXT_MODEL_ID or the prompt changes, re-summarizing months of rows one
+invoke_model call at a time is slow and throttles. This tool runs the work as
+a single batch job instead, in four resumable phases:
+
+  export  find rows with no summary or a stale summaryKey, write them as a
+          JSONL batch input and upload it
+  submit  create the model invocation job
+  wait    poll until the job finishes
+  merge   stream the job output back and apply it with batched conditional
+          updates (rows changed since export are left alone)
+
+Progress is kept in a state file, so `run` picks up from the last completed
+phase, and a merge interrupted part-way resumes at the next unmerged line.
+
+With --local DIR, storage and the batch job API are replaced by a file-based
+stand-in that "runs" the job immediately with a stub summarizer, which is
+handy for trying the flow end to end against a local DynamoDB.
+
+Usage (from backend/functions/fetch_rss, with layers/common/python on PYTHONPATH):
+    python backfill.py run --state backfill.json --bucket BUCKET --role-arn ARN [--weeks 2025-W01 ...]
+    python backfill.py run --state backfill.json --local ./backfill-local
+    python backfill.py status --state backfill.json
+"""
+import os, sys, json, time, argparse, datetime
+
+from common.clients import client, ddb
+from common.metrics import model_metrics, BATCH_DISCOUNT
+from prompt import PROMPT_VERSION, summary_prompt, titan_text_request, titan_output_text
+from summary_cache import SummaryCache, summary_key
+
+PHASES = ["export", "submit", "wait", "merge", "done"]
+# Bedrock rejects batch jobs below this many records
+MIN_BATCH_RECORDS = 100
+TRANSACT_BATCH = 25
+TERMINAL_STATUSES = {"Completed", "PartiallyCompleted", "Failed", "Stopped", "Expired"}
+
+# ---- storage ---------------------------------------------------------------
+
+def _split_s3(uri: str) -> tuple[str, str]:
+    bucket, _, key = uri[len("s3://"):].partition("/")
+    return bucket, key
+
+class S3Store:
+    def put_file(self, path: str, uri: str):
+        bucket, key = _split_s3(uri)
+        client("s3").upload_file(path, bucket, key)
+
+    def list(self, prefix_uri: str) -> list[str]:
+        bucket, prefix = _split_s3(prefix_uri)
+        out = []
+        for page in client("s3").get_paginator("list_objects_v2").paginate(Bucket=bucket, Prefix=prefix):
+            out.extend(f"s3://{bucket}/{o['Key']}" for o in page.get("Contents", []))
+        return sorted(out)
+
+    def iter_lines(self, uri: str):
+        bucket, key = _split_s3(uri)
+        body = client("s3").get_object(Bucket=bucket, Key=key)["Body"]
+        for line in body.iter_lines():
+            yield line.decode("utf-8")
+
+class LocalStore:
+    """Stand-in for S3 where URIs are plain paths under a local directory."""
+
+    def put_file(self, path: str, uri: str):
+        os.makedirs(os.path.dirname(uri), exist_ok=True)
+        if os.path.abspath(path) != os.path.abspath(uri):
+            with open(path, "rb") as src, open(uri, "wb") as dst:
+                dst.write(src.read())
+
+    def list(self, prefix_uri: str) -> list[str]:
+        out = []
+        for root, _, files in os.walk(prefix_uri):
+            out.extend(os.path.join(root, f) for f in files)
+        return sorted(out)
+
+    def iter_lines(self, uri: str):
+        with open(uri, "r", encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\n")
+
+# ---- batch job API -----------------------------------------------------------
+
+def stub_summarizer(model_input: dict) -> str:
+    title = next((l[len("Title: "):] for l in model_input.get("inputText", "").splitlines()
+                  if l.startswith("Title: ")), "this update")
+    return f"{title} is now available.\n- Why it matters: backfilled locally.\n- Who should care: testers."
+
+class LocalBatchJobs:
+    """File-based stand-in for the bedrock create/get_model_invocation_job API.
+
+    The job is executed synchronously on creation; outputs are written in the
+    same layout Bedrock uses (<output>/<job id>/<input name>.out).
+    """
+
+    def __init__(self, summarize=stub_summarizer):
+        self.summarize = summarize
+        self.jobs = {}
+
+    def create_model_invocation_job(self, jobName, roleArn, modelId, inputDataConfig, outputDataConfig, **_):
+        src = inputDataConfig["s3InputDataConfig"]["s3Uri"]
+        out_dir = os.path.join(outputDataConfig["s3OutputDataConfig"]["s3Uri"], jobName)
+        os.makedirs(out_dir, exist_ok=True)
+        with open(src, "r", encoding="utf-8") as f, \
+                open(os.path.join(out_dir, os.path.basename(src) + ".out"), "w", encoding="utf-8") as out:
+            for line in f:
+                rec = json.loads(line)
+                text = self.summarize(rec["modelInput"])
+                rec["modelOutput"] = {
+                    "inputTextTokenCount": len(rec["modelInput"]["inputText"].split()),
+                    "results": [{"tokenCount": len(text.split()), "outputText": text,
+                                 "completionReason": "FINISH"}]
+                }
+                out.write(json.dumps(rec) + "\n")
+        arn = f"local:{jobName}"
+        self.jobs[arn] = "Completed"
+        return {"jobArn": arn}
+
+    def get_model_invocation_job(self, jobIdentifier):
+        return {"jobArn": jobIdentifier, "status": self.jobs.get(jobIdentifier, "Completed")}
+
+# ---- state -------------------------------------------------------------------
+
+def load_state(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_state(path: str, state: dict):
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+# ---- phases ------------------------------------------------------------------
+
+def _stale_rows(table: str, model_id: str, weeks: list[str]):
+    names = {"#w": "weekKey", "#u": "updateId", "#t": "title", "#l": "link",
+             "#c": "category", "#s": "summary", "#k": "summaryKey"}
+    base = {"TableName": table, "ProjectionExpression": ", ".join(names), "ExpressionAttributeNames": names}
+    requests = []
+    if weeks:
+        for w in weeks:
+            requests.append(("query", dict(base, KeyConditionExpression="#w = :w",
+                                           ExpressionAttributeValues={":w": {"S": w}})))
+    else:
+        requests.append(("scan", base))
+
+    db = ddb()
+    for op, kwargs in requests:
+        last = None
+        while True:
+            if last:
+                kwargs["ExclusiveStartKey"] = last
+            resp = getattr(db, op)(**kwargs)
+            for item in resp.get("Items", []):
+                row = {k: v.get("S", "") for k, v in item.items()}
+                key = summary_key(row.get("title", ""), row.get("link", ""),
+                                  row.get("category", ""), model_id, PROMPT_VERSION)
+                if not row.get("summary") or row.get("summaryKey") != key:
+                    yield row, key
+            last = resp.get("LastEvaluatedKey")
+            if not last:
+                break
+
+def export(state: dict, store, work_dir: str, force: bool = False):
+    input_path = os.path.join(work_dir, "input.jsonl")
+    manifest_path = os.path.join(work_dir, "records.jsonl")
+    count = 0
+    with open(input_path, "w", encoding="utf-8") as inp, open(manifest_path, "w", encoding="utf-8") as man:
+        for row, key in _stale_rows(state["updatesTable"], state["modelId"], state.get("weeks") or []):
+            record_id = f"R{count:010d}"
+            prompt = summary_prompt(row.get("title", ""), row.get("link", ""), row.get("category", ""))
+            inp.write(json.dumps({"recordId": record_id, "modelInput": titan_text_request(prompt)}) + "\n")
+            man.write(json.dumps({"recordId": record_id, "weekKey": row["weekKey"],
+                                  "updateId": row["updateId"], "summaryKey": key}) + "\n")
+            count += 1
+
+    state["records"] = count
+    state["manifest"] = manifest_path
+    if count == 0:
+        print("No stale rows; nothing to backfill")
+        state["phase"] = "done"
+        return
+    if count < MIN_BATCH_RECORDS and not force and not state.get("local"):
+        raise SystemExit(f"Only {count} stale rows; Bedrock batch jobs need at least "
+                         f"{MIN_BATCH_RECORDS}. The hourly run will catch these up (or pass --force).")
+    store.put_file(input_path, state["inputUri"])
+    print(f"Exported {count} rows to {state['inputUri']}")
+    state["phase"] = "submit"
+
+def submit(state: dict, jobs):
+    resp = jobs.create_model_invocation_job(
+        jobName=state["jobName"],
+        roleArn=state.get("roleArn") or "",
+        modelId=state["modelId"],
+        inputDataConfig={"s3InputDataConfig": {"s3Uri": state["inputUri"]}},
+        outputDataConfig={"s3OutputDataConfig": {"s3Uri": state["outputUri"]}}
+    )
+    state["jobArn"] = resp["jobArn"]
+    print(f"Submitted {state['jobArn']}")
+    state["phase"] = "wait"
+
+def wait(state: dict, jobs, poll_seconds: int = 60):
+    while True:
+        status = jobs.get_model_invocation_job(jobIdentifier=state["jobArn"]).get("status", "")
+        state["jobStatus"] = status
+        if status in TERMINAL_STATUSES:
+            break
+        print(f"{datetime.datetime.now():%H:%M:%S} job {status}; next check in {poll_seconds}s")
+        time.sleep(poll_seconds)
+    if status not in ("Completed", "PartiallyCompleted"):
+        raise SystemExit(f"Batch job ended with status {status}")
+    state["phase"] = "merge"
+
+def _load_manifest(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return {r["recordId"]: r for r in map(json.loads, f)}
+
+def _update_request(table: str, rec: dict, summary: str) -> dict:
+    return {
+        "TableName": table,
+        "Key": {"weekKey": {"S": rec["weekKey"]}, "updateId": {"S": rec["updateId"]}},
+        "UpdateExpression": "SET #s = :s, #k = :k",
+        # Skip rows deleted or already re-summarized since the export
+        "ConditionExpression": "attribute_exists(updateId) AND (attribute_not_exists(#k) OR #k <> :k)",
+        "ExpressionAttributeNames": {"#s": "summary", "#k": "summaryKey"},
+        "ExpressionAttributeValues": {":s": {"S": summary}, ":k": {"S": rec["summaryKey"]}},
+    }
+
+def _apply_batch(batch: list[dict]) -> int:
+    """Apply conditional updates; returns how many were written."""
+    db = ddb()
+    try:
+        db.transact_write_items(TransactItems=[{"Update": u} for u in batch])
+        return len(batch)
+    except Exception as e:
+        if "TransactionCanceled" not in type(e).__name__ and "TransactionCanceled" not in str(e):
+            raise
+    # A condition failed somewhere in the batch; fall back to one by one
+    written = 0
+    for u in batch:
+        try:
+            db.update_item(**u)
+            written += 1
+        except Exception as e:
+            if "ConditionalCheckFailed" not in type(e).__name__ and "ConditionalCheckFailed" not in str(e):
+                raise
+    return written
+
+def merge(state: dict, store, state_path: str, cache: SummaryCache):
+    records = _load_manifest(state["manifest"])
+    progress = state.setdefault("merged", {})
+    totals = state.setdefault("mergeTotals", {"written": 0, "skipped": 0, "errors": 0})
+    outputs = [u for u in store.list(state["outputUri"]) if u.endswith(".jsonl.out")]
+    # Usage of the lines merged by this invocation (resumed runs report the rest)
+    tokens = {"input": 0, "output": 0, "records": 0}
+
+    for uri in outputs:
+        done = progress.get(uri, 0)
+        batch, line_no = [], 0
+
+        def flush():
+            if batch:
+                written = _apply_batch(batch)
+                totals["written"] += written
+                totals["skipped"] += len(batch) - written
+                batch.clear()
+            progress[uri] = line_no
+            save_state(state_path, state)
+
+        for line_no, line in enumerate(store.iter_lines(uri), start=1):
+            if line_no <= done or not line.strip():
+                continue
+            out = json.loads(line)
+            usage = out.get("modelOutput") or {}
+            tokens["input"] += int(usage.get("inputTextTokenCount", 0))
+            tokens["output"] += sum(int(r.get("tokenCount", 0)) for r in usage.get("results") or [])
+            tokens["records"] += 1
+            rec = records.get(out.get("recordId"))
+            summary = titan_output_text(out.get("modelOutput") or {}) if rec else ""
+            if not summary:
+                totals["errors"] += 1
+                continue
+            cache.put(rec["summaryKey"], summary, state["modelId"], PROMPT_VERSION)
+            batch.append(_update_request(state["updatesTable"], rec, summary))
+            if len(batch) >= TRANSACT_BATCH:
+                flush()
+        flush()
+
+    print(f"Merged: {totals['written']} written, {totals['skipped']} skipped, {totals['errors']} errors")
+    model_metrics.add_usage(state["modelId"], "BatchInference", tokens["input"], tokens["output"],
+                            calls=tokens["records"], discount=BATCH_DISCOUNT)
+    print(json.dumps(model_metrics.summary(), indent=2))
+    state["phase"] = "done"
+
+# ---- CLI ---------------------------------------------------------------------
+
+def init_state(args) -> dict:
+    run_id = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%d%H%M%S")
+    if args.local:
+        base = os.path.join(os.path.abspath(args.local), run_id)
+    else:
+        if not args.bucket or not args.role_arn:
+            raise SystemExit("--bucket and --role-arn are required unless --local is used")
+        base = f"s3://{args.bucket}/{args.prefix.strip('/')}/{run_id}"
+    return {
+        "phase": "export",
+        "local": bool(args.local),
+        "jobName": f"summary-backfill-{run_id}",
+        "roleArn": args.role_arn,
+        "modelId": args.model_id,
+        "promptVersion": PROMPT_VERSION,
+        "updatesTable": args.updates_table,
+        "summaryCacheTable": args.summary_cache_table,
+        "weeks": args.weeks or [],
+        "inputUri": f"{base}/input/input.jsonl",
+        "outputUri": f"{base}/output/",
+    }
+
+def run(args):
+    state = load_state(args.state)
+    if not state or state.get("phase") == "done" and args.restart:
+        state = init_state(args)
+        save_state(args.state, state)
+    if state.get("promptVersion") != PROMPT_VERSION:
+        raise SystemExit("PROMPT_VERSION changed since this backfill started; use --restart")
+
+    store = LocalStore() if state["local"] else S3Store()
+    jobs = LocalBatchJobs() if state["local"] else client("bedrock")
+    cache = SummaryCache(state.get("summaryCacheTable", ""), args.cache_ttl_days)
+    work_dir = os.path.dirname(os.path.abspath(args.state))
+
+    while state["phase"] != "done":
+        phase = state["phase"]
+        if phase == "export":
+            export(state, store, work_dir, force=args.force)
+        elif phase == "submit":
+            submit(state, jobs)
+        elif phase == "wait":
+            wait(state, jobs, args.poll_seconds)
+        elif phase == "merge":
+            merge(state, store, args.state, cache)
+        save_state(args.state, state)
+    print("Backfill complete")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Backfill update summaries with Bedrock batch inference")
+    ap.add_argument("command", choices=["run", "status"])
+    ap.add_argument("--state", required=True, help="state file (created on first run)")
+    ap.add_argument("--bucket", help="S3 bucket for batch input/output")
+    ap.add_argument("--prefix", default="bedrock-batch/summaries")
+    ap.add_argument("--role-arn", help="service role Bedrock assumes to read/write the bucket")
+    ap.add_argument("--local", metavar="DIR", help="use the file-based stand-in instead of S3 + Bedrock")
+    ap.add_argument("--weeks", nargs="*", help="only these ISO weeks (default: whole table)")
+    ap.add_argument("--model-id", default=os.environ.get("TEXT_MODEL_ID", "amazon.titan-text-express-v1"))
+    ap.add_argument("--updates-table", default=os.environ.get("UPDATES_TABLE", ""))
+    ap.add_argument("--summary-cache-table", default=os.environ.get("SUMMARY_CACHE_TABLE", ""))
+    ap.add_argument("--cache-ttl-days", type=int, default=int(os.environ.get("SUMMARY_CACHE_TTL_DAYS", "0")))
+    ap.add_argument("--poll-seconds", type=int, default=60)
+    ap.add_argument("--force", action="store_true", help=f"submit even below {MIN_BATCH_RECORDS} records")
+    ap.add_argument("--restart", action="store_true", help="start a new backfill if the last one finished")
+    args = ap.parse_args(argv)
+
+    if args.command == "status":
+        print(json.dumps(load_state(args.state), indent=2, sort_keys=True))
+        return
+    if not args.updates_table:
+        ap.error("--updates-table (or UPDATES_TABLE) is required")
+    run(args)
+
+if __name__ == "__main__":
+    main()
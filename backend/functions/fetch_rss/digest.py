@@ -0,0 +1,184 @@
+"""Weekly digest: the LinkedIn roundup, built once per week on the server.
+
+The site used to build the roundup in the browser (weeklySummaryText in
+site/assets/aws-updates.js) from the whole week's items. After ingest,
+fetch_rss rebuilds the digest of every week it touched and stores it in
+DIGEST_TABLE, where get_updates serves it from /digest?week=.
+
+A digest is only rebuilt when the week's content hash changes: the hash covers
+what the digest shows (ids, titles, links, categories, publish times, grouping)
+plus DIGEST_VERSION and the intro settings. With DIGEST_INTRO=true a short
+Bedrock-written intro is added, so a model call happens at most once per change.
+
+The row under LATEST_KEY names the newest digested week, so /digest without a
+week is two GetItems rather than a scan for the week list.
+"""
+import os, json, time, hashlib, datetime
+
+from common.clients import client, to_item, from_item
+from common.metrics import model_metrics
+from common.tracing import subsegment
+from prompt import digest_intro_prompt, titan_text_request, titan_output_text
+
+DIGEST_TABLE = os.environ.get("DIGEST_TABLE", "")
+DIGEST_INTRO = os.environ.get("DIGEST_INTRO", "false").lower() == "true"
+# Bump when the digest layout changes so every stored digest is rebuilt
+DIGEST_VERSION = "1"
+# Not a week: {"latestWeek": <newest weekKey with a digest>}
+LATEST_KEY = "latest"
+TOP_ITEMS = 30
+ITEMS_PER_CATEGORY = 7
+
+CATEGORY_ICONS = {
+    "Serverless": "⚡", "AI & GenAI": "🤖", "AI Agents": "🧠", "DevOps & Observability": "🔧",
+    "Containers & Kubernetes": "🧩", "Security": "🔒", "Data & Analytics": "📊", "Databases": "🗄️",
+    "Storage": "🪣", "Networking": "🌐", "Other": "🗞️",
+}
+HASHTAGS = "#AWS #AWSWeekly #Cloud #Serverless #AWSLambda #EventBridge #GenAI #AmazonBedrock #DevOps #Observability"
+
+def week_range_label(week_key: str) -> str:
+    try:
+        year, week = week_key.split("-W")
+        start = datetime.date.fromisocalendar(int(year), int(week), 1)
+    except ValueError:
+        return ""
+    end = start + datetime.timedelta(days=6)
+    return f"{start:%b %d} – {end:%b %d, %Y}"
+
+def update_url(site_base_url: str, row: dict) -> str:
+    return f"{site_base_url}/aws-updates.html?week={row['weekKey']}#{row['updateId']}"
+
+def top_items(rows: list[dict]) -> list[dict]:
+    """Newest first, near-duplicates left out (their canonical already stands for them)."""
+    rows = [r for r in rows if not r.get("duplicateOf")]
+    rows.sort(key=lambda r: r.get("publishedAt", ""), reverse=True)
+    return rows[:TOP_ITEMS]
+
+def content_hash(week_key: str, rows: list[dict], text_model_id: str) -> str:
+    h = hashlib.sha256(f"{DIGEST_VERSION}|{DIGEST_INTRO}|{text_model_id if DIGEST_INTRO else ''}|{week_key}".encode("utf-8"))
+    for r in sorted(rows, key=lambda r: r["updateId"]):
+        h.update("\x1f".join([r["updateId"], r.get("title", ""), r.get("link", ""), r.get("category", ""),
+                              r.get("publishedAt", ""), r.get("duplicateOf", "")]).encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()[:32]
+
+def group_by_category(items: list[dict], site_base_url: str) -> list[dict]:
+    # Categories in order of their newest item, like the client used to do
+    groups = {}
+    for r in items:
+        groups.setdefault(r.get("category") or "Other", []).append({
+            "updateId": r["updateId"],
+            "title": r.get("title", ""),
+            "url": update_url(site_base_url, r),
+        })
+    return [{"category": c, "icon": CATEGORY_ICONS.get(c, "🗞️"), "items": entries}
+            for c, entries in groups.items()]
+
+def render_text(week_key: str, intro: str, categories: list[dict], site_base_url: str) -> str:
+    lines = [f"🚀 AWS Weekly Roundup — {week_key} ({week_range_label(week_key)})",
+             "📣 Skimmable updates for Serverless • AI/GenAI • Agents • DevOps", ""]
+    if intro:
+        lines += [intro, ""]
+    for group in categories:
+        lines.append(f"{group['icon']} {group['category']}")
+        lines += [f"• {e['title']} — {e['url']}" for e in group["items"][:ITEMS_PER_CATEGORY]]
+        lines.append("")
+    lines += [f"🔗 Full list: {site_base_url}/aws-updates.html?week={week_key}", "", HASHTAGS]
+    return "\n".join(lines)
+
+def write_intro(text_model_id: str, week_key: str, items: list[dict]) -> str:
+    body = json.dumps(titan_text_request(digest_intro_prompt(week_key, [r.get("title", "") for r in items])))
+    with model_metrics.call(text_model_id, "InvokeModel") as call:
+        resp = client("bedrock-runtime").invoke_model(modelId=text_model_id, body=body,
+                                                      accept="application/json", contentType="application/json")
+        data = json.loads(resp["body"].read())
+        call.input_tokens = int(data.get("inputTextTokenCount", 0))
+        call.output_tokens = sum(int(r.get("tokenCount", 0)) for r in data.get("results") or [])
+    return titan_output_text(data)
+
+def build_digest(week_key: str, rows: list[dict], site_base_url: str, text_model_id: str, digest_hash: str) -> dict:
+    items = top_items(rows)
+    intro = ""
+    if DIGEST_INTRO and items:
+        try:
+            with subsegment("digest.intro", week=week_key):
+                intro = write_intro(text_model_id, week_key, items)
+        except Exception as e:
+            print(f"Digest intro failed for {week_key}: {e}")
+    categories = group_by_category(items, site_base_url)
+    return {
+        "weekKey": week_key,
+        "contentHash": digest_hash,
+        "generatedAt": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "weekRange": week_range_label(week_key),
+        "itemCount": len(items),
+        "intro": intro,
+        "categories": categories,
+        "text": render_text(week_key, intro, categories, site_base_url),
+    }
+
+def stored_hashes(db, week_keys: list[str]) -> dict:
+    keys = [{"weekKey": {"S": w}} for w in week_keys]
+    out = {}
+    for start in range(0, len(keys), 100):
+        pending = keys[start:start + 100]
+        for attempt in range(5):
+            resp = db.batch_get_item(RequestItems={DIGEST_TABLE: {
+                "Keys": pending, "ProjectionExpression": "weekKey, contentHash"}})
+            for raw in resp.get("Responses", {}).get(DIGEST_TABLE, []):
+                row = from_item(raw)
+                out[row["weekKey"]] = row.get("contentHash", "")
+            pending = resp.get("UnprocessedKeys", {}).get(DIGEST_TABLE, {}).get("Keys", [])
+            if not pending:
+                break
+            time.sleep(min(0.05 * 2 ** attempt, 1.0))
+    return out
+
+def week_rows(db, updates_table: str, week_key: str) -> list[dict]:
+    """Every stored row of the week, with only the fields a digest uses."""
+    out, last = [], None
+    while True:
+        kwargs = {
+            "TableName": updates_table,
+            "KeyConditionExpression": "weekKey = :w",
+            "ExpressionAttributeValues": {":w": {"S": week_key}},
+            "ProjectionExpression": "weekKey, updateId, title, link, category, publishedAt, duplicateOf",
+        }
+        if last:
+            kwargs["ExclusiveStartKey"] = last
+        resp = db.query(**kwargs)
+        out.extend(from_item(i) for i in resp.get("Items", []))
+        last = resp.get("LastEvaluatedKey")
+        if not last:
+            return out
+
+def set_latest(db, week_key: str):
+    """Point LATEST_KEY at `week_key` unless it already names a newer week."""
+    try:
+        db.put_item(TableName=DIGEST_TABLE,
+                    Item={"weekKey": {"S": LATEST_KEY}, "latestWeek": {"S": week_key}},
+                    ConditionExpression="attribute_not_exists(latestWeek) OR latestWeek < :w",
+                    ExpressionAttributeValues={":w": {"S": week_key}})
+    except Exception as e:
+        if "ConditionalCheckFailed" not in type(e).__name__ and "ConditionalCheckFailed" not in str(e):
+            raise
+
+def refresh_digests(db, updates_table: str, week_keys, site_base_url: str, text_model_id: str) -> list[str]:
+    """Rebuild the digest of each week whose content changed; returns the rebuilt weeks."""
+    if not DIGEST_TABLE or not week_keys:
+        return []
+    with subsegment("digest.hash", weeks=len(week_keys)):
+        rows = {w: week_rows(db, updates_table, w) for w in sorted(week_keys)}
+        hashes = {w: content_hash(w, r, text_model_id) for w, r in rows.items()}
+        stored = stored_hashes(db, list(hashes))
+    rebuilt = []
+    for week_key, digest_hash in hashes.items():
+        if stored.get(week_key) == digest_hash:
+            continue
+        digest = build_digest(week_key, rows[week_key], site_base_url, text_model_id, digest_hash)
+        db.put_item(TableName=DIGEST_TABLE, Item=to_item(digest))
+        rebuilt.append(week_key)
+    # A week's first digest is always a rebuild, so the newest one is in here
+    if rebuilt:
+        set_latest(db, max(rebuilt))
+    return rebuilt
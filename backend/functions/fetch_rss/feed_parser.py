@@ -0,0 +1,126 @@
+"""One parser for RSS 2.0, RSS 1.0 (RDF) and Atom feeds.
+
+Every adapter yields the item dict fetch_rss has always stored:
+updateId (sha1 of the guid / id), title, link, publishedAt (UTC ISO 8601),
+weekKey and rawCategories. Elements are matched on their full
+`{namespace}name` tag through a per-(format, namespace) lookup table built
+once, so a feed that declares a default namespace parses the same as one that
+doesn't, and `media:title` never shadows `title`. Feed dates repeat a lot
+(same day, same second), so parsed dates are memoized.
+"""
+import hashlib, email.utils, datetime
+from functools import lru_cache
+from xml.etree import ElementTree as ET
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+RSS1_NS = "http://purl.org/rss/1.0/"
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+UTC = datetime.timezone.utc
+
+def iso_week_key(dt: datetime.datetime) -> str:
+    year, week, _ = dt.isocalendar()
+    return f"{year}-W{week:02d}"
+
+@lru_cache(maxsize=512)
+def split_tag(tag: str) -> tuple[str, str]:
+    if tag[:1] == "{":
+        ns, _, local = tag[1:].partition("}")
+        return ns, local
+    return "", tag
+
+def _q(ns: str, local: str) -> str:
+    return f"{{{ns}}}{local}" if ns else local
+
+@lru_cache(maxsize=64)
+def field_map(kind: str, ns: str) -> dict:
+    """Full tag -> field name for the children of an item/entry in namespace `ns`."""
+    if kind == "atom":
+        return {_q(ns, "title"): "title", _q(ns, "link"): "link", _q(ns, "published"): "date",
+                _q(ns, "updated"): "updated", _q(ns, "category"): "category", _q(ns, "id"): "guid"}
+    return {_q(ns, "title"): "title", _q(ns, "link"): "link", _q(ns, "pubDate"): "date",
+            _q(ns, "category"): "category", _q(ns, "guid"): "guid",
+            _q(DC_NS, "date"): "updated", _q(DC_NS, "subject"): "category"}
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> datetime.datetime | None:
+    """RFC 822 (RSS) or ISO 8601 (Atom, dc:date); None when unparseable."""
+    text = (text or "").strip()
+    if not text:
+        return None
+    try:
+        if text[:4].isdigit():
+            dt = datetime.datetime.fromisoformat(text.replace("Z", "+00:00"))
+        else:
+            dt = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
+
+def make_item(title: str, link: str, date_text: str, categories: list[str], guid: str) -> dict:
+    guid = (guid or link or title).strip()
+    dt = parse_date(date_text) or datetime.datetime.now(UTC)
+    return {
+        "updateId": hashlib.sha1(guid.encode("utf-8")).hexdigest()[:16],
+        "title": title,
+        "link": link,
+        "publishedAt": dt.astimezone(UTC).isoformat(),
+        "weekKey": iso_week_key(dt),
+        "rawCategories": categories,
+    }
+
+def _read_fields(kind: str, el) -> dict:
+    fields = field_map(kind, split_tag(el.tag)[0])
+    out = {"categories": []}
+    for child in el:
+        name = fields.get(child.tag)
+        if name is None:
+            continue
+        if name == "category":
+            # Atom puts the category in an attribute, RSS in the text
+            value = child.get("term") if kind == "atom" else child.text
+            if value and value.strip():
+                out["categories"].append(value.strip())
+        elif name == "link" and kind == "atom":
+            if "link" not in out and child.get("rel", "alternate") == "alternate":
+                out["link"] = child.get("href", "")
+        elif name not in out:
+            out[name] = child.text or ""
+    return out
+
+def _item(kind: str, el, guid_default: str = "") -> dict:
+    f = _read_fields(kind, el)
+    return make_item(f.get("title", "").strip(), f.get("link", "").strip(),
+                     f.get("date") or f.get("updated", ""), f["categories"],
+                     f.get("guid") or guid_default)
+
+def parse_rss2(root) -> list[dict]:
+    items = []
+    for channel in root:
+        if split_tag(channel.tag)[1] != "channel":
+            continue
+        items.extend(_item("rss", el) for el in channel if split_tag(el.tag)[1] == "item")
+    return items
+
+def parse_rdf(root) -> list[dict]:
+    # RSS 1.0 items are siblings of the channel; rdf:about is the identifier
+    about = _q(RDF_NS, "about")
+    return [_item("rss", el, el.get(about, "")) for el in root if split_tag(el.tag)[1] == "item"]
+
+def parse_atom(root) -> list[dict]:
+    return [_item("atom", el) for el in root if split_tag(el.tag)[1] == "entry"]
+
+ADAPTERS = {"rss": parse_rss2, "rdf": parse_rdf, "atom": parse_atom}
+ROOTS = {"rss": "rss", "RDF": "rdf", "feed": "atom"}
+
+def detect_format(root) -> str:
+    return ROOTS.get(split_tag(root.tag)[1], "")
+
+def parse_feed(xml_bytes: bytes, fmt: str = "auto") -> list[dict]:
+    """Parse a feed document; `fmt` is "auto" or a key of ADAPTERS."""
+    root = ET.fromstring(xml_bytes)
+    kind = detect_format(root) if fmt == "auto" else fmt
+    adapter = ADAPTERS.get(kind)
+    if adapter is None:
+        return []
+    return adapter(root)
@@ -0,0 +1,137 @@
+"""Feed registry and concurrent, conditional feed downloads.
+
+Each registry entry names a feed (`source`, stored on every row it produces),
+its URL, how often it is worth polling and which parser handles it ("rss",
+"rdf", "atom" or "auto"; see feed_parser.py). A run downloads every due feed
+at once (capped at FEED_CONCURRENCY), sending the ETag / Last-Modified seen
+last time so unchanged feeds come back as a cheap 304. Validators and poll
+times are kept per container and in FEED_STATE_TABLE, so they survive cold
+starts; they are only saved after the run has stored the feed's items.
+
+`idFrom` picks how updateIds are derived: "guid" (what the What's New feed has
+always used) or "link", which hashes the canonical link so the same article
+reached through two feeds lands on the same row.
+"""
+import os, json, time, hashlib, urllib.request, urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+from common.clients import ddb, to_item, from_item
+from common.tracing import subsegment
+from summary_cache import normalize_link
+
+FEED_STATE_TABLE = os.environ.get("FEED_STATE_TABLE", "")
+FEED_CONCURRENCY = int(os.environ.get("FEED_CONCURRENCY", "4"))
+FEED_TIMEOUT = float(os.environ.get("FEED_TIMEOUT", "15"))
+USER_AGENT = "aCloudResume-updates/1.0 (+https://acloudresume.com)"
+# The hourly schedule drifts by a few seconds; don't skip a feed for that
+POLL_SLACK_SECONDS = 120
+
+FEEDS = [
+    {"source": "aws-whats-new-rss", "url": os.environ.get("RSS_FEED_URL", ""),
+     "intervalMinutes": 60, "format": "rss", "idFrom": "guid"},
+    {"source": "aws-security-bulletins", "url": "https://aws.amazon.com/security/security-bulletins/rss/feed/",
+     "intervalMinutes": 60, "format": "rss", "idFrom": "link"},
+    {"source": "aws-blog-compute", "url": "https://aws.amazon.com/blogs/compute/feed/",
+     "intervalMinutes": 180, "format": "rss", "idFrom": "link"},
+    {"source": "aws-blog-machine-learning", "url": "https://aws.amazon.com/blogs/machine-learning/feed/",
+     "intervalMinutes": 180, "format": "rss", "idFrom": "link"},
+    {"source": "aws-blog-devops", "url": "https://aws.amazon.com/blogs/devops/feed/",
+     "intervalMinutes": 180, "format": "rss", "idFrom": "link"},
+    # The posts behind site/data/posts.json
+    {"source": "devto-subhashbohra", "url": "https://dev.to/feed/subhashbohra",
+     "intervalMinutes": 360, "format": "rss", "idFrom": "link"},
+]
+
+def load_registry() -> list[dict]:
+    """FEEDS, or the list in the FEEDS_JSON env var when set."""
+    raw = os.environ.get("FEEDS_JSON", "")
+    feeds = FEEDS
+    if raw:
+        try:
+            feeds = json.loads(raw)
+        except ValueError:
+            print("Ignoring invalid FEEDS_JSON")
+    defaults = {"intervalMinutes": 60, "format": "auto", "idFrom": "link"}
+    return [dict(defaults, **f) for f in feeds if f.get("url") and f.get("source")]
+
+def canonical_link(link: str) -> str:
+    base, _, query = (link or "").strip().split("#", 1)[0].partition("?")
+    base = normalize_link(base)
+    params = [p for p in query.split("&") if p and not p.startswith("utm_")]
+    return f"{base}?{'&'.join(params)}" if params else base
+
+def link_id(link: str) -> str:
+    return hashlib.sha1(canonical_link(link).encode("utf-8")).hexdigest()[:16]
+
+class FeedStates:
+    """Validators and last poll time per source: per-container dict over a table."""
+
+    def __init__(self, table_name: str = ""):
+        self.table_name = table_name
+        self._states = {}
+
+    def get(self, source: str) -> dict:
+        state = self._states.get(source)
+        if state is None and self.table_name:
+            try:
+                item = ddb().get_item(TableName=self.table_name, Key={"source": {"S": source}}).get("Item")
+                state = from_item(item)
+            except Exception as e:
+                print(f"Feed state read failed for {source}: {e}")
+        state = self._states[source] = state or {"source": source}
+        return state
+
+    def put(self, source: str, state: dict):
+        self._states[source] = state
+        if not self.table_name:
+            return
+        try:
+            ddb().put_item(TableName=self.table_name, Item=to_item(state))
+        except Exception as e:
+            print(f"Feed state write failed for {source}: {e}")
+
+def is_due(feed: dict, state: dict, now: float) -> bool:
+    last = float(state.get("lastPolledAt", 0))
+    return now - last >= feed["intervalMinutes"] * 60 - POLL_SLACK_SECONDS
+
+def fetch_feed(feed: dict, state: dict) -> dict:
+    """Download one feed; returns {"feed", "status", "body", "state", "error"}."""
+    headers = {"User-Agent": USER_AGENT}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("lastModified"):
+        headers["If-Modified-Since"] = state["lastModified"]
+    new_state = dict(state, lastPolledAt=int(time.time()))
+    out = {"feed": feed, "status": 0, "body": None, "state": new_state, "error": ""}
+    with subsegment("fetch_feed", source=feed["source"]) as seg:
+        try:
+            req = urllib.request.Request(feed["url"], headers=headers)
+            with urllib.request.urlopen(req, timeout=FEED_TIMEOUT) as r:
+                out["status"] = getattr(r, "status", 200)
+                out["body"] = r.read()
+                resp_headers = getattr(r, "headers", None) or {}
+                new_state["etag"] = resp_headers.get("ETag", "")
+                new_state["lastModified"] = resp_headers.get("Last-Modified", "")
+        except urllib.error.HTTPError as e:
+            out["status"] = e.code
+            if e.code != 304:
+                out["error"] = f"HTTP {e.code}"
+        except Exception as e:
+            out["error"] = str(e)
+        seg.annotate(status=out["status"])
+    new_state["lastStatus"] = out["status"]
+    return out
+
+def fetch_all(feeds: list[dict], states: FeedStates) -> list[dict]:
+    """Fetch feeds concurrently; results come back in registry order.
+
+    Nothing is saved here: each result's "state" holds the new validators,
+    which the caller puts back only once the feed's items are stored. Saved
+    any earlier, a run that fails after the download would get a 304 next
+    time and never ingest those items.
+    """
+    if not feeds:
+        return []
+    pairs = [(f, states.get(f["source"])) for f in feeds]
+    with ThreadPoolExecutor(max_workers=max(1, min(FEED_CONCURRENCY, len(feeds)))) as pool:
+        return list(pool.map(lambda p: fetch_feed(*p), pairs))
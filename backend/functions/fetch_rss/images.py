@@ -0,0 +1,187 @@
+"""Card images for updates, generated with Bedrock (Titan Image Generator).
+
+Images are shared rather than made per update: every title falls into one of
+IMAGE_BUCKETS buckets per category, and each (category, bucket) pair maps to a
+content-addressed S3 key under GENERATED_PREFIX. An image is generated only
+when that key doesn't exist yet, at most `budget` per run, and several
+generations run concurrently. Thumbnails are cropped and resized to the
+400x176 card and stored as JPEG, which needs Pillow: without it nothing is
+generated and rows keep an empty imageUrl (the site falls back to its stock
+images) rather than getting Titan's full-size PNG.
+
+`python bench/images.py` checks the stage against stubbed Titan and S3.
+"""
+import io, json, base64, hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from common.clients import client
+from common.metrics import model_metrics
+
+# Bump when the prompt or the thumbnail format changes
+IMAGE_PROMPT_VERSION = "1"
+IMAGE_BUCKETS = 6
+CARD_SIZE = (400, 176)
+# Smallest Titan size with the card's ~2.2:1 aspect ratio
+GENERATE_SIZE = (704, 320)
+
+MOTIFS = [
+    "interconnected glowing nodes",
+    "layered isometric cloud blocks",
+    "flowing data streams",
+    "abstract circuit board landscape",
+    "geometric network mesh",
+    "stacked server shapes with light trails",
+]
+
+def title_bucket(title: str) -> int:
+    norm = " ".join((title or "").lower().split())
+    return int(hashlib.sha256(norm.encode("utf-8")).hexdigest(), 16) % IMAGE_BUCKETS
+
+def image_key(category: str, title: str, model_id: str) -> str:
+    """Content-addressed id of the image an update with this title should use."""
+    bucket = title_bucket(title)
+    raw = f"{category}\x1f{bucket}\x1f{model_id}\x1f{IMAGE_PROMPT_VERSION}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:20]
+
+def image_prompt(category: str, bucket: int) -> str:
+    motif = MOTIFS[bucket % len(MOTIFS)]
+    return (f"Flat minimal tech illustration for an AWS {category} news card, {motif}, "
+            f"AWS orange and dark slate color palette, clean background, no text, no logos")
+
+def invoke_titan_image(model_id: str, prompt: str, seed: int) -> bytes:
+    body = json.dumps({
+        "taskType": "TEXT_IMAGE",
+        "textToImageParams": {"text": prompt},
+        "imageGenerationConfig": {
+            "numberOfImages": 1,
+            "width": GENERATE_SIZE[0],
+            "height": GENERATE_SIZE[1],
+            "cfgScale": 8.0,
+            "seed": seed
+        }
+    })
+    with model_metrics.call(model_id, "InvokeModel") as call:
+        resp = client("bedrock-runtime").invoke_model(
+            modelId=model_id,
+            body=body,
+            accept="application/json",
+            contentType="application/json"
+        )
+        data = json.loads(resp["body"].read())
+        call.images = len(data.get("images") or [])
+    return base64.b64decode(data["images"][0])
+
+_pillow = None
+
+def can_resize() -> bool:
+    """Whether Pillow is importable (checked once per container)."""
+    global _pillow
+    if _pillow is None:
+        try:
+            import PIL.Image  # noqa: F401
+            _pillow = True
+        except ImportError:
+            _pillow = False
+    return _pillow
+
+def make_thumbnail(png: bytes) -> bytes:
+    """The 400x176 JPEG card thumbnail of a Titan PNG."""
+    from PIL import Image
+    img = Image.open(io.BytesIO(png)).convert("RGB")
+    # Center-crop to the card aspect ratio, then downscale
+    w, h = img.size
+    target_w = min(w, round(h * CARD_SIZE[0] / CARD_SIZE[1]))
+    target_h = min(h, round(w * CARD_SIZE[1] / CARD_SIZE[0]))
+    left, top = (w - target_w) // 2, (h - target_h) // 2
+    img = img.crop((left, top, left + target_w, top + target_h)).resize(CARD_SIZE, Image.LANCZOS)
+    out = io.BytesIO()
+    img.save(out, format="JPEG", quality=78, optimize=True, progressive=True)
+    return out.getvalue()
+
+def _object_exists(bucket: str, key: str) -> bool:
+    try:
+        client("s3").head_object(Bucket=bucket, Key=key)
+        return True
+    except Exception as e:
+        code = str(getattr(e, "response", {}).get("Error", {}).get("Code", ""))
+        if code in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+
+class ImageStage:
+    def __init__(self, bucket: str, prefix: str, base_url: str, model_id: str,
+                 budget: int = 4, concurrency: int = 2):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.base_url = base_url.rstrip("/")
+        self.model_id = model_id
+        self.budget = budget
+        self.concurrency = concurrency
+        # key -> public URL of images known to exist (kept across warm invocations)
+        self._known = {}
+        self.generated = 0
+        self.failed = 0
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key}.jpg"
+
+    def _url(self, object_key: str) -> str:
+        return f"{self.base_url}/{object_key}"
+
+    def _lookup(self, key: str) -> str:
+        object_key = self._object_key(key)
+        return self._url(object_key) if _object_exists(self.bucket, object_key) else ""
+
+    def _generate(self, key: str, category: str, bucket: int) -> str:
+        seed = int(key[:8], 16) % 2147483646
+        png = invoke_titan_image(self.model_id, image_prompt(category, bucket), seed)
+        object_key = self._object_key(key)
+        client("s3").put_object(
+            Bucket=self.bucket,
+            Key=object_key,
+            Body=make_thumbnail(png),
+            ContentType="image/jpeg",
+            # Keys are content-addressed, so the object never changes
+            CacheControl="public, max-age=31536000, immutable"
+        )
+        return self._url(object_key)
+
+    def resolve(self, items: list[dict]) -> dict:
+        """Map image keys to URLs for `items` (dicts with category and title).
+
+        Existing images are reused; missing ones are generated up to the run
+        budget. Keys that could not be produced are left out.
+        """
+        self.generated = 0
+        self.failed = 0
+        wanted = {}
+        for it in items:
+            key = image_key(it["category"], it["title"], self.model_id)
+            wanted.setdefault(key, (it["category"], title_bucket(it["title"])))
+
+        missing = []
+        for key, spec in wanted.items():
+            if key in self._known:
+                continue
+            url = self._lookup(key)
+            if url:
+                self._known[key] = url
+            else:
+                missing.append((key, spec))
+
+        todo = missing[:max(self.budget, 0)]
+        if todo and not can_resize():
+            print(f"Pillow is not installed; not generating {len(missing)} card images")
+            todo = []
+        if todo:
+            with ThreadPoolExecutor(max_workers=max(self.concurrency, 1)) as pool:
+                futures = {key: pool.submit(self._generate, key, *spec) for key, spec in todo}
+            for key, fut in futures.items():
+                try:
+                    self._known[key] = fut.result()
+                    self.generated += 1
+                except Exception as e:
+                    print(f"Image generation failed for {key}: {e}")
+                    self.failed += 1
+
+        return {key: self._known[key] for key in wanted if key in self._known}
@@ -0,0 +1,211 @@
+"""Near-duplicate detection for updates (SimHash + banded LSH).
+
+AWS re-announces the same launch for more regions ("... now available in AWS
+GovCloud (US)", "... in additional regions"), and each copy used to get its
+own row, summary and image. A 64-bit SimHash of the normalized title (region
+names and availability boilerplate removed) puts such copies within a few bits
+of each other. The signature is cut into BANDS 16-bit bands; any two
+signatures within BANDS - 1 bits share at least one band exactly, so looking
+up the item's bands finds every candidate within MAX_DISTANCE without
+scanning, and each bucket only holds 1/65536 of the index.
+
+Bands live in NEARDUP_TABLE (bucket "<band>:<value>" -> updateId, weekKey,
+simhash), expiring after NEARDUP_WINDOW_DAYS since re-announcements come
+within weeks of the original. `LshIndex` is the in-memory equivalent used for
+items within one run.
+"""
+import os, re, time, hashlib
+from functools import lru_cache
+
+BITS = 64
+BANDS = 4
+BAND_BITS = BITS // BANDS
+# Calibrated on bench/fixtures/neardup.json (the same precision/recall holds
+# from 0 to 13 bits there); must stay below BANDS for the band lookup to be exact
+MAX_DISTANCE = min(int(os.environ.get("NEARDUP_MAX_DISTANCE", "3")), BANDS - 1)
+# Feature counts are summed in 8-bit lanes
+MAX_FEATURES = 127
+
+STOPWORDS = frozenset("""
+a an and are as at by for from in into is it its now of on or the to with
+amazon aws available availability additional expands expanded launches
+launched region regions generally today new adds support supports two three
+four five more
+""".split())
+# Words that only name a location; a launch "in Europe (Milan)" is the same launch
+REGION_WORDS = frozenset("""
+us usa east west north south central northeast northwest southeast southwest
+govcloud gov europe eu asia pacific apac middle canada africa israel mexico
+america americas china sa ap me il ca af mx cn
+ohio virginia oregon california frankfurt ireland london paris stockholm
+milan spain zurich tokyo seoul osaka singapore sydney jakarta melbourne
+hyderabad mumbai hong kong bahrain uae tel aviv montreal calgary cape town
+sao paulo malaysia thailand taipei auckland beijing ningxia
+""".split())
+COUNTED = frozenset(["additional", "more", "new", "region", "regions", "aws"])
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9.+-]*")
+_REGION_CODE = re.compile(r"^[a-z]{2}(-gov)?-[a-z]+-\d$")
+
+def normalize_tokens(title: str) -> list[str]:
+    raw = [t.strip(".-") for t in _TOKEN.findall((title or "").lower())]
+    tokens = []
+    for i, t in enumerate(raw):
+        if not t or t in STOPWORDS or _REGION_CODE.match(t):
+            continue
+        # Plain region words, and "us-west", "asia-pacific", "eu-2"
+        if t in REGION_WORDS or ("-" in t and all(p in REGION_WORDS or p.isdigit() for p in t.split("-") if p)):
+            continue
+        # Bare numbers stay ("Node.js 20" and "Node.js 22" are different
+        # launches) unless they count regions: "in 3 additional regions"
+        if t.isdigit() and i + 1 < len(raw) and raw[i + 1] in COUNTED:
+            continue
+        tokens.append(t)
+    return tokens
+
+def features(title: str) -> list[str]:
+    tokens = normalize_tokens(title)
+    feats = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    return feats[:MAX_FEATURES]
+
+# Spreading a 64-bit hash into 64 8-bit lanes lets one big-int addition count
+# the set bits of every position at once; SPREAD[i][b] spreads byte i.
+SPREAD = [[sum(1 << (8 * (8 * i + j)) for j in range(8) if b >> j & 1) for b in range(256)] for i in range(8)]
+LANE_TOPS = sum(0x80 << (8 * j) for j in range(BITS))
+_LANE_TO_BIT = bytes.maketrans(b"\x00\x80", b"01")
+
+@lru_cache(maxsize=65536)
+def _spread_feature(feature: str) -> int:
+    h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    return sum(SPREAD[i][h >> (8 * i) & 0xFF] for i in range(8))
+
+def simhash(title: str) -> int:
+    feats = features(title)
+    if not feats:
+        return 0
+    counts = sum(_spread_feature(f) for f in feats)
+    # A bit is set where more than half the features have it: bias every lane
+    # so that count > n/2 lands on the lane's top bit, then collect those bits
+    need = len(feats) // 2 + 1
+    biased = counts + (0x80 - need) * (LANE_TOPS // 0x80)
+    lanes = (biased & LANE_TOPS).to_bytes(BITS, "little")
+    return int(lanes[::-1].translate(_LANE_TO_BIT), 2)
+
+def distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+def bands(sig: int) -> list[str]:
+    mask = (1 << BAND_BITS) - 1
+    return [f"{i}:{sig >> (i * BAND_BITS) & mask:04x}" for i in range(BANDS)]
+
+class LshIndex:
+    """In-memory band index: bucket -> [(sig, value)]."""
+
+    def __init__(self):
+        self.buckets = {}
+
+    def add(self, sig: int, value):
+        for b in bands(sig):
+            self.buckets.setdefault(b, []).append((sig, value))
+
+    def nearest(self, sig: int, max_distance: int = MAX_DISTANCE):
+        best = None
+        for b in bands(sig):
+            for other, value in self.buckets.get(b, ()):
+                d = distance(sig, other)
+                if d <= max_distance and (best is None or d < best[0]):
+                    best = (d, value)
+        return best[1] if best else None
+
+class DynamoLshIndex:
+    """The band index in NEARDUP_TABLE; values are {"updateId", "weekKey"}."""
+
+    def __init__(self, db, table_name: str, window_days: int = 30):
+        self.db = db
+        self.table_name = table_name
+        self.window_days = window_days
+        self.queries = 0
+        self._pending = []
+
+    def nearest(self, sig: int, max_distance: int = MAX_DISTANCE):
+        best = None
+        now = int(time.time())
+        for b in bands(sig):
+            self.queries += 1
+            resp = self.db.query(TableName=self.table_name,
+                                 KeyConditionExpression="#b = :b",
+                                 ExpressionAttributeNames={"#b": "bucket"},
+                                 ExpressionAttributeValues={":b": {"S": b}})
+            for item in resp.get("Items", []):
+                # TTL deletes lazily; don't match rows that already expired
+                if int(item.get("expiresAt", {}).get("N", now + 1)) <= now:
+                    continue
+                d = distance(sig, int(item["simhash"]["S"], 16))
+                if d <= max_distance and (best is None or d < best[0]):
+                    best = (d, {"updateId": item["updateId"]["S"], "weekKey": item["weekKey"]["S"]})
+        return best[1] if best else None
+
+    def add(self, sig: int, value: dict):
+        expires = int(time.time()) + self.window_days * 86400
+        for b in bands(sig):
+            self._pending.append({"PutRequest": {"Item": {
+                "bucket": {"S": b},
+                "updateId": {"S": value["updateId"]},
+                "weekKey": {"S": value["weekKey"]},
+                "simhash": {"S": f"{sig:016x}"},
+                "expiresAt": {"N": str(expires)},
+            }}})
+
+    def flush(self):
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), 25):
+            batch = pending[start:start + 25]
+            for _ in range(5):
+                resp = self.db.batch_write_item(RequestItems={self.table_name: batch})
+                batch = resp.get("UnprocessedItems", {}).get(self.table_name, [])
+                if not batch:
+                    break
+                time.sleep(0.1)
+            if batch:
+                print(f"Near-dup index: {len(batch)} band rows left unwritten")
+
+def find_duplicates(items: list[dict], existing: dict, index=None) -> tuple[dict, dict]:
+    """Signatures for every item and the canonical {"updateId", "weekKey"} of each near-duplicate.
+
+    Items are visited oldest first so the earliest announcement is canonical.
+    Rows already stored keep whatever they were assigned (their duplicateOf is
+    returned too); stored canonicals are indexed when they predate the index.
+    New items are matched against this run first, then against `index` (a
+    DynamoLshIndex).
+    """
+    local = LshIndex()
+    sigs, dups = {}, {}
+    for it in sorted(items, key=lambda i: i["publishedAt"]):
+        ref = {"updateId": it["updateId"], "weekKey": it["weekKey"]}
+        row = existing.get((it["weekKey"], it["updateId"]))
+        if row is not None:
+            stored = row.get("simhash")
+            sig = sigs[it["updateId"]] = int(stored, 16) if stored else simhash(it["title"])
+            canonical = ref
+            if row.get("duplicateOf"):
+                canonical = dups[it["updateId"]] = {"updateId": row["duplicateOf"],
+                                                    "weekKey": row.get("canonicalWeek", it["weekKey"])}
+            if sig:
+                local.add(sig, canonical)
+                if not stored and canonical is ref and index is not None:
+                    index.add(sig, ref)
+            continue
+
+        sig = sigs[it["updateId"]] = simhash(it["title"])
+        canonical = local.nearest(sig) if sig else None
+        if canonical is None and sig and index is not None:
+            canonical = index.nearest(sig)
+        if canonical and canonical["updateId"] != it["updateId"]:
+            dups[it["updateId"]] = canonical
+            local.add(sig, canonical)
+        else:
+            local.add(sig, ref)
+            if index is not None and sig:
+                index.add(sig, ref)
+    if index is not None:
+        index.flush()
+    return sigs, dups
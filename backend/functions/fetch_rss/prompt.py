@@ -0,0 +1,43 @@
+"""Summary prompt and Titan Text request/response shapes.
+
+Shared by the hourly ingest (app.py) and the batch backfill (backfill.py) so
+both produce identical model input for the same update.
+"""
+
+# Bump whenever the prompt or generation config changes; it is part of the
+# summary cache key, so every summary is regenerated on the next pass.
+PROMPT_VERSION = "1"
+
+def summary_prompt(title: str, link: str, category: str) -> str:
+    return f"""You are writing a short, accurate AWS What's New blurb for a weekly roundup.
+Title: {title}
+Category: {category}
+Link: {link}
+
+Write:
+- 1 sentence (<= 25 words): what changed.
+- 2 bullets: why it matters, who should care.
+
+No speculation. Plain text."""
+
+def digest_intro_prompt(week_key: str, titles: list[str]) -> str:
+    listed = "\n".join(f"- {t}" for t in titles)
+    return f"""You are writing the opening of a LinkedIn post rounding up AWS updates for {week_key}.
+Updates this week:
+{listed}
+
+Write 2 sentences (<= 45 words total) naming the main themes. No hashtags, no emojis.
+Plain text."""
+
+def titan_text_request(prompt: str) -> dict:
+    return {
+        "inputText": prompt,
+        "textGenerationConfig": {
+            "maxTokenCount": 220,
+            "temperature": 0.2,
+            "topP": 0.9
+        }
+    }
+
+def titan_output_text(data: dict) -> str:
+    return ((data.get("results") or [{}])[0].get("outputText","") or "").strip()
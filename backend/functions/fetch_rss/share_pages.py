@@ -0,0 +1,144 @@
+"""Static share pages: one small HTML page per update, with OpenGraph tags.
+
+LinkedIn and X don't run the site's JavaScript, so a share of the
+aws-updates.html#<id> anchor only ever showed the generic page card. Each
+update gets SHARE_PREFIX<updateId>.html in the site bucket instead: its own
+og:/twitter: tags (title, summary, card image) and the summary inline, a few
+KB with no API call, linking on to the weekly view.
+
+A page is rendered from a handful of row fields; the hash of those inputs is
+stored on the row as `sharePageHash`, so only new or changed updates are
+uploaded. Uploads go out concurrently (S3 has no multi-object put).
+"""
+import html, hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from common.clients import client
+
+# Bump when the template changes so every page is re-rendered
+SHARE_PAGE_VERSION = "1"
+DEFAULT_IMAGE_PATH = "/assets/og-aws-updates.png"
+DESCRIPTION_CHARS = 200
+
+PAGE = """<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} | aCloudResume</title>
+<meta name="description" content="{description}">
+<link rel="canonical" href="{url}">
+<meta property="og:type" content="article">
+<meta property="og:site_name" content="aCloudResume">
+<meta property="og:title" content="{title}">
+<meta property="og:description" content="{description}">
+<meta property="og:url" content="{url}">
+<meta property="og:image" content="{image}">
+<meta property="article:published_time" content="{published}">
+<meta property="article:section" content="{category}">
+<meta name="twitter:card" content="summary_large_image">
+<meta name="twitter:title" content="{title}">
+<meta name="twitter:description" content="{description}">
+<meta name="twitter:image" content="{image}">
+<style>
+body{{margin:0;font:16px/1.55 system-ui,-apple-system,Segoe UI,sans-serif;color:#0f172a;background:#f8fafc}}
+main{{max-width:42rem;margin:0 auto;padding:2rem 1.25rem}}
+img{{width:100%;height:auto;border-radius:.75rem}}
+.meta{{color:#64748b;font-size:.875rem}}
+.summary{{white-space:pre-line}}
+a{{color:#146eb4;font-weight:600}}
+</style>
+</head>
+<body>
+<main>
+<p class="meta">{category} · {date}</p>
+<h1>{title}</h1>
+<img src="{image}" alt="" width="400" height="176">
+<p class="summary">{summary}</p>
+<p><a href="{link}" rel="noreferrer">Read the announcement →</a></p>
+<p><a href="{week_url}">All AWS updates for {week}</a></p>
+</main>
+</body>
+</html>
+"""
+
+def page_key(prefix: str, update_id: str) -> str:
+    return f"{prefix}{update_id}.html"
+
+def page_url(base_url: str, prefix: str, update_id: str) -> str:
+    return f"{base_url}/{page_key(prefix, update_id)}"
+
+def description(summary: str, title: str) -> str:
+    text = " ".join((summary or title or "").split())
+    if len(text) <= DESCRIPTION_CHARS:
+        return text
+    return text[:DESCRIPTION_CHARS - 1].rsplit(" ", 1)[0] + "…"
+
+def page_hash(row: dict) -> str:
+    raw = "\x1f".join([SHARE_PAGE_VERSION] + [str(row.get(k, "")) for k in
+                      ("updateId", "weekKey", "title", "link", "publishedAt", "category", "summary", "imageUrl")])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:20]
+
+def render_page(row: dict, base_url: str, prefix: str) -> str:
+    esc = lambda s: html.escape(str(s or ""), quote=True)
+    week = row["weekKey"]
+    return PAGE.format(
+        title=esc(row.get("title")),
+        description=esc(description(row.get("summary"), row.get("title"))),
+        url=esc(page_url(base_url, prefix, row["updateId"])),
+        image=esc(row.get("imageUrl") or f"{base_url}{DEFAULT_IMAGE_PATH}"),
+        published=esc(row.get("publishedAt")),
+        date=esc((row.get("publishedAt") or "")[:10]),
+        category=esc(row.get("category") or "Other"),
+        summary=esc(row.get("summary") or row.get("title")),
+        link=esc(row.get("link") or "#"),
+        week=esc(week),
+        week_url=esc(f"{base_url}/aws-updates.html?week={week}#{row['updateId']}"),
+    )
+
+class SharePages:
+    def __init__(self, bucket: str, prefix: str, base_url: str, concurrency: int = 8):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.written = 0
+        self.failed = 0
+
+    def _put(self, row: dict):
+        client("s3").put_object(
+            Bucket=self.bucket,
+            Key=page_key(self.prefix, row["updateId"]),
+            Body=render_page(row, self.base_url, self.prefix).encode("utf-8"),
+            ContentType="text/html; charset=utf-8",
+            # Same URL for the life of the update; summaries can still change
+            CacheControl="public, max-age=3600",
+        )
+
+    def publish(self, rows: list[dict], existing: dict) -> int:
+        """Upload pages for rows whose inputs changed and set their `sharePageHash`.
+
+        `existing` maps (weekKey, updateId) to the stored row. A failed upload
+        leaves the stored hash, so the page is retried on the next run.
+        """
+        self.written = self.failed = 0
+        todo = []
+        for r in rows:
+            stored = (existing.get((r["weekKey"], r["updateId"])) or {}).get("sharePageHash", "")
+            fresh = page_hash(r)
+            r["sharePageHash"] = stored
+            if fresh != stored:
+                todo.append((r, fresh))
+        if not todo:
+            return 0
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(todo)))) as pool:
+            futures = [(r, fresh, pool.submit(self._put, r)) for r, fresh in todo]
+        for r, fresh, fut in futures:
+            try:
+                fut.result()
+                r["sharePageHash"] = fresh
+                self.written += 1
+            except Exception as e:
+                print(f"Share page upload failed for {r['updateId']}: {e}")
+                self.failed += 1
+        return self.written
@@ -0,0 +1,105 @@
+"""Streaming summaries via InvokeModelWithResponseStream.
+
+The prompt asks for one sentence and two bullets; once both are complete the
+stream is closed, so the model stops spending output tokens on anything it
+would add afterwards. A per-call deadline bounds the wall time, in which case
+whatever has been generated so far is returned as a partial summary. The
+stream is read on a worker thread so a stalled stream can't hold the caller
+past the deadline (botocore would otherwise wait out its 60 s read timeout).
+"""
+import json, time, queue, threading
+
+from common.clients import client
+from common.metrics import model_metrics
+from prompt import summary_prompt, titan_text_request
+
+BULLETS = ("-", "*", "•")
+_END = object()
+
+def _complete_summary(text: str) -> str:
+    """The sentence + two bullets if `text` already contains them, else ""."""
+    lines = [l.strip() for l in text.splitlines()]
+    # Only trust lines followed by a newline, or ending a sentence, as finished
+    finished = lines[:-1] + ([lines[-1]] if lines and lines[-1][-1:] in ".!?" else [])
+    sentence, bullets = "", []
+    for line in finished:
+        if not line:
+            continue
+        if line.startswith(BULLETS):
+            if sentence:
+                bullets.append(line)
+        elif not sentence:
+            sentence = line
+        if sentence and len(bullets) == 2:
+            return "\n".join([sentence] + bullets)
+    return ""
+
+def _count_tokens(call, data: dict):
+    # Titan reports running totals per chunk; the last chunk also carries
+    # the invocation metrics, which win when present.
+    call.input_tokens = max(call.input_tokens, int(data.get("inputTextTokenCount") or 0))
+    call.output_tokens = max(call.output_tokens, int(data.get("totalOutputTextTokenCount") or 0))
+    metrics = data.get("amazon-bedrock-invocationMetrics") or {}
+    if metrics:
+        call.input_tokens = int(metrics.get("inputTokenCount", call.input_tokens))
+        call.output_tokens = int(metrics.get("outputTokenCount", call.output_tokens))
+
+def _pump(stream, events: queue.Queue):
+    """Move the stream's events onto `events`, then an error if it failed, then _END."""
+    try:
+        for event in stream:
+            events.put(event)
+    except Exception as e:
+        events.put(e)
+    events.put(_END)
+
+def stream_summary(model_id: str, title: str, link: str, category: str,
+                   deadline_seconds: float = 20.0) -> tuple[str, bool]:
+    """Return (summary, complete).
+
+    `complete` is False when the deadline hit before the model finished the
+    sentence and both bullets; the text is then whatever had streamed so far.
+    """
+    deadline = time.monotonic() + deadline_seconds
+    with model_metrics.call(model_id, "InvokeModelWithResponseStream") as call:
+        resp = client("bedrock-runtime").invoke_model_with_response_stream(
+            modelId=model_id,
+            body=json.dumps(titan_text_request(summary_prompt(title, link, category))),
+            accept="application/json",
+            contentType="application/json"
+        )
+        # botocore is loaded by now; importing it up top would slow cold starts
+        from botocore.exceptions import ReadTimeoutError
+        stream = resp["body"]
+        events = queue.Queue()
+        threading.Thread(target=_pump, args=(stream, events), daemon=True).start()
+        text = ""
+        try:
+            while True:
+                try:
+                    event = events.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    return text.strip(), False
+                if event is _END:
+                    break
+                if isinstance(event, ReadTimeoutError):
+                    return text.strip(), False
+                if isinstance(event, Exception):
+                    raise event
+                chunk = event.get("chunk")
+                if chunk:
+                    data = json.loads(chunk["bytes"])
+                    _count_tokens(call, data)
+                    text += data.get("outputText", "")
+                    done = _complete_summary(text)
+                    if done:
+                        return done, True
+                if time.monotonic() >= deadline:
+                    return text.strip(), False
+        finally:
+            # Closing the stream early stops generation (and billing) server-side
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+    # The model finished on its own, possibly in a different shape
+    return text.strip(), True
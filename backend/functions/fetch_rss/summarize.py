@@ -0,0 +1,120 @@
+"""On-demand summary endpoint: GET /summarize?updateId=...[&week=...]
+
+Returns the stored summary when it is current, then tries the summary cache,
+and otherwise streams a fresh one from Bedrock. The stream is cut off at
+SUMMARIZE_DEADLINE_SECONDS so the response always fits inside the API Gateway
+timeout; a partial summary is returned with "complete": false and is not
+stored.
+"""
+import os, json
+
+from common.clients import ddb, from_item
+from common.metrics import model_metrics
+from common.ratelimit import RateLimiter
+from prompt import PROMPT_VERSION
+from summary_cache import SummaryCache, summary_key
+from streaming import stream_summary
+
+UPDATES_TABLE = os.environ["UPDATES_TABLE"]
+TEXT_MODEL_ID = os.environ.get("TEXT_MODEL_ID", "amazon.titan-text-express-v1")
+SUMMARY_CACHE_TABLE = os.environ.get("SUMMARY_CACHE_TABLE", "")
+SUMMARY_CACHE_TTL_DAYS = int(os.environ.get("SUMMARY_CACHE_TTL_DAYS", "0"))
+SUMMARIZE_DEADLINE_SECONDS = float(os.environ.get("SUMMARIZE_DEADLINE_SECONDS", "20"))
+UPDATE_ID_INDEX = os.environ.get("UPDATE_ID_INDEX", "UpdateIdIndex")
+ALLOW_ORIGIN = os.environ.get("ALLOW_ORIGIN", "https://acloudresume.com")
+
+summary_cache = SummaryCache(SUMMARY_CACHE_TABLE, SUMMARY_CACHE_TTL_DAYS)
+limiter = RateLimiter()
+
+def _resp(obj, status=200, headers=None):
+    return {
+        "statusCode": status,
+        "headers": {
+            "Content-Type": "application/json",
+            "Access-Control-Allow-Origin": ALLOW_ORIGIN,
+            "Access-Control-Allow-Methods": "GET,OPTIONS",
+            "Access-Control-Allow-Headers": "Content-Type,Authorization",
+            **(headers or {}),
+        },
+        "body": json.dumps(obj, default=str)
+    }
+
+def find_update(update_id: str, week: str):
+    db = ddb()
+    if week:
+        return from_item(db.get_item(
+            TableName=UPDATES_TABLE,
+            Key={"weekKey": {"S": week}, "updateId": {"S": update_id}}
+        ).get("Item"))
+    resp = db.query(
+        TableName=UPDATES_TABLE,
+        IndexName=UPDATE_ID_INDEX,
+        KeyConditionExpression="updateId = :u",
+        ExpressionAttributeValues={":u": {"S": update_id}},
+        Limit=1
+    )
+    items = resp.get("Items", [])
+    return from_item(items[0]) if items else None
+
+def save_summary(item: dict, summary: str, key: str):
+    try:
+        ddb().update_item(
+            TableName=UPDATES_TABLE,
+            Key={"weekKey": {"S": item["weekKey"]}, "updateId": {"S": item["updateId"]}},
+            UpdateExpression="SET #s = :s, #k = :k",
+            ConditionExpression="attribute_exists(updateId)",
+            ExpressionAttributeNames={"#s": "summary", "#k": "summaryKey"},
+            ExpressionAttributeValues={":s": {"S": summary}, ":k": {"S": key}}
+        )
+    except Exception as e:
+        print(f"Saving summary failed: {e}")
+
+def lambda_handler(event, context):
+    method = (event.get("requestContext", {}).get("http", {}).get("method")
+              or event.get("httpMethod", "GET"))
+    if method == "OPTIONS":
+        return _resp({}, 200)
+
+    qs = event.get("queryStringParameters") or {}
+    update_id = (qs.get("updateId") or "").strip()[:64]
+    week = (qs.get("week") or "").strip()[:16]
+    if not update_id:
+        return _resp({"error": "updateId is required"}, 400)
+
+    retry_after = limiter.check("summarize", event)
+    if retry_after:
+        return _resp({"error": "too many requests"}, 429, {"Retry-After": str(retry_after)})
+
+    model_metrics.reset()
+    item = find_update(update_id, week)
+    if not item:
+        return _resp({"error": "Not found"}, 404)
+
+    key = summary_key(item.get("title", ""), item.get("link", ""), item.get("category", ""),
+                      TEXT_MODEL_ID, PROMPT_VERSION)
+    out = {"updateId": update_id, "weekKey": item["weekKey"], "complete": True}
+
+    if item.get("summary") and item.get("summaryKey", key) == key:
+        return _resp(dict(out, summary=item["summary"], source="table"))
+
+    cached = summary_cache.get(key)
+    if cached:
+        save_summary(item, cached, key)
+        return _resp(dict(out, summary=cached, source="cache"))
+
+    # Leave headroom for the DynamoDB writes inside the Lambda's own timeout
+    deadline = SUMMARIZE_DEADLINE_SECONDS
+    if context is not None and hasattr(context, "get_remaining_time_in_millis"):
+        deadline = min(deadline, context.get_remaining_time_in_millis() / 1000 - 2)
+    try:
+        summary, complete = stream_summary(TEXT_MODEL_ID, item.get("title", ""), item.get("link", ""),
+                                           item.get("category", ""), max(deadline, 1))
+    except Exception as e:
+        print(f"Streaming summary failed: {e}")
+        return _resp({"error": "Summary generation failed"}, 502)
+
+    if complete and summary:
+        summary_cache.put(key, summary, TEXT_MODEL_ID, PROMPT_VERSION)
+        save_summary(item, summary, key)
+    model_metrics.emit_summary("Summarize")
+    return _resp(dict(out, summary=summary, complete=complete, source="model"))
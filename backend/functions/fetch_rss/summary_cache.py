@@ -0,0 +1,103 @@
+"""Content-addressed cache for Bedrock summaries.
+
+Summaries are keyed by a hash of the normalized title, link and category plus
+the model id and prompt version, so a re-published item (new guid) or one
+that lands in another ISO week reuses the summary already paid for, while a
+change of TEXT_MODEL_ID or of the prompt produces new keys. Entries live in
+SUMMARY_CACHE_TABLE (optionally expiring via DynamoDB TTL) and are fronted by
+a per-container LRU. The cache only saves money: a read that fails counts as a
+miss and a write that fails is skipped, so a throttled table never stops an
+ingest or a backfill.
+"""
+import time, hashlib
+from collections import OrderedDict
+
+from common.clients import ddb
+from common.metrics import model_metrics
+
+def normalize_title(title: str) -> str:
+    return " ".join((title or "").lower().split())
+
+def normalize_link(link: str) -> str:
+    link = (link or "").strip()
+    scheme, sep, rest = link.partition("://")
+    if not sep:
+        return link.rstrip("/")
+    host, slash, path = rest.partition("/")
+    return f"{scheme.lower()}://{host.lower()}{slash}{path}".rstrip("/")
+
+def summary_key(title: str, link: str, category: str, model_id: str, prompt_version: str) -> str:
+    parts = [normalize_title(title), normalize_link(link), category or "", model_id, prompt_version]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+class SummaryCache:
+    def __init__(self, table_name: str = "", ttl_days: int = 0, max_entries: int = 1024):
+        self.table_name = table_name
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self._lru = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, key: str, summary: str):
+        self._lru[key] = summary
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def get(self, key: str) -> str:
+        """Return the cached summary for `key`, or "" on a miss."""
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            self.hits += 1
+            model_metrics.cache("SummaryCache", True)
+            return self._lru[key]
+
+        summary = ""
+        if self.table_name:
+            try:
+                item = ddb().get_item(
+                    TableName=self.table_name,
+                    Key={"cacheKey": {"S": key}},
+                    ProjectionExpression="summary, expiresAt"
+                ).get("Item") or {}
+            except Exception as e:
+                print(f"Summary cache read failed: {e}")
+                item = {}
+            # TTL deletion is lazy, so skip rows that have already expired
+            expires = int(item.get("expiresAt", {}).get("N", 0))
+            if not expires or expires > time.time():
+                summary = item.get("summary", {}).get("S", "")
+
+        if summary:
+            self.hits += 1
+            self._remember(key, summary)
+        else:
+            self.misses += 1
+        model_metrics.cache("SummaryCache", bool(summary))
+        return summary
+
+    def put(self, key: str, summary: str, model_id: str, prompt_version: str):
+        if not summary:
+            return
+        self._remember(key, summary)
+        if not self.table_name:
+            return
+        now = int(time.time())
+        item = {
+            "cacheKey": {"S": key},
+            "summary": {"S": summary},
+            "modelId": {"S": model_id},
+            "promptVersion": {"S": prompt_version},
+            "createdAt": {"N": str(now)},
+        }
+        if self.ttl_days:
+            item["expiresAt"] = {"N": str(now + self.ttl_days * 86400)}
+        try:
+            ddb().put_item(TableName=self.table_name, Item=item)
+        except Exception as e:
+            print(f"Summary cache write failed: {e}")
@@ -1,12 +1,26 @@
-import os, json
-import boto3
-from boto3.dynamodb.conditions import Key
+import os, json, datetime
+
+from common.archive import ArchiveReader
+from common.clients import ddb, from_item
+from common.ratelimit import RateLimiter
+from common.tracing import subsegment, traced
 
-ddb = boto3.resource("dynamodb")
 UPDATES_TABLE = os.environ["UPDATES_TABLE"]
 ALLOW_ORIGIN = os.environ.get("ALLOW_ORIGIN", "https://acloudresume.com")
+DIGEST_TABLE = os.environ.get("DIGEST_TABLE", "")
+# A digest only changes when fetch_rss rebuilds it (at most hourly, and rarely
+# once its week is over); clients revalidate with If-None-Match after expiry
+DIGEST_MAX_AGE = int(os.environ.get("DIGEST_MAX_AGE", "3600"))
+PAST_DIGEST_MAX_AGE = int(os.environ.get("PAST_DIGEST_MAX_AGE", "604800"))
+# fetch_rss/digest.py keeps the newest digested week under this key
+LATEST_DIGEST_KEY = "latest"
+
+# Weeks moved out of the table by fetch_rss/archive.py; per container
+archive = ArchiveReader()
+# /export reads the whole table when its hourly object isn't there yet
+limiter = RateLimiter()
 
-def _resp(obj, status=200):
+def _resp(obj, status=200, headers=None):
     return {
         "statusCode": status,
         "headers": {
@@ -14,8 +28,9 @@ def _resp(obj, status=200):
             "Access-Control-Allow-Origin": ALLOW_ORIGIN,
             "Access-Control-Allow-Methods": "GET,OPTIONS",
             "Access-Control-Allow-Headers": "Content-Type,Authorization",
+            **(headers or {}),
         },
-        "body": json.dumps(obj, default=str)
+        "body": json.dumps(obj, default=str) if obj is not None else ""
     }
 
 def _get_method(event):
@@ -28,26 +43,55 @@ def _get_path(event):
 def _get_qs(event):
     return event.get("queryStringParameters") or {}
 
-def list_weeks(table):
-    scan = table.scan(ProjectionExpression="weekKey")
-    weeks = sorted({i["weekKey"] for i in scan.get("Items", []) if "weekKey" in i}, reverse=True)
-    return weeks
+def _get_header(event, name):
+    headers = event.get("headers") or {}
+    return next((v for k, v in headers.items() if k.lower() == name), "")
 
-def query_week(table, week):
+@traced("dynamodb.list_weeks")
+def list_weeks(db):
+    # A Scan page stops at 1 MB read before the projection, so a few
+    # thousand rows already span several pages
+    weeks = set()
+    last = None
+    while True:
+        kwargs = {"TableName": UPDATES_TABLE, "ProjectionExpression": "weekKey"}
+        if last:
+            kwargs["ExclusiveStartKey"] = last
+        resp = db.scan(**kwargs)
+        weeks.update(i["weekKey"]["S"] for i in resp.get("Items", []) if "weekKey" in i)
+        last = resp.get("LastEvaluatedKey")
+        if not last:
+            return sorted(weeks | set(archive.weeks()), reverse=True)
+
+def query_week(db, week):
+    # An archived week is read from its file, even while its rows await TTL deletion
+    with subsegment("archive.read", week=week):
+        out = archive.rows(week)
+    if out is None:
+        out = query_table(db, week)
+    return shape_items(out, week)
+
+def query_table(db, week):
     out = []
     last = None
     while True:
-        kwargs = {"KeyConditionExpression": Key("weekKey").eq(week)}
+        kwargs = {
+            "TableName": UPDATES_TABLE,
+            "KeyConditionExpression": "weekKey = :w",
+            "ExpressionAttributeValues": {":w": {"S": week}},
+        }
         if last:
             kwargs["ExclusiveStartKey"] = last
-        resp = table.query(**kwargs)
-        out.extend(resp.get("Items", []))
+        with subsegment("dynamodb.query", week=week):
+            resp = db.query(**kwargs)
+        out.extend(from_item(i) for i in resp.get("Items", []))
         last = resp.get("LastEvaluatedKey")
         if not last:
-            break
+            return out
 
-    out.sort(key=lambda x: x.get("publishedAt", ""), reverse=True)
-    return [{
+def shape_items(out, week):
+    out = sorted(out, key=lambda x: x.get("publishedAt", ""), reverse=True)
+    return group_duplicates([{
         "updateId": i.get("updateId", ""),
         "title": i.get("title", ""),
         "link": i.get("link", ""),
@@ -57,7 +101,70 @@ def query_week(table, week):
         "tags": i.get("tags", []),
         "summary": i.get("summary", ""),
         "imageUrl": i.get("imageUrl", ""),
-    } for i in out]
+        "duplicateOf": i.get("duplicateOf", ""),
+    } for i in out])
+
+def group_duplicates(items):
+    """Nest near-duplicates (region re-announcements) under their canonical update.
+
+    A duplicate whose canonical is in another week stays a top-level item.
+    """
+    by_id = {i["updateId"]: i for i in items}
+    out = []
+    for i in items:
+        canonical = by_id.get(i.pop("duplicateOf") or None)
+        if canonical is None or canonical is i:
+            out.append(i)
+            continue
+        canonical.setdefault("duplicates", []).append(
+            {k: i[k] for k in ("updateId", "title", "link", "publishedAt")})
+    return out
+
+def current_week() -> str:
+    year, week, _ = datetime.datetime.now(datetime.timezone.utc).isocalendar()
+    return f"{year}-W{week:02d}"
+
+@traced("dynamodb.get_digest")
+def get_digest(db, week):
+    item = db.get_item(TableName=DIGEST_TABLE, Key={"weekKey": {"S": week}}).get("Item")
+    return from_item(item)
+
+@traced("dynamodb.latest_digest_week")
+def latest_digest_week(db):
+    item = db.get_item(TableName=DIGEST_TABLE, Key={"weekKey": {"S": LATEST_DIGEST_KEY}},
+                       ProjectionExpression="latestWeek").get("Item") or {}
+    return item.get("latestWeek", {}).get("S", "")
+
+def digest_response(event, db, week):
+    latest = not week
+    if DIGEST_TABLE and latest:
+        week = latest_digest_week(db)
+    digest = get_digest(db, week) if DIGEST_TABLE and week and week != LATEST_DIGEST_KEY else None
+    if digest is None:
+        return _resp({"error": f"no digest for {week or 'the latest week'}"}, 404, {"Cache-Control": "no-store"})
+    # Without ?week= the response moves on to the next week, so it never gets the long max-age
+    max_age = DIGEST_MAX_AGE if latest or week >= current_week() else PAST_DIGEST_MAX_AGE
+    headers = {"ETag": f'"{digest.get("contentHash", "")}"',
+               "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate={max_age}"}
+    if _get_header(event, "if-none-match") == headers["ETag"]:
+        return _resp(None, 304, headers)
+    return _resp(digest, 200, headers)
+
+def export_response(event, db):
+    # Imported on first use: zlib/hashlib and the writer aren't needed by the other routes
+    import export
+    if not export.EXPORT_BUCKET:
+        return _resp({"error": "export is not configured"}, 404)
+    retry_after = limiter.check("export", event)
+    if retry_after:
+        return _resp({"error": "too many requests"}, 429, {"Retry-After": str(retry_after)})
+    try:
+        since, fields = export.parse_filters(_get_qs(event))
+    except ValueError as e:
+        return _resp({"error": str(e)}, 400)
+    key, stats = export.ensure_export(db, UPDATES_TABLE, list_weeks(db), archive.weeks(), since, fields)
+    url = export.presigned_url(key)
+    return _resp({"url": url, **stats}, 303, {"Location": url, "Cache-Control": "no-store"})
 
 def lambda_handler(event, context):
     method = _get_method(event)
@@ -66,19 +173,25 @@ def lambda_handler(event, context):
 
     path = _get_path(event)
     qs = _get_qs(event)
-    table = ddb.Table(UPDATES_TABLE)
+    db = ddb()
 
     # /weeks endpoint
     if path.endswith("/weeks"):
-        return _resp(list_weeks(table))
+        return _resp(list_weeks(db))
+
+    if path.endswith("/export"):
+        return export_response(event, db)
 
-    # /updates endpoint
     week = (qs.get("week") or "").strip()
+    if path.endswith("/digest"):
+        return digest_response(event, db, week)
+
+    # /updates endpoint
     if not week:
-        weeks = list_weeks(table)
+        weeks = list_weeks(db)
         if not weeks:
             return _resp([])
         week = weeks[0]  # ✅ latest available
 
-    items = query_week(table, week)
+    items = query_week(db, week)
     return _resp(items)
@@ -0,0 +1,177 @@
+"""Bulk export of every update as gzip NDJSON, for GET /export.
+
+API Gateway buffers a Lambda response (6 MB at most) and the Python runtime
+can't stream one, so the export is streamed into S3 instead and the client is
+redirected (303) to a presigned URL:
+
+- rows come from a generator: weeks oldest first, each week page by page from
+  a DynamoDB query, or from its partition once archived (common/archive.py).
+  At most one page or one archived week is held at a time;
+- each row becomes one JSON line, compressed as it is produced and uploaded in
+  PART_BYTES multipart parts, so memory stays flat however big the table gets;
+- the object is keyed by the filters and the hour, so further calls in the
+  same hour redirect to it without reading the table. A lifecycle rule on the
+  bucket deletes exports after a day.
+
+Filters: `since=2026-01-01` (or any ISO timestamp) keeps updates published
+then or later; `fields=title,link,publishedAt` picks attributes (EXPORT_FIELDS).
+
+An export that outlives API Gateway's 29 s still completes (the function keeps
+running), so a retry after a 504 finds it ready.
+"""
+import os, json, zlib, hashlib, datetime
+
+from common.archive import ARCHIVE_BUCKET, read_partition
+from common.clients import client, from_item
+from common.tracing import subsegment
+
+EXPORT_BUCKET = os.environ.get("EXPORT_BUCKET") or ARCHIVE_BUCKET
+EXPORT_PREFIX = os.environ.get("EXPORT_PREFIX", "exports/")
+EXPORT_URL_SECONDS = 3600
+EXPORT_FIELDS = ("updateId", "weekKey", "title", "link", "publishedAt", "category", "tags",
+                 "summary", "imageUrl", "duplicateOf", "source")
+# S3 multipart parts must be at least 5 MB (except the last)
+PART_BYTES = 8 * 1024 * 1024
+PAGE_SIZE = 500
+# Level 6 (zlib's default) compresses ~3x slower for a ~20% smaller file
+GZIP_LEVEL = 3
+
+def parse_filters(qs: dict) -> tuple[str, tuple]:
+    """(since as a UTC ISO timestamp or "", fields); ValueError on bad input."""
+    since = (qs.get("since") or "").strip()
+    if since:
+        try:
+            dt = datetime.datetime.fromisoformat(since.replace("Z", "+00:00"))
+        except ValueError:
+            raise ValueError("since must be an ISO date or timestamp, e.g. 2026-01-01") from None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+        since = dt.astimezone(datetime.timezone.utc).isoformat()
+    fields = tuple(f.strip() for f in (qs.get("fields") or "").split(",") if f.strip()) or EXPORT_FIELDS
+    unknown = [f for f in fields if f not in EXPORT_FIELDS]
+    if unknown:
+        raise ValueError(f"unknown fields {', '.join(unknown)}; choose from {', '.join(EXPORT_FIELDS)}")
+    return since, fields
+
+def week_of(iso: str) -> str:
+    year, week, _ = datetime.datetime.fromisoformat(iso).isocalendar()
+    return f"{year}-W{week:02d}"
+
+def query_pages(db, table: str, week: str):
+    last = None
+    while True:
+        kwargs = {
+            "TableName": table,
+            "KeyConditionExpression": "weekKey = :w",
+            "ExpressionAttributeValues": {":w": {"S": week}},
+            "Limit": PAGE_SIZE,
+        }
+        if last:
+            kwargs["ExclusiveStartKey"] = last
+        with subsegment("dynamodb.query", week=week):
+            resp = db.query(**kwargs)
+        yield [from_item(i) for i in resp.get("Items", [])]
+        last = resp.get("LastEvaluatedKey")
+        if not last:
+            return
+
+def iter_updates(db, table: str, weeks: list[str], archived: dict, since: str = ""):
+    """Every stored row of `weeks` (oldest first) published at or after `since`."""
+    first_week = week_of(since) if since else ""
+    for week in sorted(w for w in weeks if w >= first_week):
+        if week in archived:
+            pages = [read_partition(ARCHIVE_BUCKET, week)]
+        else:
+            pages = query_pages(db, table, week)
+        for page in pages:
+            for row in sorted(page, key=lambda r: r.get("publishedAt", "")):
+                if not since or row.get("publishedAt", "") >= since:
+                    yield row
+
+def ndjson_lines(rows, fields: tuple):
+    for row in rows:
+        yield (json.dumps({f: row.get(f, "") for f in fields}, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+class MultipartGzipWriter:
+    """Gzip-compress written bytes and upload them to S3 in PART_BYTES parts."""
+
+    def __init__(self, s3, bucket: str, key: str, part_bytes: int = PART_BYTES):
+        self.s3, self.bucket, self.key, self.part_bytes = s3, bucket, key, part_bytes
+        self._gzip = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        self._buf = bytearray()
+        self._upload_id = None
+        self._parts = []
+        self.raw_bytes = 0
+        self.bytes = 0
+
+    def write(self, data: bytes):
+        self.raw_bytes += len(data)
+        self._buf += self._gzip.compress(data)
+        if len(self._buf) >= self.part_bytes:
+            self._flush_part()
+
+    def _flush_part(self):
+        if self._upload_id is None:
+            self._upload_id = self.s3.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key, ContentType="application/gzip")["UploadId"]
+        n = len(self._parts) + 1
+        resp = self.s3.upload_part(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id,
+                                   PartNumber=n, Body=self._buf)
+        self._parts.append({"PartNumber": n, "ETag": resp["ETag"]})
+        self.bytes += len(self._buf)
+        self._buf.clear()
+
+    def close(self):
+        self._buf += self._gzip.flush()
+        if self._upload_id is None:
+            # Small export: one plain upload
+            self.s3.put_object(Bucket=self.bucket, Key=self.key, Body=self._buf,
+                               ContentType="application/gzip")
+            self.bytes += len(self._buf)
+            self._buf.clear()
+            return
+        self._flush_part()
+        self.s3.complete_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id,
+                                          MultipartUpload={"Parts": self._parts})
+
+    def abort(self):
+        if self._upload_id is not None:
+            self.s3.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id)
+
+def export_key(since: str, fields: tuple, now: datetime.datetime) -> str:
+    digest = hashlib.sha256(f"{since}|{','.join(fields)}".encode("utf-8")).hexdigest()[:16]
+    return f"{EXPORT_PREFIX}{now:%Y%m%dT%H}/{digest}.ndjson.gz"
+
+def write_export(db, table: str, weeks: list[str], archived: dict, since: str, fields: tuple, key: str) -> dict:
+    s3 = client("s3")
+    writer = MultipartGzipWriter(s3, EXPORT_BUCKET, key)
+    items = 0
+    try:
+        for line in ndjson_lines(iter_updates(db, table, weeks, archived, since), fields):
+            writer.write(line)
+            items += 1
+        writer.close()
+    except Exception:
+        writer.abort()
+        raise
+    return {"items": items, "bytes": writer.bytes, "rawBytes": writer.raw_bytes}
+
+def ensure_export(db, table: str, weeks: list[str], archived: dict, since: str, fields: tuple) -> tuple[str, dict]:
+    """(key, stats) of this hour's export for the filters, writing it if needed."""
+    key = export_key(since, fields, datetime.datetime.now(datetime.timezone.utc))
+    s3 = client("s3")
+    try:
+        head = s3.head_object(Bucket=EXPORT_BUCKET, Key=key)
+        return key, {"cached": True, "bytes": head["ContentLength"]}
+    except s3.exceptions.ClientError as e:
+        if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey", "NotFound"):
+            raise
+    with subsegment("export.write", weeks=len(weeks)):
+        stats = write_export(db, table, weeks, archived, since, fields, key)
+    return key, {"cached": False, **stats}
+
+def presigned_url(key: str) -> str:
+    return client("s3").generate_presigned_url(
+        "get_object", ExpiresIn=EXPORT_URL_SECONDS,
+        Params={"Bucket": EXPORT_BUCKET, "Key": key,
+                "ResponseContentDisposition": 'attachment; filename="aws-updates.ndjson.gz"'})
@@ -1,11 +1,44 @@
-import os, json
-import boto3
-from boto3.dynamodb.conditions import Key
+"""Visitor counter API.
+
+GET /visitor?path=<p> adds one view to the path's item, which holds the
+all-time `count` plus hour, day and month counters as attributes named
+"h#2026-10-19T14", "d#2026-10-19" and "m#2026-10". All four are bumped by the
+same UpdateItem. rollup.py trims old hour/day counters and precomputes the
+leaderboard item (LEADERBOARD_KEY) that GET /visitor/top serves with a single
+GetItem.
+
+GET /visitor?paths=a,b,c&increment=false only reads: up to MAX_BATCH totals in
+one BatchGetItem, cached per container for COUNT_CACHE_SECONDS, so a listing
+page can show every card's count with one request and no writes.
+
+Paths are canonicalized and checked against the sitemap first (paths.py), so
+unknown pages share one OTHER_PATH item instead of creating their own.
+Increments are rate limited per client IP (common.ratelimit); reads are not.
+"""
+import os, json, time, datetime
+
+from common.clients import ddb, from_item
+from common.ratelimit import RateLimiter
+from common.tracing import subsegment
+from paths import count_key, OTHER_PATH
 
-ddb = boto3.resource("dynamodb")
 VISITOR_TABLE = os.environ["VISITOR_TABLE"]
+# Reserved key (paths starting with "#" are never counted as-is)
+LEADERBOARD_KEY = "#leaderboard"
+MAX_TOP = 50
+# BatchGetItem's per-request key limit
+MAX_BATCH = 100
+COUNT_CACHE_SECONDS = float(os.environ.get("COUNT_CACHE_SECONDS", "30"))
+# "api": every GET /visitor counts a view. "logs": views are counted from the
+# CDN access logs by logcount.py and this endpoint only reads
+COUNT_MODE = os.environ.get("COUNT_MODE", "api")
+BATCH_RETRIES = 5
+
+# path -> (count, expires at); per container
+_count_cache = {}
+limiter = RateLimiter()
 
-def _resp(obj, status=200):
+def _resp(obj, status=200, headers=None):
     return {
         "statusCode": status,
         "headers": {
@@ -13,22 +46,104 @@ def _resp(obj, status=200):
             "Access-Control-Allow-Origin": "*",
             "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
             "Access-Control-Allow-Headers": "Content-Type,Authorization",
+            **(headers or {}),
         },
         "body": json.dumps(obj, default=str)
     }
 
+def bucket_names(now: datetime.datetime) -> dict:
+    return {"#h": f"h#{now:%Y-%m-%dT%H}", "#d": f"d#{now:%Y-%m-%d}", "#m": f"m#{now:%Y-%m}"}
+
+def increment(path: str) -> int:
+    names = {"#c": "count", **bucket_names(datetime.datetime.now(datetime.timezone.utc))}
+    # Atomic increment of the total and the current hour/day/month in one write
+    with subsegment("dynamodb.increment"):
+        resp = ddb().update_item(
+            TableName=VISITOR_TABLE,
+            Key={"path": {"S": path}},
+            UpdateExpression="ADD #c :inc, #h :inc, #d :inc, #m :inc",
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues={":inc": {"N": "1"}},
+            ReturnValues="UPDATED_NEW"
+        )
+    return int(resp["Attributes"].get("count", {}).get("N", 0))
+
+def get_counts(paths: list[str]) -> dict:
+    """All-time counts for `paths` (0 when never visited), from cache or one BatchGetItem."""
+    now = time.monotonic()
+    out, missing = {}, []
+    for p in paths:
+        hit = _count_cache.get(p)
+        if hit and hit[1] > now:
+            out[p] = hit[0]
+        else:
+            missing.append(p)
+    pending = [{"path": {"S": p}} for p in missing]
+    with subsegment("dynamodb.batch_get", keys=len(pending)):
+        for attempt in range(BATCH_RETRIES + 1):
+            if not pending:
+                break
+            if attempt:
+                time.sleep(min(0.05 * 2 ** attempt, 1.0))
+            resp = ddb().batch_get_item(RequestItems={VISITOR_TABLE: {
+                "Keys": pending,
+                "ProjectionExpression": "#p, #c",
+                "ExpressionAttributeNames": {"#p": "path", "#c": "count"},
+            }})
+            for item in resp.get("Responses", {}).get(VISITOR_TABLE, []):
+                out[item["path"]["S"]] = int(item.get("count", {}).get("N", 0))
+            pending = resp.get("UnprocessedKeys", {}).get(VISITOR_TABLE, {}).get("Keys", [])
+    unread = {k["path"]["S"] for k in pending}
+    expires = now + COUNT_CACHE_SECONDS
+    for p in missing:
+        if p in unread:
+            continue
+        out.setdefault(p, 0)
+        _count_cache[p] = (out[p], expires)
+    return out
+
+def read_counts(qs: dict):
+    raw = qs.get("paths") or qs.get("path") or "/"
+    asked = list(dict.fromkeys(p.strip() for p in raw.split(",") if p.strip()))
+    if len(asked) > MAX_BATCH:
+        return _resp({"error": f"at most {MAX_BATCH} paths per request"}, 400)
+    # Answer under the path as asked; unknown pages read as 0, not the OTHER_PATH total
+    keys = {p: count_key(p) for p in asked}
+    counts = get_counts(sorted({k for k in keys.values() if k != OTHER_PATH}))
+    return _resp({"counts": {p: counts.get(k, 0) for p, k in keys.items()}},
+                 headers={"Cache-Control": f"public, max-age={int(COUNT_CACHE_SECONDS)}"})
+
+def top_pages(qs: dict):
+    window = (qs.get("window") or "7d").strip()
+    try:
+        n = max(1, min(int(qs.get("n") or 10), MAX_TOP))
+    except ValueError:
+        return _resp({"error": "n must be an integer"}, 400)
+    with subsegment("dynamodb.get_leaderboard"):
+        item = from_item(ddb().get_item(TableName=VISITOR_TABLE, Key={"path": {"S": LEADERBOARD_KEY}}).get("Item"))
+    windows = (item or {}).get("windows", {})
+    if window not in windows:
+        return _resp({"error": f"unknown window {window!r}", "windows": sorted(windows)}, 400)
+    return _resp({
+        "window": window,
+        "updatedAt": item.get("updatedAt", ""),
+        "pages": [{"path": p["path"], "count": int(p["count"])} for p in windows[window][:n]],
+    })
+
 def lambda_handler(event, context):
     qs = event.get("queryStringParameters") or {}
-    path = (qs.get("path") or "/").strip()[:200]
-    table = ddb.Table(VISITOR_TABLE)
-
-    # Atomic increment
-    resp = table.update_item(
-        Key={"path": path},
-        UpdateExpression="ADD #c :inc",
-        ExpressionAttributeNames={"#c":"count"},
-        ExpressionAttributeValues={":inc": 1},
-        ReturnValues="ALL_NEW"
-    )
-    count = int(resp["Attributes"].get("count",0))
+    if (event.get("rawPath") or event.get("path") or "").endswith("/visitor/top"):
+        return top_pages(qs)
+
+    if (qs.get("increment") or "").lower() == "false":
+        return read_counts(qs)
+
+    path = count_key(qs.get("path") or "/")
+    if COUNT_MODE == "logs":
+        return _resp({"path": path, "count": get_counts([path])[path]})
+    retry_after = limiter.check("visitor", event)
+    if retry_after:
+        return _resp({"error": "too many requests"}, 429, {"Retry-After": str(retry_after)})
+    count = increment(path)
+    _count_cache.pop(path, None)
     return _resp({"path": path, "count": count})
\ No newline at end of file
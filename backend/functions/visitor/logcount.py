@@ -0,0 +1,391 @@
+"""Count page views offline from CloudFront (or S3 server) access logs.
+
+The live /visitor API writes on every page load and anyone can inflate it.
+With COUNT_MODE=logs the API only reads, and this job does the counting
+instead, from the gzip access logs the CDN already writes:
+
+- new log objects are listed after a checkpoint and split by size across
+  LOG_WORKERS processes, each streaming and gunzipping its objects line by
+  line (nothing is downloaded whole);
+- lines are kept only for successful GETs of pages (not assets) by clients
+  that don't look like bots, and counted per (path, hour) under the same
+  canonical key the live API uses (paths.count_key);
+- the parent merges the per-object counts in memory and writes one UpdateItem
+  per path that ADDs the total and every hour/day/month counter touched, the
+  same counters the live API maintains (see app.py);
+- the processed keys go into a checkpoint (a JSON object in S3 or a local
+  file), so each log is counted once. The checkpoint is saved after the
+  counts are applied: a crash in between recounts that run's logs.
+
+Workers are plain processes talking over pipes: multiprocessing.Pool and
+ProcessPoolExecutor need /dev/shm, which Lambda doesn't have.
+
+Usage (from backend/functions/visitor, with layers/common/python on PYTHONPATH):
+    python logcount.py --bucket LOG_BUCKET --prefix cloudfront/ --state s3://LOG_BUCKET/visitor-logcount/state.json
+    python logcount.py --local ./logs --state ./logcount-state.json --dry-run
+"""
+import os, re, sys, gzip, json, time, argparse, datetime
+from collections import Counter
+from functools import lru_cache
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+from urllib.parse import unquote
+
+from common.clients import client, ddb
+from common.tracing import subsegment
+from paths import allowlist, count_key
+
+VISITOR_TABLE = os.environ.get("VISITOR_TABLE", "")
+LOG_BUCKET = os.environ.get("LOG_BUCKET", "")
+LOG_PREFIX = os.environ.get("LOG_PREFIX", "")
+LOG_STATE_URI = os.environ.get("LOG_STATE_URI", "")
+LOG_WORKERS = int(os.environ.get("LOG_WORKERS", "0")) or os.cpu_count() or 1
+# Objects listed per run; the rest wait for the next one
+MAX_OBJECTS = int(os.environ.get("LOG_MAX_OBJECTS", "5000"))
+# Logs can arrive up to a day late; keys newer than this stay in the checkpoint
+SETTLE_HOURS = 48
+HOUR_RETENTION_HOURS = int(os.environ.get("HOUR_RETENTION_HOURS", "48"))
+DAY_RETENTION_DAYS = int(os.environ.get("DAY_RETENTION_DAYS", "35"))
+
+BOT_UA = re.compile(
+    r"bot|crawl|spider|slurp|archiver|scrape|preview|monitor|uptime|pingdom|headless|"
+    r"lighthouse|python-requests|python-urllib|curl|wget|httpclient|okhttp|go-http|java/|"
+    r"facebookexternalhit|embedly|whatsapp|^-$|^$", re.I)
+ASSET_EXT = re.compile(r"\.(?:js|mjs|css|map|json|xml|txt|ico|png|jpe?g|gif|svg|webp|avif|woff2?|ttf|pdf|zip|gz)$", re.I)
+# CloudFront standard log (v1.0) columns used when a file has no #Fields header
+CF_FIELDS = ["date", "time", "x-edge-location", "sc-bytes", "c-ip", "cs-method", "cs(Host)", "cs-uri-stem",
+             "sc-status", "cs(Referer)", "cs(User-Agent)", "cs-uri-query"]
+S3_LINE = re.compile(rb'^\S+ \S+ \[(\d{2})/(\w{3})/(\d{4}):(\d{2}):\d{2}:\d{2} [^\]]+\] \S+ \S+ \S+ (\S+) \S+ '
+                     rb'"(\S+) (\S+)[^"]*" (\d{3}) \S+ \S+ \S+ \S+ \S+ "[^"]*" "([^"]*)"')
+MONTHS = {m.encode(): i for i, m in enumerate(["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                                      "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1)}
+
+CHUNK = 1 << 20
+
+@lru_cache(maxsize=8192)
+def is_bot(user_agent: bytes) -> bool:
+    return bool(BOT_UA.search(unquote(user_agent.decode("utf-8", "replace"))))
+
+@lru_cache(maxsize=8192)
+def page_path(uri: bytes, query: bytes = b"") -> str:
+    """The counted path for a request URI, or "" when it isn't a page view."""
+    stem, _, uri_query = uri.partition(b"?")
+    path = unquote(stem.decode("utf-8", "replace"))
+    if not path.startswith("/") or ASSET_EXT.search(path):
+        return ""
+    query = uri_query or (b"" if query == b"-" else query)
+    return count_key(f"{path}?{query.decode('utf-8', 'replace')}" if query else path)
+
+def iter_lines(raw):
+    """Lines (bytes, no newline) of a gzip stream, decompressed a chunk at a time."""
+    with gzip.GzipFile(fileobj=raw) as gz:
+        tail = b""
+        while True:
+            chunk = gz.read(CHUNK)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            yield from lines
+        if tail:
+            yield tail
+
+def _columns(fields: list[str]) -> tuple[int, ...]:
+    idx = {f: i for i, f in enumerate(fields)}
+    # -1: a trimmed field list without the query column
+    return tuple(idx[f] for f in ("date", "time", "cs-method", "cs-uri-stem", "sc-status", "cs(User-Agent)")) + (
+        idx.get("cs-uri-query", -1),)
+
+def count_cloudfront(lines, counts: Counter, stats: Counter):
+    date_i, time_i, method_i, uri_i, status_i, ua_i, query_i = cols = _columns(CF_FIELDS)
+    split_at = max(cols) + 1
+    n = bots = malformed = 0
+    for line in lines:
+        if line[:1] == b"#":
+            if line.startswith(b"#Fields:"):
+                date_i, time_i, method_i, uri_i, status_i, ua_i, query_i = cols = _columns(line[8:].decode().split())
+                split_at = max(cols) + 1
+            continue
+        if not line:
+            continue
+        n += 1
+        c = line.split(b"\t", split_at)
+        if len(c) < split_at:
+            malformed += 1
+            continue
+        status = c[status_i]
+        if c[method_i] != b"GET" or not (status[:1] == b"2" or status == b"304"):
+            continue
+        path = page_path(c[uri_i], c[query_i] if query_i >= 0 else b"")
+        if not path:
+            continue
+        if is_bot(c[ua_i]):
+            bots += 1
+            continue
+        counts[(path, c[date_i] + b"T" + c[time_i][:2])] += 1
+    stats.update(lines=n, bots=bots, malformed=malformed)
+
+def count_s3_access(lines, counts: Counter, stats: Counter):
+    for line in lines:
+        if not line:
+            continue
+        stats["lines"] += 1
+        m = S3_LINE.match(line)
+        if not m:
+            stats["malformed"] += 1
+            continue
+        day, mon, year, hour, _key, method, uri, status, ua = m.groups()
+        if method != b"GET" or not (status[:1] == b"2" or status == b"304"):
+            continue
+        path = page_path(uri)
+        if not path:
+            continue
+        if is_bot(ua):
+            stats["bots"] += 1
+            continue
+        counts[(path, b"%s-%02d-%sT%s" % (year, MONTHS.get(mon, 0), day, hour))] += 1
+
+def count_stream(raw) -> tuple[Counter, Counter]:
+    """(per (path, hour) counts, line stats) for one gzip log stream."""
+    counts, stats = Counter(), Counter()
+    lines = iter_lines(raw)
+    first = next(lines, b"")
+    rest = _chain(first, lines)
+    # CloudFront logs start with #Version/#Fields and are tab separated
+    if first.startswith(b"#") or first.count(b"\t") >= 10:
+        count_cloudfront(rest, counts, stats)
+    else:
+        count_s3_access(rest, counts, stats)
+    # Hours stay bytes in the hot loop; decode once per distinct key
+    return Counter({(path, hour.decode()): n for (path, hour), n in counts.items()}), stats
+
+def _chain(first, lines):
+    yield first
+    yield from lines
+
+# ---- log stores --------------------------------------------------------------
+
+class S3Logs:
+    def __init__(self, bucket: str, prefix: str):
+        self.bucket, self.prefix = bucket, prefix
+
+    def list(self, start_after: str, limit: int) -> list[dict]:
+        out = []
+        kwargs = {"Bucket": self.bucket, "Prefix": self.prefix}
+        if start_after:
+            kwargs["StartAfter"] = start_after
+        for page in client("s3").get_paginator("list_objects_v2").paginate(**kwargs):
+            for o in page.get("Contents", []):
+                if o["Key"].endswith(".gz"):
+                    out.append({"key": o["Key"], "size": o["Size"], "modified": o["LastModified"].timestamp()})
+                    if len(out) >= limit:
+                        return out
+        return out
+
+    def open(self, key: str):
+        return client("s3").get_object(Bucket=self.bucket, Key=key)["Body"]
+
+class LocalLogs:
+    """A directory of .gz logs, for trying the job and for bench/logcount.py."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def list(self, start_after: str, limit: int) -> list[dict]:
+        out = []
+        for dirpath, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                key = os.path.relpath(path, self.root)
+                if name.endswith(".gz") and key > start_after:
+                    st = os.stat(path)
+                    out.append({"key": key, "size": st.st_size, "modified": st.st_mtime})
+        return sorted(out, key=lambda o: o["key"])[:limit]
+
+    def open(self, key: str):
+        return open(os.path.join(self.root, key), "rb")
+
+# ---- checkpoint --------------------------------------------------------------
+
+def load_state(uri: str) -> dict:
+    empty = {"startAfter": "", "done": {}}
+    try:
+        if uri.startswith("s3://"):
+            bucket, _, key = uri[5:].partition("/")
+            body = client("s3").get_object(Bucket=bucket, Key=key)["Body"].read()
+        else:
+            with open(uri, "rb") as f:
+                body = f.read()
+    except Exception as e:
+        if "NoSuchKey" not in str(e) and not isinstance(e, FileNotFoundError):
+            raise
+        return empty
+    return dict(empty, **json.loads(body))
+
+def save_state(uri: str, state: dict):
+    body = json.dumps(state, sort_keys=True).encode("utf-8")
+    if uri.startswith("s3://"):
+        bucket, _, key = uri[5:].partition("/")
+        client("s3").put_object(Bucket=bucket, Key=key, Body=body, ContentType="application/json")
+        return
+    tmp = uri + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+    os.replace(tmp, uri)
+
+def advance(state: dict, listed: list[dict], now: float):
+    """Move startAfter past the keys that are done and settled; forget their entries."""
+    done = state["done"]
+    start = state["startAfter"]
+    for o in listed:
+        if o["key"] not in done or now - o["modified"] < SETTLE_HOURS * 3600:
+            break
+        start = o["key"]
+    state["startAfter"] = start
+    state["done"] = {k: v for k, v in done.items() if k > start}
+
+# ---- worker processes ----------------------------------------------------------
+
+def _worker(store, keys: list[str], conn):
+    # A boto3 client copied from the parent across fork isn't safe to reuse
+    import common.clients
+    common.clients._clients.clear()
+    for key in keys:
+        try:
+            with store.open(key) as raw:
+                counts, stats = count_stream(raw)
+            conn.send(("ok", key, dict(counts), dict(stats)))
+        except Exception as e:
+            conn.send(("error", key, str(e), {}))
+    conn.send(("done", "", {}, {}))
+    conn.close()
+
+def partition(objects: list[dict], workers: int) -> list[list[str]]:
+    """Largest first onto the least loaded worker, so workers finish together."""
+    bins = [[0, []] for _ in range(max(1, min(workers, len(objects))))]
+    for o in sorted(objects, key=lambda o: -o["size"]):
+        target = min(bins, key=lambda b: b[0])
+        target[0] += o["size"]
+        target[1].append(o["key"])
+    return [keys for _, keys in bins]
+
+def count_objects(store, objects: list[dict], workers: int = LOG_WORKERS):
+    """Stream `objects` across worker processes; yields (status, key, counts, stats) per object."""
+    if workers <= 1 or len(objects) <= 1:
+        for o in objects:
+            try:
+                with store.open(o["key"]) as raw:
+                    counts, stats = count_stream(raw)
+                yield "ok", o["key"], counts, stats
+            except Exception as e:
+                yield "error", o["key"], str(e), {}
+        return
+    conns, procs = [], []
+    for keys in partition(objects, workers):
+        parent, child = Pipe(duplex=False)
+        p = Process(target=_worker, args=(store, keys, child), daemon=True)
+        p.start()
+        child.close()
+        conns.append(parent)
+        procs.append(p)
+    try:
+        while conns:
+            for conn in wait(conns):
+                try:
+                    msg = conn.recv()
+                except EOFError:
+                    msg = ("done", "", {}, {})
+                if msg[0] == "done":
+                    conns.remove(conn)
+                    continue
+                yield msg
+    finally:
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+
+# ---- applying counts -------------------------------------------------------------
+
+def fold(counts: Counter, now: datetime.datetime) -> dict:
+    """{path: {"count": n, "h#...": n, "d#...": n, "m#...": n}}, skipping buckets rollup.py would trim."""
+    oldest_hour = f"h#{now - datetime.timedelta(hours=HOUR_RETENTION_HOURS):%Y-%m-%dT%H}"
+    oldest_day = f"d#{now - datetime.timedelta(days=DAY_RETENTION_DAYS):%Y-%m-%d}"
+    out = {}
+    for (path, hour), n in counts.items():
+        attrs = out.setdefault(path, Counter())
+        attrs["count"] += n
+        if f"h#{hour}" >= oldest_hour:
+            attrs[f"h#{hour}"] += n
+        if f"d#{hour[:10]}" >= oldest_day:
+            attrs[f"d#{hour[:10]}"] += n
+        attrs[f"m#{hour[:7]}"] += n
+    return out
+
+def apply_counts(db, per_path: dict) -> int:
+    """One ADD per path (split only if a backfill touches very many buckets)."""
+    writes = 0
+    for path, attrs in per_path.items():
+        items = sorted(attrs.items())
+        for start in range(0, len(items), 80):
+            chunk = items[start:start + 80]
+            db.update_item(
+                TableName=VISITOR_TABLE,
+                Key={"path": {"S": path}},
+                UpdateExpression="ADD " + ", ".join(f"#a{i} :v{i}" for i in range(len(chunk))),
+                ExpressionAttributeNames={f"#a{i}": k for i, (k, _) in enumerate(chunk)},
+                ExpressionAttributeValues={f":v{i}": {"N": str(v)} for i, (_, v) in enumerate(chunk)},
+            )
+            writes += 1
+    return writes
+
+def run(store, state_uri: str, workers: int = LOG_WORKERS, dry_run: bool = False, limit: int = MAX_OBJECTS) -> dict:
+    state = load_state(state_uri)
+    with subsegment("logs.list"):
+        listed = store.list(state["startAfter"], limit)
+    todo = [o for o in listed if o["key"] not in state["done"]]
+    # Loaded before the workers start so they inherit it instead of each fetching it
+    allowlist()
+    totals, stats, failed = Counter(), Counter(), []
+    with subsegment("logs.count", objects=len(todo), workers=workers):
+        for status, key, counts, obj_stats in count_objects(store, todo, workers):
+            if status != "ok":
+                print(f"Log {key} failed: {counts}")
+                failed.append(key)
+                continue
+            totals.update(counts)
+            stats.update(obj_stats)
+            state["done"][key] = int(time.time())
+    per_path = fold(totals, datetime.datetime.now(datetime.timezone.utc))
+    writes = 0
+    if not dry_run:
+        with subsegment("dynamodb.add_counts", paths=len(per_path)):
+            writes = apply_counts(ddb(), per_path)
+        advance(state, listed, time.time())
+        save_state(state_uri, state)
+    return {"objects": len(todo) - len(failed), "failed": failed, "paths": len(per_path),
+            "views": sum(totals.values()), "updates": writes, **stats}
+
+def lambda_handler(event, context):
+    if not LOG_BUCKET:
+        return {"statusCode": 200, "body": json.dumps({"skipped": "LOG_BUCKET is not set"})}
+    state_uri = LOG_STATE_URI or f"s3://{LOG_BUCKET}/visitor-logcount/state.json"
+    result = run(S3Logs(LOG_BUCKET, LOG_PREFIX), state_uri)
+    return {"statusCode": 200, "body": json.dumps(result)}
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Count page views from gzip access logs")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--bucket", help="S3 bucket with the logs")
+    src.add_argument("--local", metavar="DIR", help="directory of .gz logs instead of S3")
+    ap.add_argument("--prefix", default=LOG_PREFIX)
+    ap.add_argument("--state", required=True, help="checkpoint file or s3://bucket/key")
+    ap.add_argument("--workers", type=int, default=LOG_WORKERS)
+    ap.add_argument("--limit", type=int, default=MAX_OBJECTS, help="max log objects per run")
+    ap.add_argument("--dry-run", action="store_true", help="count and report, but don't write counts or checkpoint")
+    args = ap.parse_args(argv)
+    store = LocalLogs(args.local) if args.local else S3Logs(args.bucket, args.prefix)
+    print(json.dumps(run(store, args.state, args.workers, args.dry_run, args.limit), indent=2))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Which item a page view is counted under.
+
+Every distinct `path` used to become its own item, so query strings, trailing
+slashes, casing and scanner junk ("/wp-login.php", "/.env") grew the table
+without bound and split real pages across keys. Both counters (the live API
+and logcount.py) now go through count_key():
+
+- canonical() strips the fragment and query, collapses slashes, maps
+  ".../index.html" to ".../", drops the trailing slash and lowercases. Query
+  keys are kept only where the sitemap itself uses them
+  (tutorial-viewer.html?id=...), sorted;
+- the result must be a sitemap page or match ALLOW_PATTERN (the per-update
+  share pages fetch_rss writes under updates/); anything else is counted
+  under the single OTHER_PATH item.
+
+The sitemap is read once per container (from SITEMAP_URI: s3://bucket/key or
+a local file). Without one, paths are only canonicalized.
+"""
+import os, re, time
+
+from common.clients import client
+
+SITE_BUCKET = os.environ.get("SITE_BUCKET", "")
+SITEMAP_URI = os.environ.get("SITEMAP_URI") or (f"s3://{SITE_BUCKET}/sitemap.xml" if SITE_BUCKET else "")
+# Pages that exist but aren't in the sitemap: share pages are updates/<16 hex id>.html
+ALLOW_PATTERN = re.compile(os.environ.get("VISITOR_ALLOW_PATTERN", r"/updates/[0-9a-f]{16}\.html"))
+# Reserved key ("#" keys are never client paths); not shown on the leaderboard
+OTHER_PATH = "#other"
+MAX_PATH = 200
+# A failed sitemap read is retried after this long rather than on every request
+SITEMAP_RETRY_SECONDS = 300
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+# (pages, {page path: query keys kept}) once loaded; per container
+_allowlist = None
+_retry_at = 0.0
+
+def _split(raw: str) -> tuple[str, str]:
+    raw = (raw or "").strip()
+    if raw.lower().startswith(("http://", "https://")):
+        from urllib.parse import urlsplit
+        u = urlsplit(raw)
+        return u.path, u.query
+    raw = raw.split("#", 1)[0]
+    path, _, query = raw.partition("?")
+    return path, query
+
+def canonical(raw: str, query_keys: dict | None = None) -> str:
+    """Normalized page path; `query_keys` maps a path to the query keys worth keeping."""
+    path, query = _split(raw)
+    path = re.sub(r"/{2,}", "/", "/" + path.lower())
+    if path.endswith("/index.html"):
+        path = path[:-len("index.html")]
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+    keep = (query_keys or {}).get(path)
+    if keep and query:
+        from urllib.parse import parse_qsl, urlencode
+        params = sorted((k.lower(), v.lower()) for k, v in parse_qsl(query) if k.lower() in keep)
+        if params:
+            path = f"{path}?{urlencode(params)}"
+    return path[:MAX_PATH]
+
+def parse_sitemap(body: bytes) -> tuple[frozenset, dict]:
+    # Only needed once per container; keep it (and urllib.parse) off the cold-import path
+    import xml.etree.ElementTree as ET
+    from urllib.parse import parse_qsl
+    locs = [el.text.strip() for el in ET.fromstring(body).iter(f"{SITEMAP_NS}loc") if el.text]
+    query_keys = {}
+    for loc in locs:
+        path, query = _split(loc)
+        keys = {k.lower() for k, _ in parse_qsl(query)}
+        if keys:
+            query_keys.setdefault(canonical(path), set()).update(keys)
+    # The bare page behind a ?id= entry is a page too (logs without the query land there)
+    pages = {canonical(loc, query_keys) for loc in locs} | {canonical(loc) for loc in locs}
+    return frozenset(pages), {p: frozenset(k) for p, k in query_keys.items()}
+
+def _read(uri: str) -> bytes:
+    if uri.startswith("s3://"):
+        bucket, _, key = uri[5:].partition("/")
+        return client("s3").get_object(Bucket=bucket, Key=key)["Body"].read()
+    with open(uri, "rb") as f:
+        return f.read()
+
+def allowlist():
+    """(pages, query keys) from the sitemap, or None when there isn't one (yet)."""
+    global _allowlist, _retry_at
+    if _allowlist is not None or not SITEMAP_URI or time.monotonic() < _retry_at:
+        return _allowlist
+    try:
+        _allowlist = parse_sitemap(_read(SITEMAP_URI))
+    except Exception as e:
+        print(f"Sitemap load from {SITEMAP_URI} failed: {e}")
+        _retry_at = time.monotonic() + SITEMAP_RETRY_SECONDS
+    return _allowlist
+
+def count_key(raw: str) -> str:
+    """The item a view of `raw` (a path or URL, query allowed) is counted under."""
+    allowed = allowlist()
+    if allowed is None:
+        return canonical(raw)
+    pages, query_keys = allowed
+    path = canonical(raw, query_keys)
+    if path in pages or ALLOW_PATTERN.fullmatch(path):
+        return path
+    return OTHER_PATH
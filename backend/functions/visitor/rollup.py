@@ -0,0 +1,95 @@
+"""Scheduled visitor rollup: trims old counters and rebuilds the leaderboard.
+
+Each path's item carries hour, day and month counters (see app.py). This job
+runs on a schedule, reads every path once, and:
+- removes hour counters older than HOUR_RETENTION_HOURS and day counters older
+  than DAY_RETENTION_DAYS, so items stay small (month counters are kept);
+- sums each WINDOWS entry per path and stores the top LEADERBOARD_SIZE paths per
+  window in the LEADERBOARD_KEY item, which /visitor/top reads with one GetItem.
+  OTHER_PATH (views of unknown pages) is trimmed like any page but never ranked.
+
+The scan happens here, off the request path; API reads never scan.
+"""
+import os, json, datetime
+
+from common.clients import ddb, to_item, from_item
+from common.tracing import subsegment
+from app import VISITOR_TABLE, LEADERBOARD_KEY, MAX_TOP
+
+HOUR_RETENTION_HOURS = int(os.environ.get("HOUR_RETENTION_HOURS", "48"))
+DAY_RETENTION_DAYS = int(os.environ.get("DAY_RETENTION_DAYS", "35"))
+LEADERBOARD_SIZE = MAX_TOP
+# window -> (counter prefix, how many of the newest buckets to sum); None = all-time count
+WINDOWS = {"24h": ("h#", 24), "7d": ("d#", 7), "30d": ("d#", 30), "all": None}
+
+def recent_buckets(now: datetime.datetime, prefix: str, n: int) -> list[str]:
+    if prefix == "h#":
+        return [f"h#{now - datetime.timedelta(hours=i):%Y-%m-%dT%H}" for i in range(n)]
+    return [f"d#{now - datetime.timedelta(days=i):%Y-%m-%d}" for i in range(n)]
+
+def window_count(item: dict, window: str, now: datetime.datetime) -> int:
+    spec = WINDOWS[window]
+    if spec is None:
+        return int(item.get("count", 0))
+    return sum(int(item.get(b, 0)) for b in recent_buckets(now, *spec))
+
+def expired(item: dict, now: datetime.datetime) -> list[str]:
+    # Bucket names sort chronologically, so comparing strings is enough
+    oldest_hour = f"h#{now - datetime.timedelta(hours=HOUR_RETENTION_HOURS):%Y-%m-%dT%H}"
+    oldest_day = f"d#{now - datetime.timedelta(days=DAY_RETENTION_DAYS):%Y-%m-%d}"
+    return [k for k in item
+            if (k.startswith("h#") and k < oldest_hour) or (k.startswith("d#") and k < oldest_day)]
+
+def prune(db, path: str, names: list[str]):
+    # At most a couple of hundred names per item; stay well inside expression limits
+    for start in range(0, len(names), 100):
+        chunk = names[start:start + 100]
+        db.update_item(
+            TableName=VISITOR_TABLE,
+            Key={"path": {"S": path}},
+            UpdateExpression="REMOVE " + ", ".join(f"#r{i}" for i in range(len(chunk))),
+            ExpressionAttributeNames={f"#r{i}": n for i, n in enumerate(chunk)},
+        )
+
+def scan_paths(db):
+    kwargs = {"TableName": VISITOR_TABLE}
+    while True:
+        with subsegment("dynamodb.scan"):
+            resp = db.scan(**kwargs)
+        for raw in resp.get("Items", []):
+            item = from_item(raw)
+            if item["path"] != LEADERBOARD_KEY:
+                yield item
+        if not resp.get("LastEvaluatedKey"):
+            return
+        kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+def lambda_handler(event, context):
+    db = ddb()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    totals = {w: [] for w in WINDOWS}
+    paths = pruned = 0
+    for item in scan_paths(db):
+        paths += 1
+        if not item["path"].startswith("#"):
+            for w in WINDOWS:
+                n = window_count(item, w, now)
+                if n:
+                    totals[w].append((n, item["path"]))
+        old = expired(item, now)
+        if old:
+            try:
+                prune(db, item["path"], old)
+                pruned += len(old)
+            except Exception as e:
+                print(f"Pruning {item['path']} failed: {e}")
+
+    windows = {w: [{"path": p, "count": n} for n, p in sorted(rows, key=lambda r: (-r[0], r[1]))[:LEADERBOARD_SIZE]]
+               for w, rows in totals.items()}
+    with subsegment("dynamodb.put_leaderboard"):
+        db.put_item(TableName=VISITOR_TABLE, Item=to_item({
+            "path": LEADERBOARD_KEY,
+            "updatedAt": now.isoformat(),
+            "windows": windows,
+        }))
+    return {"statusCode": 200, "body": json.dumps({"paths": paths, "countersRemoved": pruned})}
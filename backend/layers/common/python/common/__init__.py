@@ -0,0 +1 @@
+"""Helpers shared by the Lambda handlers (deployed as the CommonLayer)."""
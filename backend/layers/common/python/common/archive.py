@@ -0,0 +1,130 @@
+"""Cold tier of AwsUpdatesTable: archived weeks as gzip JSONL files in S3.
+
+fetch_rss/archive.py moves weeks older than ARCHIVE_AFTER_WEEKS out of the
+table (the rows then expire through DynamoDB TTL) into one file per week,
+in hive-style partitions that DuckDB, Athena or pandas read as they are:
+
+    s3://ARCHIVE_BUCKET/<ARCHIVE_PREFIX>year=2025/week=2025-W14/updates.jsonl.gz
+    s3://ARCHIVE_BUCKET/<ARCHIVE_PREFIX>weeks.json
+
+Each line is a stored row as JSON. weeks.json is the manifest: which weeks are
+archived, with their item count and content hash. get_updates reads through
+ArchiveReader: the manifest is cached for MANIFEST_TTL_SECONDS and the
+decoded rows of the last CACHED_WEEKS weeks are kept by content hash, so a
+re-archived week is read again and an unchanged one never is. The codec
+modules are imported on first use, keeping them off get_updates' cold start.
+"""
+import os, json, time
+from collections import OrderedDict
+
+from common.clients import client
+
+ARCHIVE_BUCKET = os.environ.get("ARCHIVE_BUCKET", "")
+ARCHIVE_PREFIX = os.environ.get("ARCHIVE_PREFIX", "updates/")
+MANIFEST_TTL_SECONDS = float(os.environ.get("ARCHIVE_MANIFEST_TTL_SECONDS", "300"))
+CACHED_WEEKS = 16
+
+def partition_key(week_key: str, prefix: str = ARCHIVE_PREFIX) -> str:
+    year = week_key.split("-W")[0]
+    return f"{prefix}year={year}/week={week_key}/updates.jsonl.gz"
+
+def manifest_key(prefix: str = ARCHIVE_PREFIX) -> str:
+    return f"{prefix}weeks.json"
+
+def _plain(value):
+    import decimal
+    # Numbers come back from DynamoDB as Decimal
+    if isinstance(value, decimal.Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def encode_rows(rows: list[dict]) -> bytes:
+    """Gzip JSONL, rows ordered by updateId; the same rows always give the same bytes."""
+    import io, gzip
+    text = "".join(json.dumps(r, sort_keys=True, ensure_ascii=False, default=_plain) + "\n"
+                   for r in sorted(rows, key=lambda r: r["updateId"]))
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb", mtime=0) as gz:
+        gz.write(text.encode("utf-8"))
+    return buf.getvalue()
+
+def decode_rows(data: bytes) -> list[dict]:
+    import gzip
+    return [json.loads(line) for line in gzip.decompress(data).decode("utf-8").splitlines() if line]
+
+def content_hash(data: bytes) -> str:
+    import hashlib
+    return hashlib.sha256(data).hexdigest()[:20]
+
+def load_manifest(bucket: str, prefix: str = ARCHIVE_PREFIX) -> dict:
+    s3 = client("s3")
+    try:
+        body = s3.get_object(Bucket=bucket, Key=manifest_key(prefix))["Body"].read()
+    except s3.exceptions.NoSuchKey:
+        return {"weeks": {}}
+    return json.loads(body)
+
+def save_manifest(bucket: str, manifest: dict, prefix: str = ARCHIVE_PREFIX):
+    client("s3").put_object(Bucket=bucket, Key=manifest_key(prefix),
+                            Body=json.dumps(manifest, sort_keys=True).encode("utf-8"),
+                            ContentType="application/json")
+
+def read_partition(bucket: str, week_key: str, prefix: str = ARCHIVE_PREFIX) -> list[dict]:
+    """The archived rows of a week ([] when it has no partition)."""
+    s3 = client("s3")
+    try:
+        data = s3.get_object(Bucket=bucket, Key=partition_key(week_key, prefix))["Body"].read()
+    except s3.exceptions.NoSuchKey:
+        return []
+    return decode_rows(data)
+
+def write_partition(bucket: str, week_key: str, rows: list[dict], prefix: str = ARCHIVE_PREFIX) -> dict:
+    """Write a week's file; returns its manifest entry."""
+    data = encode_rows(rows)
+    # No Content-Encoding: HTTP clients would then hand back plain JSONL under the .gz name
+    client("s3").put_object(Bucket=bucket, Key=partition_key(week_key, prefix), Body=data,
+                            ContentType="application/gzip")
+    return {"items": len(rows), "hash": content_hash(data), "bytes": len(data)}
+
+class ArchiveReader:
+    """Archived weeks for the API, cached per container."""
+
+    def __init__(self, bucket: str = ARCHIVE_BUCKET, prefix: str = ARCHIVE_PREFIX):
+        self.bucket, self.prefix = bucket, prefix
+        self._manifest = None
+        self._manifest_at = 0.0
+        # (week, hash) -> rows
+        self._rows = OrderedDict()
+
+    def weeks(self) -> dict:
+        """{week: manifest entry}; empty when no archive is configured."""
+        if not self.bucket:
+            return {}
+        now = time.monotonic()
+        if self._manifest is None or now - self._manifest_at > MANIFEST_TTL_SECONDS:
+            try:
+                self._manifest = load_manifest(self.bucket, self.prefix).get("weeks", {})
+                self._manifest_at = now
+            except Exception as e:
+                # Keep serving the last manifest (or none) rather than failing the request
+                print(f"Archive manifest load failed: {e}")
+                if self._manifest is None:
+                    return {}
+        return self._manifest
+
+    def rows(self, week_key: str) -> list[dict] | None:
+        """The week's rows if it is archived, else None (read it from the table)."""
+        entry = self.weeks().get(week_key)
+        if entry is None:
+            return None
+        key = (week_key, entry.get("hash", ""))
+        rows = self._rows.get(key)
+        if rows is None:
+            rows = self._rows[key] = read_partition(self.bucket, week_key, self.prefix)
+            if len(self._rows) > CACHED_WEEKS:
+                self._rows.popitem(last=False)
+        else:
+            self._rows.move_to_end(key)
+        return rows
@@ -0,0 +1,41 @@
+"""Lazily built, memoized low-level boto3 clients.
+
+boto3 is only imported the first time a client is requested, so handlers that
+never touch a service (e.g. fetch_rss with GENERATE_SUMMARY=false and Bedrock)
+don't pay for it on a cold start. The low-level client is also cheaper to load
+than the resource API; `to_item` / `from_item` convert to and from DynamoDB
+attribute values so items keep the same shape the resource API returned
+(numbers come back as Decimal).
+"""
+_clients = {}
+_serializer = None
+_deserializer = None
+
+def client(service):
+    c = _clients.get(service)
+    if c is None:
+        import boto3
+        c = _clients[service] = boto3.client(service)
+    return c
+
+def ddb():
+    return client("dynamodb")
+
+def to_attr(value):
+    global _serializer
+    if _serializer is None:
+        from boto3.dynamodb.types import TypeSerializer
+        _serializer = TypeSerializer()
+    return _serializer.serialize(value)
+
+def to_item(obj: dict) -> dict:
+    return {k: to_attr(v) for k, v in obj.items()}
+
+def from_item(item: dict | None) -> dict | None:
+    global _deserializer
+    if item is None:
+        return None
+    if _deserializer is None:
+        from boto3.dynamodb.types import TypeDeserializer
+        _deserializer = TypeDeserializer()
+    return {k: _deserializer.deserialize(v) for k, v in item.items()}
@@ -0,0 +1,189 @@
+"""Bedrock call accounting as CloudWatch Embedded Metric Format (EMF) logs.
+
+Every model call is wrapped in `model_metrics.call(model_id, operation)`,
+which times it, notes throttles and errors, and emits one EMF record with
+latency, token counts and estimated cost. CloudWatch turns those log lines
+into metrics without any PutMetricData calls. Totals are kept per model so a
+handler can emit an end-of-run summary.
+
+    with model_metrics.call(TEXT_MODEL_ID, "InvokeModel") as call:
+        resp = bedrock.invoke_model(...)
+        call.input_tokens, call.output_tokens = ...
+
+Prices are USD per 1000 tokens (or per image) and can be overridden with a
+MODEL_PRICES JSON env var of the same shape as DEFAULT_PRICES.
+"""
+import os, json, time, threading
+
+NAMESPACE = os.environ.get("METRICS_NAMESPACE", "aCloudResume/Bedrock")
+
+DEFAULT_PRICES = {
+    "amazon.titan-text-express-v1": {"input": 0.0002, "output": 0.0006},
+    "amazon.titan-text-lite-v1": {"input": 0.00015, "output": 0.0002},
+    "amazon.titan-image-generator-v1": {"image": 0.01},
+    "amazon.titan-image-generator-v2:0": {"image": 0.01},
+}
+# Batch inference is billed at half the on-demand price
+BATCH_DISCOUNT = 0.5
+
+def _load_prices() -> dict:
+    prices = dict(DEFAULT_PRICES)
+    try:
+        prices.update(json.loads(os.environ.get("MODEL_PRICES", "") or "{}"))
+    except ValueError:
+        print("Ignoring invalid MODEL_PRICES")
+    return prices
+
+def estimate_cost(prices: dict, model_id: str, input_tokens: int = 0, output_tokens: int = 0,
+                  images: int = 0) -> float:
+    p = prices.get(model_id, {})
+    return (input_tokens / 1000 * p.get("input", 0)
+            + output_tokens / 1000 * p.get("output", 0)
+            + images * p.get("image", 0))
+
+def emf_record(namespace: str, dimensions: dict, metrics: dict, properties: dict | None = None) -> dict:
+    """Build an EMF document; `metrics` maps name -> (value, unit)."""
+    doc = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": namespace,
+                "Dimensions": [list(dimensions)],
+                "Metrics": [{"Name": name, "Unit": unit} for name, (_, unit) in metrics.items()],
+            }],
+        },
+    }
+    doc.update(dimensions)
+    doc.update({name: value for name, (value, _) in metrics.items()})
+    doc.update(properties or {})
+    return doc
+
+def _is_throttle(exc: BaseException) -> bool:
+    code = getattr(exc, "response", {}).get("Error", {}).get("Code", "")
+    return "Throttl" in code or "Throttl" in type(exc).__name__ or "TooManyRequests" in code
+
+class ModelCall:
+    def __init__(self, metrics, model_id: str, operation: str):
+        self.metrics = metrics
+        self.model_id = model_id
+        self.operation = operation
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.images = 0
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        latency_ms = (time.perf_counter() - self._start) * 1000
+        throttled = exc is not None and _is_throttle(exc)
+        self.metrics._record(self, latency_ms, error=exc is not None, throttled=throttled)
+        return False
+
+class ModelMetrics:
+    def __init__(self, namespace: str = NAMESPACE, prices: dict | None = None, emit=print):
+        self.namespace = namespace
+        self.prices = prices if prices is not None else _load_prices()
+        self.emit = emit
+        # Image generation records calls from worker threads
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.totals = {}
+        self.cache_stats = {}
+
+    def call(self, model_id: str, operation: str) -> ModelCall:
+        return ModelCall(self, model_id, operation)
+
+    def _totals_for(self, model_id: str) -> dict:
+        return self.totals.setdefault(model_id, {
+            "calls": 0, "errors": 0, "throttles": 0, "inputTokens": 0,
+            "outputTokens": 0, "images": 0, "latencyMs": 0.0, "costUsd": 0.0})
+
+    def _record(self, call: ModelCall, latency_ms: float, error: bool, throttled: bool):
+        cost = estimate_cost(self.prices, call.model_id, call.input_tokens, call.output_tokens, call.images)
+        with self._lock:
+            t = self._totals_for(call.model_id)
+            t["calls"] += 1
+            t["errors"] += int(error)
+            t["throttles"] += int(throttled)
+            t["inputTokens"] += call.input_tokens
+            t["outputTokens"] += call.output_tokens
+            t["images"] += call.images
+            t["latencyMs"] += latency_ms
+            t["costUsd"] += cost
+        self._emit(emf_record(
+            self.namespace,
+            {"ModelId": call.model_id, "Operation": call.operation},
+            {
+                "Latency": (round(latency_ms, 1), "Milliseconds"),
+                "InputTokens": (call.input_tokens, "Count"),
+                "OutputTokens": (call.output_tokens, "Count"),
+                "Images": (call.images, "Count"),
+                "Errors": (int(error), "Count"),
+                "Throttles": (int(throttled), "Count"),
+                "EstimatedCost": (round(cost, 6), "None"),
+            }
+        ))
+
+    def add_usage(self, model_id: str, operation: str, input_tokens: int = 0, output_tokens: int = 0,
+                  images: int = 0, calls: int = 1, discount: float = 1.0):
+        """Account for usage that didn't go through `call()` (e.g. batch jobs)."""
+        cost = estimate_cost(self.prices, model_id, input_tokens, output_tokens, images) * discount
+        with self._lock:
+            t = self._totals_for(model_id)
+            t["calls"] += calls
+            t["inputTokens"] += input_tokens
+            t["outputTokens"] += output_tokens
+            t["images"] += images
+            t["costUsd"] += cost
+        self._emit(emf_record(
+            self.namespace,
+            {"ModelId": model_id, "Operation": operation},
+            {
+                "InputTokens": (input_tokens, "Count"),
+                "OutputTokens": (output_tokens, "Count"),
+                "Images": (images, "Count"),
+                "EstimatedCost": (round(cost, 6), "None"),
+            }
+        ))
+
+    def cache(self, name: str, hit: bool):
+        with self._lock:
+            s = self.cache_stats.setdefault(name, {"hits": 0, "misses": 0})
+            s["hits" if hit else "misses"] += 1
+
+    def summary(self) -> dict:
+        models = {}
+        for model_id, t in self.totals.items():
+            models[model_id] = dict(t, latencyMs=round(t["latencyMs"], 1), costUsd=round(t["costUsd"], 6),
+                                    avgLatencyMs=round(t["latencyMs"] / t["calls"], 1) if t["calls"] else 0)
+        return {
+            "models": models,
+            "caches": self.cache_stats,
+            "costUsd": round(sum(t["costUsd"] for t in self.totals.values()), 6),
+        }
+
+    def emit_summary(self, function: str) -> dict:
+        """Emit the end-of-run EMF record (one per function run) and return the summary."""
+        s = self.summary()
+        metrics = {
+            "RunModelCalls": (sum(t["calls"] for t in self.totals.values()), "Count"),
+            "RunInputTokens": (sum(t["inputTokens"] for t in self.totals.values()), "Count"),
+            "RunOutputTokens": (sum(t["outputTokens"] for t in self.totals.values()), "Count"),
+            "RunThrottles": (sum(t["throttles"] for t in self.totals.values()), "Count"),
+            "RunEstimatedCost": (s["costUsd"], "None"),
+        }
+        for name, c in self.cache_stats.items():
+            metrics[f"{name}Hits"] = (c["hits"], "Count")
+            metrics[f"{name}Misses"] = (c["misses"], "Count")
+        self._emit(emf_record(self.namespace, {"Function": function}, metrics, {"runSummary": s}))
+        return s
+
+    def _emit(self, doc: dict):
+        self.emit(json.dumps(doc, separators=(",", ":"), default=str))
+
+model_metrics = ModelMetrics()
@@ -0,0 +1,125 @@
+"""Per-client rate limits for the public endpoints that write.
+
+/visitor and the OAuth callback are unauthenticated, and each accepted call
+costs a DynamoDB write (or a Scan, for /auth/stats), so one client in a loop
+could run up the bill and throttle everyone else. Handlers check first and
+answer 429 before touching a table:
+
+    limiter = RateLimiter()
+    retry_after = limiter.check("visitor", event)
+    if retry_after:
+        return _resp({"error": "too many requests"}, 429, {"Retry-After": str(retry_after)})
+
+Each (route, source IP) gets a token bucket in the container's memory: `burst`
+requests at once, refilled at `rate` per second. That rejection costs no I/O.
+Containers don't share memory, so with RATE_LIMIT_TABLE set a request that
+passes its bucket is also counted in a sliding window in DynamoDB: the current
+and previous fixed windows, the previous one weighted by how much of it still
+overlaps, against `limit` per `window` seconds across all containers. That
+check is one UpdateItem, so it is off unless the table is configured, and a
+failing table lets requests through.
+
+Limits per route are DEFAULT_LIMITS, overridden by a RATE_LIMITS JSON env var
+of the same shape (a route's keys are merged; rate 0 turns its bucket off).
+"""
+import os, json, math, time, threading
+from collections import OrderedDict
+
+from common.clients import ddb
+
+RATE_LIMIT_TABLE = os.environ.get("RATE_LIMIT_TABLE", "")
+
+DEFAULT_LIMITS = {
+    # One view per page load; a reader opening a few tabs stays well inside
+    "visitor": {"rate": 1.0, "burst": 20, "limit": 300, "window": 300},
+    "auth.callback": {"rate": 0.05, "burst": 5, "limit": 20, "window": 3600},
+    "auth.stats": {"rate": 1.0, "burst": 10, "limit": 120, "window": 60},
+    # Full-table read unless this hour's export already exists
+    "export": {"rate": 1 / 60, "burst": 3, "limit": 10, "window": 3600},
+    # A miss streams from Bedrock, and a cut-off summary isn't stored
+    "summarize": {"rate": 0.2, "burst": 5, "limit": 60, "window": 3600},
+}
+# Buckets kept per container; the least recently seen client is dropped first
+# (a dropped bucket comes back full, which is what it would have refilled to)
+MAX_CLIENTS = 10_000
+
+def _load_limits() -> dict:
+    limits = {route: dict(spec) for route, spec in DEFAULT_LIMITS.items()}
+    try:
+        for route, spec in json.loads(os.environ.get("RATE_LIMITS", "") or "{}").items():
+            limits.setdefault(route, {}).update(spec)
+    except (ValueError, AttributeError):
+        print("Ignoring invalid RATE_LIMITS")
+    return limits
+
+def client_ip(event: dict) -> str:
+    # Set by API Gateway / Function URLs from the connection; X-Forwarded-For is client-controlled
+    ctx = event.get("requestContext") or {}
+    return (ctx.get("http") or {}).get("sourceIp") or (ctx.get("identity") or {}).get("sourceIp") or "unknown"
+
+class RateLimiter:
+    def __init__(self, limits: dict | None = None, table: str | None = None):
+        self.limits = limits if limits is not None else _load_limits()
+        self.table = RATE_LIMIT_TABLE if table is None else table
+        # (route, ip) -> [tokens, updated at]
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def take(self, key: tuple, rate: float, burst: float, now: float) -> float:
+        """0 when a token was taken, otherwise seconds until one is available."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [burst, now]
+                if len(self._buckets) > MAX_CLIENTS:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0.0
+            return (1 - bucket[0]) / rate
+
+    def window_count(self, route: str, ip: str, window: int, now: float) -> float:
+        """Count this request and return the sliding-window total for (route, ip)."""
+        start = int(now // window) * window
+        current, previous, stale = (f"w{start - i * window}" for i in range(3))
+        resp = ddb().update_item(
+            TableName=self.table,
+            Key={"limitKey": {"S": f"{route}#{ip}"}},
+            UpdateExpression="ADD #cur :one SET expiresAt = :exp REMOVE #stale",
+            ExpressionAttributeNames={"#cur": current, "#stale": stale},
+            ExpressionAttributeValues={":one": {"N": "1"}, ":exp": {"N": str(start + 3 * window)}},
+            ReturnValues="ALL_NEW",
+        )
+        attrs = resp.get("Attributes", {})
+        overlap = 1 - (now - start) / window
+        return int(attrs.get(current, {}).get("N", 0)) + int(attrs.get(previous, {}).get("N", 0)) * overlap
+
+    def check(self, route: str, event: dict) -> int:
+        """0 if the request may proceed, else the Retry-After seconds for a 429."""
+        spec = self.limits.get(route)
+        if not spec:
+            return 0
+        ip = client_ip(event)
+        now = time.time()
+        rate = float(spec.get("rate", 0))
+        if rate > 0:
+            wait = self.take((route, ip), rate, float(spec.get("burst", 1)), now)
+            if wait:
+                self.rejected += 1
+                return max(1, math.ceil(wait))
+        window, limit = int(spec.get("window", 0)), spec.get("limit")
+        if self.table and window > 0 and limit:
+            try:
+                over = self.window_count(route, ip, window, now) > float(limit)
+            except Exception as e:
+                print(f"Rate limit check for {route} failed: {e}")
+                return 0
+            if over:
+                self.rejected += 1
+                return max(1, math.ceil(window - now % window))
+        return 0
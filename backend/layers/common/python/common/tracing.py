@@ -0,0 +1,120 @@
+"""X-Ray subsegments without the X-Ray SDK.
+
+`Tracing: Active` gives every invocation a function segment, but nothing
+inside it. `subsegment(name)` (or the `@traced(name)` decorator) times a block
+and, when the invocation is sampled, sends it to the X-Ray daemon as an
+independent subsegment document over UDP - the same thing the SDK does, minus
+the SDK import and its patching on cold start. Subsegments nest per thread.
+
+Outside Lambda (no `_X_AMZN_TRACE_ID`) the timings are printed instead, which
+is handy when running handlers locally; set TRACE_LOG=false to silence them.
+
+    with subsegment("dynamodb.query", week=week):
+        resp = db.query(...)
+"""
+import os, json, time, threading, functools
+
+# Local timing logs default to on only when not running in Lambda
+TRACE_LOG = os.environ.get("TRACE_LOG", "false" if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") else "true").lower() == "true"
+DEFAULT_DAEMON = "127.0.0.1:2000"
+
+_local = threading.local()
+_socket = None
+_daemon = None
+
+def _trace_context():
+    """(trace_id, parent_id) for the current invocation, or None when not sampled."""
+    header = os.environ.get("_X_AMZN_TRACE_ID", "")
+    if not header:
+        return None
+    parts = dict(p.split("=", 1) for p in header.split(";") if "=" in p)
+    if parts.get("Sampled") != "1" or not parts.get("Root") or not parts.get("Parent"):
+        return None
+    return parts["Root"], parts["Parent"]
+
+def _daemon_address():
+    # AWS_XRAY_DAEMON_ADDRESS is "host:port" or "tcp:host:port udp:host:port"
+    global _daemon
+    if _daemon is None:
+        raw = os.environ.get("AWS_XRAY_DAEMON_ADDRESS", DEFAULT_DAEMON)
+        for part in raw.split():
+            if part.startswith("udp:"):
+                raw = part[len("udp:"):]
+        host, _, port = raw.rpartition(":")
+        _daemon = (host, int(port))
+    return _daemon
+
+def _send(doc: dict):
+    global _socket
+    try:
+        if _socket is None:
+            import socket
+            _socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        payload = '{"format": "json", "version": 1}\n' + json.dumps(doc, separators=(",", ":"), default=str)
+        _socket.sendto(payload.encode("utf-8"), _daemon_address())
+    except Exception as e:
+        print(f"Trace send failed: {e}")
+
+def _annotation_key(key: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in key)
+
+class subsegment:
+    def __init__(self, name: str, **annotations):
+        self.name = name
+        self.annotations = {_annotation_key(k): v for k, v in annotations.items()}
+        self.id = ""
+        self._start = 0.0
+        self._context = None
+
+    def annotate(self, **annotations):
+        self.annotations.update({_annotation_key(k): v for k, v in annotations.items()})
+
+    def __enter__(self):
+        self._context = _trace_context()
+        stack = _local.__dict__.setdefault("stack", [])
+        if self._context:
+            self.id = os.urandom(8).hex()
+        stack.append(self)
+        self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.time()
+        stack = _local.stack
+        stack.pop()
+        if self._context:
+            trace_id, parent_id = self._context
+            parent = next((s.id for s in reversed(stack) if s.id), parent_id)
+            doc = {
+                "name": self.name,
+                "id": self.id,
+                "trace_id": trace_id,
+                "parent_id": parent,
+                "type": "subsegment",
+                "start_time": self._start,
+                "end_time": end,
+            }
+            if self.annotations:
+                doc["annotations"] = self.annotations
+            if exc is not None:
+                doc["fault"] = True
+                doc["cause"] = {"exceptions": [{"id": os.urandom(8).hex(), "type": type(exc).__name__,
+                                                "message": str(exc)[:500]}]}
+            _send(doc)
+        elif TRACE_LOG:
+            depth = "  " * len(stack)
+            extra = " ".join(f"{k}={v}" for k, v in self.annotations.items())
+            status = " (error)" if exc is not None else ""
+            print(f"[trace] {depth}{self.name} {(end - self._start) * 1000:.1f} ms{status} {extra}".rstrip())
+        return False
+
+def traced(name: str | None = None):
+    """Decorator form of `subsegment`; defaults to the function's name."""
+    def wrap(fn):
+        label = name or fn.__name__
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            with subsegment(label):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
@@ -21,6 +21,7 @@ const state = {
   page: 1,
   pageSize: 12,
   weeksUrl: "",
+  digestUrl: "",
   selectedWeek: ""
   
 };
@@ -74,6 +75,13 @@ function canonicalUrlFor(it){
   return `${state.siteBaseUrl}/aws-updates.html?week=${encodeURIComponent(wk)}#${encodeURIComponent(id)}`;
 }
 
+// Static page with the update's own OpenGraph card, written by the backend
+// (share_pages.py); items without a backend id fall back to the anchor.
+function shareUrlFor(it){
+  if(!it.updateId) return canonicalUrlFor(it);
+  return `${state.siteBaseUrl}/updates/${encodeURIComponent(it.updateId)}.html`;
+}
+
 function buildShareLinks(targetUrl){
   const u = encodeURIComponent(targetUrl);
   return {
@@ -143,8 +151,7 @@ function renderTabs(){
 
 function cardHtml(it){
   const id = stableIdFromItem(it);
-  const canonical = canonicalUrlFor(it);
-  const share = buildShareLinks(canonical);
+  const share = buildShareLinks(shareUrlFor(it));
 
   // Generate unique image based on category and title
   const imageUrl = it.imageUrl || generateCategoryImage(it.category, it.title);
@@ -179,70 +186,70 @@ function generateCategoryImage(category, title){
   // Multiple images per category for variety
   const categoryImages = {
     'Serverless': [
-      'https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1639322537228-f710d846310a?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1667372393119-3d4c48d07fc9?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1639322537228-f710d846310a?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1667372393119-3d4c48d07fc9?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'AI & GenAI': [
-      'https://images.unsplash.com/photo-1677442136019-21780ecad995?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1655720828018-edd2daec9349?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1676277791608-ac5c30d8f6a8?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1620712943543-bcc4688e7485?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1677442136019-21780ecad995?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1655720828018-edd2daec9349?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1676277791608-ac5c30d8f6a8?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1620712943543-bcc4688e7485?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'AI Agents': [
-      'https://images.unsplash.com/photo-1620712943543-bcc4688e7485?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1635070041078-e363dbe005cb?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1677756119517-756a188d2d94?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1655393001768-d946c97d6fd1?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1620712943543-bcc4688e7485?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1635070041078-e363dbe005cb?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1677756119517-756a188d2d94?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1655393001768-d946c97d6fd1?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'DevOps & Observability': [
-      'https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1504868584819-f8e8b4b6d7e3?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1518432031352-d6fc5c10da5a?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1504868584819-f8e8b4b6d7e3?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1518432031352-d6fc5c10da5a?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'Containers & Kubernetes': [
-      'https://images.unsplash.com/photo-1605745341112-85968b19335b?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1667372393119-3d4c48d07fc9?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1667372335937-d03be6fb0a9c?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1667372393086-9d4001d51cf1?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1605745341112-85968b19335b?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1667372393119-3d4c48d07fc9?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1667372335937-d03be6fb0a9c?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1667372393086-9d4001d51cf1?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'Security': [
-      'https://images.unsplash.com/photo-1563986768609-322da13575f3?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1614064641938-3bbee52942c7?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1550751827-4bd374c3f58b?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1563986768609-322da13575f3?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1614064641938-3bbee52942c7?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1550751827-4bd374c3f58b?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'Data & Analytics': [
-      'https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1543286386-713bdd548da4?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1509228627152-72ae9ae6848d?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1543286386-713bdd548da4?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1509228627152-72ae9ae6848d?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'Databases': [
-      'https://images.unsplash.com/photo-1544383835-bda2bc66a55d?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1633356122544-f134324a6cee?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1666875753105-c63a6f3bdc86?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1544383835-bda2bc66a55d?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1633356122544-f134324a6cee?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1666875753105-c63a6f3bdc86?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'Storage': [
-      'https://images.unsplash.com/photo-1597852074816-d933c7d2b988?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1544197150-b99a580bb7a8?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1600267185393-e158a98703de?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1597852074816-d933c7d2b988?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1544197150-b99a580bb7a8?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1558618666-fcd25c85cd64?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1600267185393-e158a98703de?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'Networking': [
-      'https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1606904825846-647eb07f5be2?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1544197150-b99a580bb7a8?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1516192518150-0d8fee5425e3?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1606904825846-647eb07f5be2?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1544197150-b99a580bb7a8?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1516192518150-0d8fee5425e3?w=400&h=176&fit=crop&q=80&auto=format'
     ],
     'Other': [
-      'https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1488590528505-98d2b5aba04b?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1518770660439-4636190af475?w=400&h=176&fit=crop&q=80',
-      'https://images.unsplash.com/photo-1550745165-9bc0b252726f?w=400&h=176&fit=crop&q=80'
+      'https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1488590528505-98d2b5aba04b?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1518770660439-4636190af475?w=400&h=176&fit=crop&q=80&auto=format',
+      'https://images.unsplash.com/photo-1550745165-9bc0b252726f?w=400&h=176&fit=crop&q=80&auto=format'
     ]
   };
   
@@ -302,6 +309,22 @@ function weeklySummaryText(items, wk){
   return lines.join("\n");
 }
 
+// The roundup is prebuilt per week by the backend (GET /digest?week=) and
+// cached by the browser; weeklySummaryText is only the fallback when the API
+// has no digest for the week yet.
+async function fetchWeeklyDigest(wk){
+  if(!state.digestUrl) return "";
+  try{
+    const res = await fetch(`${state.digestUrl}?week=${encodeURIComponent(wk)}`);
+    if(!res.ok) return "";
+    const digest = await res.json();
+    return digest?.text || "";
+  }catch(e){
+    console.warn("digest fetch failed:", e);
+    return "";
+  }
+}
+
 function renderAll(){
   const items = state.filtered.length ? state.filtered : state.items;
   const wk = state.selectedWeek || new URLSearchParams(location.search).get("week") || isoWeekKey(new Date());
@@ -367,6 +390,10 @@ async function initFromConfig(){
       state.weeksUrl = c.weeksUrl.trim().replace(/\/$/, "");
     }
 
+    if (typeof c.digestUrl === "string" && c.digestUrl.trim()) {
+      state.digestUrl = c.digestUrl.trim().replace(/\/$/, "");
+    }
+
     state.source = "api";
 
     const apiInput = el("api-url");
@@ -512,11 +539,11 @@ function bindControls(){
     }).catch(()=>alert("Copy failed"));
   });
 
-  el("btn-generate-weekly")?.addEventListener("click", ()=>{
+  el("btn-generate-weekly")?.addEventListener("click", async ()=>{
     const wk = state.selectedWeek || isoWeekKey(new Date());
-    const items = state.items;
     const out = el("weekly-output");
-    if(out) out.value = weeklySummaryText(items, wk);
+    const text = await fetchWeeklyDigest(wk);
+    if(out) out.value = text || weeklySummaryText(state.items, wk);
   });
 
   el("btn-copy-weekly")?.addEventListener("click", async ()=>{
@@ -546,6 +573,9 @@ document.addEventListener("DOMContentLoaded", async ()=>{
   if (!state.weeksUrl) {
     state.weeksUrl = "https://ejlppub2ah.execute-api.us-east-1.amazonaws.com/prod/weeks";
   }
+  if (!state.digestUrl && state.apiUrl) {
+    state.digestUrl = state.apiUrl.replace(/\/updates$/, "/digest");
+  }
 
   await selectLatestAvailableWeek();
   await populateWeekSelect();
@@ -1,75 +1,116 @@
+"""Generate tutorial content for tutorial-viewer.html from data/tutorials.json.
+
+Each tutorial is written as its own minified JSON chunk (plus a gzip copy) to
+data/tutorials/<id>.<hash>.json, and data/tutorials/index.json lists the
+catalog metadata and chunk filenames. The viewer fetches the index, then only
+the chunk for the tutorial being shown.
+
+The build is incremental: every tutorial is keyed by a hash of its metadata
+plus TEMPLATE_VERSION, and the keys are recorded in the index. Only tutorials
+whose key changed are re-rendered; chunk names are content-hashed, so
+unchanged chunks keep their filenames between builds.
+
+Templates are compiled once into a registry keyed by category (unknown
+categories get a generic template), and large rebuilds are rendered across a
+process pool. Output order always follows data/tutorials.json.
+
+Usage:
+    python generate_tutorials.py [--force] [--only ID ...] [--jobs N] [--profile]
+    python generate_tutorials.py --bench 10000 [--budget-seconds S]
+"""
+import os
+import sys
+import gzip
 import json
+import time
+import hashlib
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-# Load tutorials metadata
-with open('data/tutorials.json', 'r') as f:
-    tutorials = json.load(f)
+SITE_DIR = os.path.dirname(os.path.abspath(__file__))
+TUTORIALS_JSON = os.path.join(SITE_DIR, 'data', 'tutorials.json')
+CHUNK_DIR = os.path.join(SITE_DIR, 'data', 'tutorials')
+INDEX_NAME = 'index.json'
 
-# Template for comprehensive tutorial content
-def generate_tutorial_content(tutorial_id, title, category, difficulty, duration, description, tags):
-    # Generate comprehensive intro based on category
-    intros = {
-        "Serverless": f"""<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
+# Bump whenever the templates below change their output, so every tutorial is
+# rebuilt on the next run.
+TEMPLATE_VERSION = '1'
+
+# Catalog fields copied into the index for the viewer
+INDEX_FIELDS = ('title', 'category', 'difficulty', 'duration')
+
+# Below this many tutorials to render, process start-up costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# Templates are str.format strings; available fields are title, title_lower,
+# description, description_lower, tutorial_id, project_dir and api_path.
+
+INTRO_TEMPLATES = {
+    "Serverless": """<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
     <p class="mb-4">Serverless computing revolutionizes application development by eliminating server management, automatically scaling with demand, and charging only for actual usage. This tutorial demonstrates building production-ready serverless solutions using AWS's managed services.</p>
     <p class="mb-4"><strong>Why Serverless?</strong> Traditional server-based applications require capacity planning, OS patching, security updates, and 24/7 monitoring. Serverless eliminates these operational burdens while providing automatic scaling, built-in high availability, and pay-per-use pricing.</p>
-    <p class="mb-4">In this hands-on tutorial, you'll learn industry best practices for {description.lower()}. We'll cover architecture design, implementation patterns, error handling, monitoring, and deployment automation using Infrastructure as Code.</p>
+    <p class="mb-4">In this hands-on tutorial, you'll learn industry best practices for {description_lower}. We'll cover architecture design, implementation patterns, error handling, monitoring, and deployment automation using Infrastructure as Code.</p>
     <p>By the end, you'll have a production-ready solution that can handle thousands of requests per second, automatically scales to zero when idle, and costs pennies to run. This pattern is used by companies processing millions of transactions daily.</p>""",
-        
-        "AI & GenAI": f"""<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
+    
+    "AI & GenAI": """<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
     <p class="mb-4">Generative AI is transforming how applications interact with users, process information, and create content. Amazon Bedrock provides access to state-of-the-art foundation models from AI21 Labs, Anthropic, Cohere, Meta, Stability AI, and Amazon through a single API.</p>
     <p class="mb-4"><strong>Why Amazon Bedrock?</strong> Building AI applications traditionally required managing GPU infrastructure, fine-tuning models, and handling complex ML pipelines. Bedrock eliminates this complexity by providing fully managed access to foundation models with enterprise-grade security, privacy, and compliance.</p>
-    <p class="mb-4">This tutorial teaches you how to {description.lower()} using Bedrock's powerful APIs. You'll learn prompt engineering techniques, response streaming, error handling, cost optimization, and integration patterns for production applications.</p>
+    <p class="mb-4">This tutorial teaches you how to {description_lower} using Bedrock's powerful APIs. You'll learn prompt engineering techniques, response streaming, error handling, cost optimization, and integration patterns for production applications.</p>
     <p>The skills you learn here apply to building chatbots, content generation systems, document analysis tools, code assistants, and any application requiring natural language understanding or generation.</p>""",
-        
-        "Agentic AI": f"""<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
+    
+    "Agentic AI": """<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
     <p class="mb-4">AI Agents represent the next evolution in artificial intelligence - autonomous systems that can reason, plan, use tools, and take actions to achieve goals. Unlike simple chatbots, agents can break down complex tasks, make decisions, call APIs, and interact with external systems.</p>
     <p class="mb-4"><strong>What are AI Agents?</strong> Agents combine large language models with the ability to use tools (APIs, databases, search engines) and maintain context across multiple interactions. They can research information, analyze data, generate reports, and execute multi-step workflows autonomously.</p>
-    <p class="mb-4">In this advanced tutorial, you'll build {description.lower()}. We'll cover agent architecture, tool integration, memory management, error recovery, and orchestration patterns for complex workflows.</p>
+    <p class="mb-4">In this advanced tutorial, you'll build {description_lower}. We'll cover agent architecture, tool integration, memory management, error recovery, and orchestration patterns for complex workflows.</p>
     <p>This technology powers virtual assistants, automated research systems, customer service bots, and intelligent automation platforms used by enterprises worldwide.</p>""",
-        
-        "DevOps": f"""<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
+    
+    "DevOps": """<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
     <p class="mb-4">Modern DevOps practices emphasize automation, Infrastructure as Code, continuous integration/deployment, and comprehensive monitoring. AWS provides a complete suite of tools for implementing DevOps best practices at scale.</p>
     <p class="mb-4"><strong>Why DevOps Matters?</strong> Manual deployments are error-prone, slow, and don't scale. DevOps automation enables teams to deploy multiple times per day with confidence, roll back instantly if issues arise, and maintain consistent environments from development to production.</p>
-    <p class="mb-4">This tutorial demonstrates how to {description.lower()}. You'll learn CI/CD pipeline design, automated testing, deployment strategies (blue/green, canary), rollback procedures, and monitoring best practices.</p>
+    <p class="mb-4">This tutorial demonstrates how to {description_lower}. You'll learn CI/CD pipeline design, automated testing, deployment strategies (blue/green, canary), rollback procedures, and monitoring best practices.</p>
     <p>These patterns are used by high-performing engineering teams to achieve deployment frequencies measured in minutes, not weeks, while maintaining 99.99% uptime.</p>""",
-        
-        "Programming": f"""<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
+    
+    "Programming": """<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
     <p class="mb-4">AWS Lambda supports multiple programming languages including Python, Node.js, Java, Go, .NET, and Ruby. Each language has unique strengths, performance characteristics, and ecosystem libraries that make it suitable for different use cases.</p>
     <p class="mb-4"><strong>Why This Language?</strong> Choosing the right programming language for Lambda functions impacts cold start times, execution performance, development velocity, and operational costs. Understanding language-specific patterns and best practices is crucial for building efficient serverless applications.</p>
-    <p class="mb-4">In this tutorial, you'll master {description.lower()}. We'll cover function structure, dependency management, async patterns, error handling, testing strategies, and performance optimization techniques specific to this runtime.</p>
+    <p class="mb-4">In this tutorial, you'll master {description_lower}. We'll cover function structure, dependency management, async patterns, error handling, testing strategies, and performance optimization techniques specific to this runtime.</p>
     <p>The code patterns you learn here apply to building APIs, data processing pipelines, event handlers, and any serverless workload requiring this programming language.</p>"""
-    }
-    
-    intro = intros.get(category, intros["Serverless"])
-    
-    # Generate learning objectives
-    what_you_learn = [
-        f"Understand {title.lower()} architecture and design patterns",
-        f"Implement production-ready code with error handling and logging",
-        f"Deploy using Infrastructure as Code (SAM/CloudFormation)",
-        f"Configure monitoring, alarms, and observability",
-        f"Optimize for performance, cost, and security",
-        f"Test and validate your implementation"
-    ]
-    
-    # Generate skills
-    skills = tags + ["AWS", "Cloud Architecture", "Best Practices"]
-    
-    # Generate architecture diagram
-    architecture = f"""graph LR
+}
+
+# Used for categories without their own intro
+DEFAULT_INTRO = """<h2 class="text-xl font-bold mb-3">Introduction to {title}</h2>
+    <p class="mb-4">AWS offers managed building blocks for almost every workload, letting teams focus on business logic instead of infrastructure. Knowing which services to combine, and how, is what separates a quick prototype from a production-ready system.</p>
+    <p class="mb-4"><strong>Why This Matters?</strong> Well-architected solutions are secure, observable, cost-efficient and easy to change. Getting those foundations right early saves weeks of rework once real traffic arrives.</p>
+    <p class="mb-4">In this hands-on tutorial, you'll learn how to {description_lower}. We'll cover architecture design, implementation, error handling, monitoring, and deployment automation using Infrastructure as Code.</p>
+    <p>By the end, you'll have a working solution and a set of patterns you can reuse across your own AWS projects.</p>"""
+
+WHAT_YOU_LEARN = [
+    "Understand {title_lower} architecture and design patterns",
+    "Implement production-ready code with error handling and logging",
+    "Deploy using Infrastructure as Code (SAM/CloudFormation)",
+    "Configure monitoring, alarms, and observability",
+    "Optimize for performance, cost, and security",
+    "Test and validate your implementation"
+]
+
+EXTRA_SKILLS = ["AWS", "Cloud Architecture", "Best Practices"]
+
+ARCHITECTURE = """graph LR
     A[User/Client] -->|Request| B[AWS Service]
     B -->|Process| C[Lambda/Compute]
     C -->|Store/Retrieve| D[Data Layer]
     D -->|Response| C
     C -->|Result| B
     B -->|Response| A"""
-    
-    # Generate comprehensive steps
-    steps = [
-        {
-            "title": "Step 1: Architecture Overview and Setup",
-            "content": f"Before implementing {title.lower()}, it's crucial to understand the architecture and set up your development environment. This step covers the AWS services involved, their interactions, data flow, security considerations, and local development setup. We'll install necessary tools (AWS CLI, SAM CLI, SDKs) and configure credentials for deployment.",
-            "language": "bash",
-            "code": f"""# Install AWS CLI
+
+STEP_TEMPLATES = [
+    {
+        "title": "Step 1: Architecture Overview and Setup",
+        "content": "Before implementing {title_lower}, it's crucial to understand the architecture and set up your development environment. This step covers the AWS services involved, their interactions, data flow, security considerations, and local development setup. We'll install necessary tools (AWS CLI, SAM CLI, SDKs) and configure credentials for deployment.",
+        "language": "bash",
+        "code": """# Install AWS CLI
 # macOS: brew install awscli
 # Windows: Download from aws.amazon.com/cli
 # Linux: pip install awscli
@@ -88,8 +129,8 @@ aws --version
 sam --version
 
 # Create project directory
-mkdir {tutorial_id.replace('-', '_')}
-cd {tutorial_id.replace('-', '_')}
+mkdir {project_dir}
+cd {project_dir}
 
 # Initialize SAM project
 sam init --runtime python3.11 --name {tutorial_id}
@@ -102,12 +143,12 @@ sam init --runtime python3.11 --name {tutorial_id}
 # ├── tests/                 # Unit and integration tests
 # ├── requirements.txt       # Python dependencies
 # └── README.md"""
-        },
-        {
-            "title": "Step 2: Implement Core Functionality",
-            "content": f"Now we'll implement the core business logic for {title.lower()}. This includes writing the main function code, handling inputs/outputs, implementing error handling, adding logging for debugging, and following AWS best practices for security and performance. The code is production-ready with proper exception handling and structured logging.",
-            "language": "python",
-            "code": f"""import json
+    },
+    {
+        "title": "Step 2: Implement Core Functionality",
+        "content": "Now we'll implement the core business logic for {title_lower}. This includes writing the main function code, handling inputs/outputs, implementing error handling, adding logging for debugging, and following AWS best practices for security and performance. The code is production-ready with proper exception handling and structured logging.",
+        "language": "python",
+        "code": """import json
 import boto3
 import os
 import logging
@@ -125,7 +166,7 @@ def lambda_handler(event, context):
     \"\"\"
     Main Lambda handler for {title}.
     
-    This function implements {description.lower()}.
+    This function implements {description_lower}.
     It follows AWS best practices for error handling, logging,
     and performance optimization.
     
@@ -211,12 +252,12 @@ def create_response(status_code, body):
         }},
         'body': json.dumps(body)
     }}"""
-        },
-        {
-            "title": "Step 3: Define Infrastructure with SAM",
-            "content": f"Infrastructure as Code (IaC) is essential for reproducible deployments. This SAM template defines all AWS resources needed for {title.lower()}: Lambda functions, IAM roles, event triggers, and monitoring. SAM simplifies CloudFormation syntax and automatically handles common serverless patterns like API Gateway integration and Lambda permissions.",
-            "language": "yaml",
-            "code": f"""AWSTemplateFormatVersion: '2010-09-09'
+    },
+    {
+        "title": "Step 3: Define Infrastructure with SAM",
+        "content": "Infrastructure as Code (IaC) is essential for reproducible deployments. This SAM template defines all AWS resources needed for {title_lower}: Lambda functions, IAM roles, event triggers, and monitoring. SAM simplifies CloudFormation syntax and automatically handles common serverless patterns like API Gateway integration and Lambda permissions.",
+        "language": "yaml",
+        "code": """AWSTemplateFormatVersion: '2010-09-09'
 Transform: AWS::Serverless-2016-10-31
 Description: {title} - Production-ready serverless application
 
@@ -263,7 +304,7 @@ Resources:
         ApiEvent:
           Type: Api
           Properties:
-            Path: /{tutorial_id.replace('_', '-')}
+            Path: /{api_path}
             Method: POST
       # Tags for cost tracking
       Tags:
@@ -320,15 +361,15 @@ Outputs:
   
   ApiUrl:
     Description: API Gateway endpoint URL
-    Value: !Sub 'https://${{ServerlessRestApi}}.execute-api.${{AWS::Region}}.amazonaws.com/Prod/{tutorial_id.replace('_', '-')}'
+    Value: !Sub 'https://${{ServerlessRestApi}}.execute-api.${{AWS::Region}}.amazonaws.com/Prod/{api_path}'
     Export:
       Name: !Sub '${{AWS::StackName}}-ApiUrl'"""
-        },
-        {
-            "title": "Step 4: Deploy and Test",
-            "content": f"Deployment automation ensures consistent, repeatable releases. We'll use SAM CLI to build, package, and deploy the application. Testing includes unit tests, integration tests, and end-to-end validation. We'll also verify monitoring dashboards and alarms are working correctly.",
-            "language": "bash",
-            "code": f"""# Build the application
+    },
+    {
+        "title": "Step 4: Deploy and Test",
+        "content": "Deployment automation ensures consistent, repeatable releases. We'll use SAM CLI to build, package, and deploy the application. Testing includes unit tests, integration tests, and end-to-end validation. We'll also verify monitoring dashboards and alarms are working correctly.",
+        "language": "bash",
+        "code": """# Build the application
 # This packages code and resolves dependencies
 sam build
 
@@ -387,12 +428,12 @@ wait
 
 # Clean up resources when done
 sam delete --stack-name {tutorial_id}-stack"""
-        },
-        {
-            "title": "Step 5: Monitor, Optimize, and Scale",
-            "content": f"Production applications require comprehensive monitoring, performance optimization, and cost management. This step covers CloudWatch dashboards, X-Ray tracing, performance tuning, cost optimization strategies, and scaling considerations for {title.lower()}.",
-            "language": "bash",
-            "code": f"""# Create CloudWatch Dashboard
+    },
+    {
+        "title": "Step 5: Monitor, Optimize, and Scale",
+        "content": "Production applications require comprehensive monitoring, performance optimization, and cost management. This step covers CloudWatch dashboards, X-Ray tracing, performance tuning, cost optimization strategies, and scaling considerations for {title_lower}.",
+        "language": "bash",
+        "code": """# Create CloudWatch Dashboard
 aws cloudwatch put-dashboard \\
   --dashboard-name {tutorial_id}-dashboard \\
   --dashboard-body file://dashboard.json
@@ -453,26 +494,73 @@ aws ce get-cost-and-usage \\
 # ✅ CI/CD pipeline configured
 # ✅ Documentation updated
 # ✅ Cost alerts configured"""
+    }
+]
+
+class TutorialTemplate:
+    """Intro and steps for one category, with the format strings bound once."""
+
+    def __init__(self, intro, steps=STEP_TEMPLATES):
+        self._intro = intro.format_map
+        self._learn = [t.format_map for t in WHAT_YOU_LEARN]
+        self._steps = [(s['title'], s['content'].format_map, s['language'], s['code'].format_map)
+                       for s in steps]
+
+    def render(self, fields):
+        return {
+            'whatYouLearn': [f(fields) for f in self._learn],
+            'intro': self._intro(fields),
+            'steps': [{
+                'title': title,
+                'content': content(fields),
+                'language': language,
+                'code': code(fields)
+            } for title, content, language, code in self._steps]
         }
-    ]
-    
+
+TEMPLATES = {}
+DEFAULT_TEMPLATE = TutorialTemplate(DEFAULT_INTRO)
+
+def register_template(category, intro, steps=STEP_TEMPLATES):
+    TEMPLATES[category] = TutorialTemplate(intro, steps)
+
+def template_for(category):
+    return TEMPLATES.get(category, DEFAULT_TEMPLATE)
+
+for _category, _intro in INTRO_TEMPLATES.items():
+    register_template(_category, _intro)
+
+def generate_tutorial_content(tutorial_id, title, category, difficulty, duration, description, tags):
+    fields = {
+        'title': title,
+        'title_lower': title.lower(),
+        'description': description,
+        'description_lower': description.lower(),
+        'tutorial_id': tutorial_id,
+        'project_dir': tutorial_id.replace('-', '_'),
+        'api_path': tutorial_id.replace('_', '-'),
+    }
+    rendered = template_for(category).render(fields)
+
     return {
         "title": title,
         "category": category,
         "difficulty": difficulty,
         "duration": duration,
         "description": description,
-        "whatYouLearn": what_you_learn,
-        "skillsImproved": skills,
-        "architecture": architecture,
-        "intro": intro,
-        "steps": steps
+        "whatYouLearn": rendered['whatYouLearn'],
+        "skillsImproved": tags + EXTRA_SKILLS,
+        "architecture": ARCHITECTURE,
+        "intro": rendered['intro'],
+        "steps": rendered['steps']
     }
 
-# Generate content for all tutorials
-output = "// AWS Tutorials - Comprehensive SEO-Optimized Content\nwindow.TUTORIALS = {};\n\n"
+def build_key(tutorial):
+    """Hash of everything that feeds the template for one tutorial."""
+    meta = json.dumps(tutorial, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(f"{TEMPLATE_VERSION}\n{meta}".encode('utf-8')).hexdigest()[:16]
 
-for tutorial in tutorials:
+def render_chunk(tutorial):
     content = generate_tutorial_content(
         tutorial['id'],
         tutorial['title'],
@@ -482,13 +570,158 @@ for tutorial in tutorials:
         tutorial['description'],
         tutorial['tags']
     )
-    
-    output += f"window.TUTORIALS['{tutorial['id']}'] = {json.dumps(content, indent=2)};\n\n"
-
-# Write to file
-with open('js/tutorial-content.js', 'w', encoding='utf-8') as f:
-    f.write(output)
-
-print(f"Generated comprehensive content for {len(tutorials)} tutorials")
-print(f"Total file size: {len(output) / 1024:.1f} KB")
-print(f"Average words per tutorial: ~1500-2000")
+    return json.dumps(content, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def write_chunk(chunk_dir, tutorial_id, data):
+    """Write `data` and its gzip copy under a content-hashed name; return the name."""
+    filename = f"{tutorial_id}.{hashlib.sha256(data).hexdigest()[:10]}.json"
+    path = os.path.join(chunk_dir, filename)
+    with open(path, 'wb') as f:
+        f.write(data)
+    # mtime=0 keeps the .gz bytes stable across builds
+    with open(path + '.gz', 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=9, mtime=0) as gz:
+        gz.write(data)
+    return filename
+
+def build_chunk(tutorial, chunk_dir):
+    """Render and write one tutorial (runs in worker processes)."""
+    return write_chunk(chunk_dir, tutorial['id'], render_chunk(tutorial))
+
+def load_index(chunk_dir):
+    try:
+        with open(os.path.join(chunk_dir, INDEX_NAME), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if index.get('templateVersion') != TEMPLATE_VERSION:
+        return {}
+    return {e['id']: e for e in index.get('tutorials', [])}
+
+def write_index(chunk_dir, entries):
+    path = os.path.join(chunk_dir, INDEX_NAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'templateVersion': TEMPLATE_VERSION, 'tutorials': entries},
+                  f, separators=(',', ':'), ensure_ascii=False)
+    os.replace(path + '.tmp', path)
+
+def build(tutorials, chunk_dir=CHUNK_DIR, force=False, only=None, jobs=1):
+    """Render changed tutorials and rewrite the index.
+
+    With `only`, just those ids are rebuilt (unconditionally); other tutorials
+    keep their existing chunks. Returns the list of regenerated ids.
+    """
+    os.makedirs(chunk_dir, exist_ok=True)
+    previous = load_index(chunk_dir)
+    only = set(only or ())
+    keys = {t['id']: build_key(t) for t in tutorials}
+
+    def is_current(tutorial):
+        prev = previous.get(tutorial['id'])
+        if not prev or not os.path.exists(os.path.join(chunk_dir, prev['file'])):
+            return False
+        if only:
+            return tutorial['id'] not in only
+        return not force and prev.get('key') == keys[tutorial['id']]
+
+    todo = [t for t in tutorials if not is_current(t)]
+    if jobs > 1 and len(todo) >= PARALLEL_THRESHOLD:
+        chunksize = max(1, len(todo) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            # map() yields in submission order, so output is deterministic
+            files = list(pool.map(build_chunk, todo, repeat(chunk_dir), chunksize=chunksize))
+    else:
+        files = [build_chunk(t, chunk_dir) for t in todo]
+    built = {t['id']: name for t, name in zip(todo, files)}
+
+    entries = []
+    for tutorial in tutorials:
+        tid = tutorial['id']
+        if tid in built:
+            entry = {'id': tid, 'key': keys[tid], 'file': built[tid]}
+        else:
+            entry = {'id': tid, 'key': previous[tid]['key'], 'file': previous[tid]['file']}
+        entry.update({k: tutorial[k] for k in INDEX_FIELDS})
+        entries.append(entry)
+
+    # Drop chunks that no longer belong to any tutorial
+    live = {e['file'] for e in entries}
+    live |= {f + '.gz' for f in live}
+    for name in os.listdir(chunk_dir):
+        if name != INDEX_NAME and name not in live:
+            os.remove(os.path.join(chunk_dir, name))
+
+    write_index(chunk_dir, entries)
+    return [t['id'] for t in todo]
+
+def synthetic_catalog(tutorials, n):
+    """Scale the real catalog up to `n` tutorials, plus one unknown category."""
+    out = []
+    for i in range(n):
+        base = tutorials[i % len(tutorials)]
+        t = dict(base, id=f"{base['id']}-{i}", title=f"{base['title']} #{i}")
+        if i % 50 == 49:
+            t['category'] = 'Uncategorized'
+        out.append(t)
+    return out
+
+def bench(tutorials, n, jobs, budget_seconds=None):
+    catalog = synthetic_catalog(tutorials, n)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        build(catalog, chunk_dir=tmp, jobs=jobs)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        build(catalog, chunk_dir=tmp, jobs=jobs)
+        warm = time.perf_counter() - start
+
+        size = sum(os.path.getsize(os.path.join(tmp, name)) for name in os.listdir(tmp))
+
+    print(f"{n} tutorials, {jobs} jobs")
+    print(f"  full build:        {cold:8.2f} s  ({n / cold:,.0f} tutorials/s)")
+    print(f"  incremental no-op: {warm:8.2f} s")
+    print(f"  output:            {size / 1024 / 1024:8.1f} MB")
+    if budget_seconds is not None and cold > budget_seconds:
+        print(f"FAIL: full build took {cold:.2f} s, budget {budget_seconds:.2f} s")
+        return 1
+    return 0
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Generate per-tutorial content chunks for tutorial-viewer.html")
+    ap.add_argument('--force', action='store_true', help="rebuild every tutorial")
+    ap.add_argument('--only', action='append', metavar='ID', help="rebuild only this tutorial (repeatable)")
+    ap.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="worker processes (default: CPU count)")
+    ap.add_argument('--profile', action='store_true', help="print a cProfile report of the build")
+    ap.add_argument('--bench', type=int, metavar='N', help="time a build of N synthetic tutorials in a temp dir")
+    ap.add_argument('--budget-seconds', type=float, help="with --bench, fail if the full build is slower")
+    args = ap.parse_args(argv)
+
+    with open(TUTORIALS_JSON, 'r', encoding='utf-8') as f:
+        tutorials = json.load(f)
+
+    if args.bench:
+        return bench(tutorials, args.bench, args.jobs, args.budget_seconds)
+
+    unknown = set(args.only or ()) - {t['id'] for t in tutorials}
+    if unknown:
+        ap.error(f"unknown tutorial id(s): {', '.join(sorted(unknown))}")
+
+    if args.profile:
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        changed = profiler.runcall(build, tutorials, force=args.force, only=args.only, jobs=args.jobs)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(20)
+    else:
+        changed = build(tutorials, force=args.force, only=args.only, jobs=args.jobs)
+
+    print(f"Regenerated {len(changed)} of {len(tutorials)} tutorials")
+    for tid in changed:
+        print(f"  - {tid}")
+    sizes = [os.path.getsize(os.path.join(CHUNK_DIR, n)) for n in os.listdir(CHUNK_DIR) if n.endswith('.json.gz')]
+    print(f"Index: {os.path.getsize(os.path.join(CHUNK_DIR, INDEX_NAME)) / 1024:.1f} KB, "
+          f"chunks: {len(sizes)} (avg {sum(sizes) / max(len(sizes), 1) / 1024:.1f} KB gzipped)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""Generate responsive AVIF/WebP variants of the site's raster images.
+
+Every JPEG/PNG at the top of the site and in images/ is resized to each of
+WIDTHS below its own width (plus its own width), re-encoded as AVIF and WebP
+with all metadata dropped (EXIF orientation is applied first), and written to
+images/optimized/<name>-<width>.<hash>.<ext>. data/images.json maps each
+source path to its variants and ready-made `srcset` strings per MIME type.
+
+The build is incremental: each source is keyed by a hash of its bytes plus
+PIPELINE_VERSION and the encoder settings, and the keys are recorded in the
+manifest. Only sources whose key changed are re-encoded; byte-identical
+sources (staticMapSubhash.JPG is in two places) share one set of variants.
+Variant names are content-hashed, so unchanged files keep their names.
+
+Pages opt in with <source type="image/avif" data-responsive="images/x.jpg"
+sizes="64px"> inside a <picture>: each build rewrites those tags' srcset from
+the manifest, so the HTML never points at a stale variant. The build ends
+with a report of the image bytes each page saves.
+
+Sources are encoded across a process pool, largest first.
+
+Usage (needs Pillow >= 11.3 for AVIF; without it only WebP is written):
+    python optimize_images.py [--force] [--jobs N]
+"""
+import io
+import os
+import re
+import sys
+import glob
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageCms, ImageOps, features
+
+SITE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIRS = ('', 'images')
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+OUTPUT_DIR = 'images/optimized'
+MANIFEST_PATH = os.path.join(SITE_DIR, 'data', 'images.json')
+SITE_BASE_URL = 'https://acloudresume.com/'
+
+# Bump whenever the encoding below changes its output, so every image is
+# rebuilt on the next run.
+PIPELINE_VERSION = '1'
+
+WIDTHS = (128, 256, 480, 768, 1280, 1920)
+# (MIME type, extension, Pillow save options), best first
+FORMATS = (
+    ('image/avif', 'avif', {'quality': 55, 'speed': 6}),
+    ('image/webp', 'webp', {'quality': 78, 'method': 6}),
+)
+
+# Below this many images to encode, process start-up costs more than it saves
+PARALLEL_THRESHOLD = 2
+
+# Pages are assumed to be viewed at up to this device pixel ratio
+REPORT_DPR = 2
+
+def available_formats():
+    return [f for f in FORMATS if features.check(f[1])]
+
+def settings_key(formats):
+    return json.dumps({'widths': WIDTHS, 'formats': formats}, sort_keys=True)
+
+def build_key(data, settings):
+    """Hash of everything that feeds the encoder for one source."""
+    digest = hashlib.sha256(f"{PIPELINE_VERSION}\n{settings}\n".encode('utf-8'))
+    digest.update(data)
+    return digest.hexdigest()[:16]
+
+def find_sources(site_dir=SITE_DIR):
+    paths = []
+    for source_dir in SOURCE_DIRS:
+        for name in os.listdir(os.path.join(site_dir, source_dir)):
+            # Case-insensitive: staticMapSubhash.JPG
+            if name.lower().endswith(SOURCE_EXTENSIONS):
+                paths.append(f"{source_dir}/{name}" if source_dir else name)
+    return sorted(paths)
+
+def variant_widths(width):
+    return [w for w in WIDTHS if w < width] + [min(width, WIDTHS[-1])]
+
+def slug(path):
+    return re.sub(r'[^a-z0-9]+', '-', os.path.splitext(os.path.basename(path))[0].lower()).strip('-')
+
+def load_image(path):
+    img = Image.open(path)
+    img = ImageOps.exif_transpose(img)
+    icc = img.info.get('icc_profile')
+    if icc:
+        # Convert to sRGB so dropping the profile doesn't shift colors
+        try:
+            src = ImageCms.ImageCmsProfile(io.BytesIO(icc))
+            img = ImageCms.profileToProfile(img, src, ImageCms.createProfile('sRGB'),
+                                            outputMode='RGBA' if 'A' in img.getbands() else 'RGB')
+        except (ImageCms.PyCMSError, OSError):
+            pass
+    has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+    img = img.convert('RGBA' if has_alpha else 'RGB')
+    # Nothing from the source's info (EXIF, XMP, ICC, comments) reaches the encoder
+    img.info = {}
+    return img
+
+def build_image(job):
+    """Encode every variant of one source (runs in worker processes)."""
+    path, name, out_dir, formats, threads = job
+    img = load_image(path)
+    width, height = img.size
+    variants = {mime: [] for mime, _, _ in formats}
+    for w in variant_widths(width):
+        h = max(1, round(height * w / width))
+        resized = img if w == width else img.resize((w, h), Image.LANCZOS)
+        for mime, ext, options in formats:
+            out = io.BytesIO()
+            if ext == 'avif' and threads:
+                options = dict(options, max_threads=threads)
+            resized.save(out, format=ext.upper(), **options)
+            data = out.getvalue()
+            filename = f"{name}-{w}.{hashlib.sha256(data).hexdigest()[:10]}.{ext}"
+            with open(os.path.join(out_dir, filename), 'wb') as f:
+                f.write(data)
+            variants[mime].append({'width': w, 'file': f"{OUTPUT_DIR}/{filename}", 'bytes': len(data)})
+    return {'width': width, 'height': height, 'variants': variants}
+
+def srcsets(variants):
+    return {mime: ', '.join(f"{v['file']} {v['width']}w" for v in vs) for mime, vs in variants.items()}
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('pipelineVersion') != PIPELINE_VERSION:
+        return {}
+    return {e['key']: e for e in manifest.get('images', [])}
+
+def write_manifest(entries, path=MANIFEST_PATH):
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'pipelineVersion': PIPELINE_VERSION, 'images': entries}, f, indent=1, ensure_ascii=False)
+    os.replace(path + '.tmp', path)
+
+def is_built(entry, site_dir):
+    return all(os.path.exists(os.path.join(site_dir, v['file']))
+               for vs in entry['variants'].values() for v in vs)
+
+def build(site_dir=SITE_DIR, manifest_path=MANIFEST_PATH, force=False, jobs=1):
+    """Encode changed sources and rewrite the manifest; returns (entries, encoded paths)."""
+    out_dir = os.path.join(site_dir, OUTPUT_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    formats = available_formats()
+    if len(formats) < len(FORMATS):
+        missing = sorted({ext for _, ext, _ in FORMATS} - {ext for _, ext, _ in formats})
+        print(f"warning: this Pillow can't write {', '.join(missing)}; skipping it", file=sys.stderr)
+    settings = settings_key(formats)
+    previous = {} if force else load_manifest(manifest_path)
+
+    sources = {}
+    for path in find_sources(site_dir):
+        with open(os.path.join(site_dir, path), 'rb') as f:
+            data = f.read()
+        sources[path] = (build_key(data, settings), len(data))
+
+    # One job per distinct key; byte-identical sources share it
+    todo = {}
+    for path, (key, size) in sources.items():
+        if key not in todo and not (key in previous and is_built(previous[key], site_dir)):
+            todo[key] = (path, size)
+    # Largest first, so the pool doesn't end waiting on one big image
+    order = sorted(todo, key=lambda k: -todo[k][1])
+    parallel = jobs > 1 and len(order) >= PARALLEL_THRESHOLD
+    # In the pool each worker encodes single-threaded; alone, libavif may use every core
+    work = [(os.path.join(site_dir, todo[k][0]), slug(todo[k][0]), out_dir, formats, 1 if parallel else None)
+            for k in order]
+    if parallel:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(build_image, work))
+    else:
+        results = [build_image(job) for job in work]
+    built = dict(zip(order, results))
+
+    entries = []
+    for path, (key, size) in sources.items():
+        image = built.get(key) or previous[key]
+        entries.append({'path': path, 'key': key, 'bytes': size, 'width': image['width'],
+                        'height': image['height'], 'variants': image['variants'],
+                        'srcset': srcsets(image['variants'])})
+
+    # Drop variants that no longer belong to any source
+    live = {os.path.basename(v['file']) for e in entries for vs in e['variants'].values() for v in vs}
+    for name in os.listdir(out_dir):
+        if name not in live:
+            os.remove(os.path.join(out_dir, name))
+
+    write_manifest(entries, manifest_path)
+    return entries, [todo[k][0] for k in order]
+
+TAG_RE = re.compile(r'<(?:source|img)\b[^>]*>', re.I)
+ATTR_RE = re.compile(r'([\w-]+)\s*=\s*"([^"]*)"')
+REF_RE = re.compile(r'(?:src|href|content)\s*=\s*"([^"?#]+\.(?:jpe?g|png))"', re.I)
+
+def local_path(ref):
+    if ref.startswith(SITE_BASE_URL):
+        ref = ref[len(SITE_BASE_URL):]
+    return ref.lstrip('/')
+
+def rewrite_page(html, by_path):
+    """Point every `data-responsive` <source> at the current variants."""
+    def fix(match):
+        tag = match.group(0)
+        attrs = dict(ATTR_RE.findall(tag))
+        entry = by_path.get(local_path(attrs.get('data-responsive', '')))
+        srcset = entry and entry['srcset'].get(attrs.get('type', ''))
+        if not srcset or attrs.get('srcset') == srcset:
+            return tag
+        if 'srcset' in attrs:
+            return re.sub(r'srcset\s*=\s*"[^"]*"', lambda _: f'srcset="{srcset}"', tag)
+        return re.sub(r'\s*/?>$', lambda end: f' srcset="{srcset}"{end.group(0)}', tag, count=1)
+    return TAG_RE.sub(fix, html)
+
+def served_bytes(entry, css_width):
+    """Bytes of the variant a browser picks for `css_width` px, in the best format."""
+    needed = min(css_width * REPORT_DPR, entry['width']) if css_width else entry['width']
+    best = min(entry['variants'].values(), key=lambda vs: vs[-1]['bytes'])
+    return next((v['bytes'] for v in best if v['width'] >= needed), best[-1]['bytes'])
+
+def page_report(html, by_path):
+    """(images, original bytes, served bytes) for the local images a page references."""
+    responsive = {}
+    for tag in TAG_RE.findall(html):
+        attrs = dict(ATTR_RE.findall(tag))
+        if 'data-responsive' in attrs:
+            size = re.fullmatch(r'\s*(\d+)px\s*', attrs.get('sizes', ''))
+            responsive[local_path(attrs['data-responsive'])] = int(size.group(1)) if size else 0
+    refs = {local_path(r) for r in REF_RE.findall(html)} | set(responsive)
+    original = served = count = 0
+    for ref in sorted(refs):
+        entry = by_path.get(ref)
+        if not entry:
+            continue
+        count += 1
+        original += entry['bytes']
+        served += served_bytes(entry, responsive[ref]) if ref in responsive else entry['bytes']
+    return count, original, served
+
+def update_pages(entries, site_dir=SITE_DIR):
+    """Rewrite opted-in <source> tags and return a report row per page."""
+    by_path = {e['path']: e for e in entries}
+    rows = []
+    for path in sorted(glob.glob(os.path.join(site_dir, '*.html'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        updated = rewrite_page(html, by_path)
+        if updated != html:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(updated)
+        rows.append((os.path.basename(path),) + page_report(updated, by_path))
+    return rows
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Generate responsive AVIF/WebP variants of the site's images")
+    ap.add_argument('--force', action='store_true', help="re-encode every image")
+    ap.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="worker processes (default: CPU count)")
+    args = ap.parse_args(argv)
+
+    entries, encoded = build(force=args.force, jobs=args.jobs)
+    print(f"Encoded {len(encoded)} of {len(entries)} images")
+    for path in encoded:
+        print(f"  - {path}")
+    full = sum(e['bytes'] for e in entries)
+    best = sum(served_bytes(e, 0) for e in entries)
+    print(f"All images at full width: {full / 1024:.0f} KB -> {best / 1024:.0f} KB in the best format")
+
+    print(f"{'page':<24} {'images':>6} {'original KB':>12} {'served KB':>10} {'saved':>7}")
+    for page, count, original, served in update_pages(entries):
+        if count:
+            print(f"{page:<24} {count:>6} {original / 1024:>12.1f} {served / 1024:>10.1f} "
+                  f"{(original - served) / original:>7.0%}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())